@@ -0,0 +1,3 @@
+"""
+Standalone benchmarks for performance-sensitive code paths.
+"""
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""Parse-time benchmark for the web event extractor.
+
+Runs the single-pass extractor over every saved page in benchmarks/fixtures,
+both as saved and with the event list repeated to simulate a much larger
+page. If BeautifulSoup is installed, its tree build time for the same input
+is reported as a reference point. For the large page, streaming extraction
+(16 KiB chunks) is compared with the batch extractor on time to the first
+event and peak traced memory.
+
+    python -m benchmarks.bench_extraction [--repeat 200] [--runs 5]
+"""
+import argparse
+import glob
+import os
+import re
+import time
+import tracemalloc
+from src.service.event_extractor import extract_events, iter_extract_events
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+def enlarge(html: str, repeat: int) -> str:
+    # Repeat every <article> block so the page holds `repeat` times as many events
+    return re.sub(r"(<article\b.*?</article>)", lambda m: m.group(1) * repeat, html, flags=re.S)
+
+def best_time(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def streaming_profile(html: str, chunk_size: int = 16 * 1024):
+    """(seconds to first event, peak traced bytes) for streaming extraction"""
+    chunks = (html[i:i + chunk_size] for i in range(0, len(html), chunk_size))
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    for _ in iter_extract_events(chunks):
+        if first is None:
+            first = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, peak
+
+def batch_profile(html: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    extract_events(html)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200, help="event list multiplier for the large page")
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement, the best one is reported")
+    args = parser.parse_args()
+
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        BeautifulSoup = None
+
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            saved = f.read()
+        for label, html in (("saved", saved), (f"x{args.repeat}", enlarge(saved, args.repeat))):
+            events = extract_events(html)
+            elapsed = best_time(lambda: extract_events(html), args.runs)
+            line = (
+                f"{os.path.basename(path)} [{label}] {len(html) / 1024:.0f} KiB, {len(events)} events: "
+                f"extractor {elapsed * 1000:.2f} ms"
+            )
+            if BeautifulSoup is not None:
+                soup_elapsed = best_time(lambda: BeautifulSoup(html, "html.parser"), args.runs)
+                line += f", BeautifulSoup tree build alone {soup_elapsed * 1000:.2f} ms"
+            print(line)
+
+        large = enlarge(saved, args.repeat)
+        first, stream_peak = streaming_profile(large)
+        batch_elapsed, batch_peak = batch_profile(large)
+        print(
+            f"{os.path.basename(path)} [x{args.repeat}] first event: streaming {first * 1000:.2f} ms, "
+            f"batch {batch_elapsed * 1000:.2f} ms; peak memory (excluding the input): "
+            f"streaming {stream_peak / 1024:.0f} KiB, batch {batch_peak / 1024:.0f} KiB"
+        )
+
+if __name__ == "__main__":
+    main()
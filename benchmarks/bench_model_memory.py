@@ -0,0 +1,103 @@
+"""Memory footprint of the Event/User models against the old layout.
+
+Builds a synthetic catalog as JSON text, loads it back (so every username
+is a separate string copy, as when reading events.json) and measures with
+tracemalloc the memory the resulting model objects keep alive: the
+old plain dataclasses with lists of strings, and the current slotted models
+with interned usernames and symbol-id assignment arrays.
+
+    python -m benchmarks.bench_model_memory [--events 100000] [--users 5000] [--assignees 20]
+"""
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from dataclasses import dataclass
+from typing import List
+from src.model.event import Event
+from src.model.user import User
+
+@dataclass
+class DataclassEvent:
+    id: str
+    title: str
+    description: str
+    assigned_users: List[str]
+
+@dataclass
+class DataclassUser:
+    username: str
+    password: str
+    role: str
+    assigned_events: List[str]
+
+def make_catalog(events: int, users: int, assignees: int):
+    rng = random.Random(42)
+    usernames = [f"user{n:05d}" for n in range(users)]
+    event_data = [
+        {
+            'id': str(n),
+            'title': f"Event {n}",
+            'description': "Short description",
+            'assigned_users': rng.sample(usernames, min(assignees, users))
+        }
+        for n in range(1, events + 1)
+    ]
+    assignments = {}
+    for data in event_data:
+        for username in data['assigned_users']:
+            assignments.setdefault(username, []).append(data['id'])
+    user_data = {
+        username: {'password': 'x' * 60, 'role': 'user', 'assigned_events': assignments.get(username, [])}
+        for username in usernames
+    }
+    return json.dumps(event_data), json.dumps(user_data)
+
+def measure(build) -> int:
+    """Bytes still allocated once build() returns, i.e. what its result keeps alive"""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--assignees", type=int, default=20, help="users assigned to every event")
+    args = parser.parse_args()
+
+    events_json, users_json = make_catalog(args.events, args.users, args.assignees)
+    layouts = [
+        ("dataclass + lists of str", DataclassEvent, DataclassUser),
+        ("slotted + interned ids", Event, User),
+    ]
+    for label, event_class, user_class in layouts:
+        # Load from JSON text inside the measurement, like a repository does,
+        # so strings the models keep from the parse are counted too
+        def build_events():
+            return [
+                event_class(d['id'], d['title'], d['description'], d['assigned_users'])
+                for d in json.loads(events_json)
+            ]
+
+        def build_users():
+            return [
+                user_class(name, d['password'], d['role'], d['assigned_events'])
+                for name, d in json.loads(users_json).items()
+            ]
+
+        events_size = measure(build_events)
+        users_size = measure(build_users)
+        print(
+            f"{label}: events {events_size / 2 ** 20:.1f} MiB ({events_size / args.events:.0f} B/event), "
+            f"users {users_size / 2 ** 20:.1f} MiB ({users_size / args.users:.0f} B/user)"
+        )
+
+if __name__ == "__main__":
+    main()
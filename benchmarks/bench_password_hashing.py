@@ -0,0 +1,74 @@
+"""Login throughput at each password hashing cost.
+
+For every cost setting, a throwaway users.json is created in a temporary
+directory and the same login is checked over and over through UserService:
+once serially with the verified-credential cache off (every login pays the
+KDF), once through the worker pool, and once with the cache on (repeat
+logins). Pick the highest cost whose serial rate is still acceptable.
+
+    python -m benchmarks.bench_password_hashing [--logins 20] [--workers 4]
+"""
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import wait
+from src.repository.user_repository import UserRepository
+from src.service.password_hasher import PBKDF2_ALGORITHM, SCRYPT_ALGORITHM, PasswordHasher
+from src.service.user_service import UserService
+
+COSTS = [
+    (PBKDF2_ALGORITHM, {'iterations': 100000}),
+    (PBKDF2_ALGORITHM, {'iterations': 260000}),
+    (PBKDF2_ALGORITHM, {'iterations': 600000}),
+    (SCRYPT_ALGORITHM, {'scrypt_n': 2 ** 14}),
+    (SCRYPT_ALGORITHM, {'scrypt_n': 2 ** 15}),
+]
+
+def logins_per_second(service: UserService, logins: int, use_pool: bool = False) -> float:
+    start = time.perf_counter()
+    if use_pool:
+        futures = [service.authenticate_user_async("alice", "correct horse") for _ in range(logins)]
+        wait(futures)
+        assert all(future.result() for future in futures)
+    else:
+        for _ in range(logins):
+            assert service.authenticate_user("alice", "correct horse")
+    return logins / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=20, help="logins per measurement")
+    parser.add_argument("--workers", type=int, default=4, help="hashing worker threads for the pooled run")
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            for algorithm, params in COSTS:
+                hasher = PasswordHasher(algorithm, **params)
+                label = f"{algorithm} " + ", ".join(f"{key}={value}" for key, value in params.items())
+
+                uncached = UserService(UserRepository(flush_delay=0), hasher, session_ttl=0, hash_workers=args.workers)
+                if uncached.get_user("alice"):
+                    uncached.delete_user("alice")
+                uncached.register_user("alice", "correct horse")
+                serial = logins_per_second(uncached, args.logins)
+                pooled = logins_per_second(uncached, args.logins, use_pool=True)
+                uncached.shutdown()
+
+                cached = UserService(UserRepository(flush_delay=0), hasher, hash_workers=args.workers)
+                cached.authenticate_user("alice", "correct horse")
+                repeat = logins_per_second(cached, args.logins * 100)
+                cached.shutdown()
+
+                print(
+                    f"{label}: {1000 / serial:.1f} ms/login, {serial:.1f} logins/s serial, "
+                    f"{pooled:.1f} logins/s with {args.workers} workers, {repeat:.0f} logins/s cached"
+                )
+        finally:
+            os.chdir(cwd)
+
+if __name__ == "__main__":
+    main()
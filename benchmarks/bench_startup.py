@@ -0,0 +1,83 @@
+"""Import time of the application up to the login window.
+
+Imports src.main in fresh interpreters with `python -X importtime`, reports
+the median total and the modules that cost the most, and checks that the
+scraping stack and the screens past the login window are still deferred.
+Exits with status 1 when one of them is imported eagerly again, or when
+the median goes over --budget milliseconds, so it can guard builds.
+
+    python -m benchmarks.bench_startup [--runs 5] [--top 15] [--budget MS]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Must not be imported before the user opens a screen that needs them
+DEFERRED_MODULES = [
+    "requests",
+    "src.service.http_client",
+    "src.service.web_crawler",
+    "src.service.event_extractor",
+    "src.ui.event_ui",
+    "src.ui.user_ui",
+]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+def import_profile() -> Tuple[int, Dict[str, Tuple[int, int]]]:
+    """(microseconds in src.main, module -> (self, cumulative) microseconds) of one cold import"""
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        cwd=project_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    modules = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match is not None:
+            self_us, cumulative_us, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us))
+    # Interpreter startup (site and what it imports) is not ours to trim
+    return modules["src.main"][1], modules
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="modules to list by cumulative time")
+    parser.add_argument("--budget", type=float, default=None, help="fail above this median, in ms")
+    args = parser.parse_args()
+
+    totals: List[int] = []
+    modules: Dict[str, Tuple[int, int]] = {}
+    for _ in range(args.runs):
+        total, modules = import_profile()
+        totals.append(total)
+    median = statistics.median(totals) / 1000
+
+    print(f"import src.main: median {median:.1f} ms over {args.runs} runs "
+          f"(min {min(totals) / 1000:.1f}, max {max(totals) / 1000:.1f})")
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module (last run)")
+    ranked = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in ranked[:args.top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:8.1f}  {name}")
+
+    failed = False
+    eager = [name for name in DEFERRED_MODULES if name in modules]
+    if eager:
+        print("imported at startup but should be deferred: " + ", ".join(eager))
+        failed = True
+    if args.budget is not None and median > args.budget:
+        print(f"over budget: {median:.1f} ms > {args.budget:.1f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,119 @@
+import argparse
+import os
+from typing import Optional
 import customtkinter as ctk
 from src.repository.user_repository import UserRepository
 from src.repository.event_repository import EventRepository
+from src.service.password_hasher import PasswordHasher
 from src.service.user_service import UserService
+from src.service.event_import import IMPORT_FORMATS
 from src.service.event_service import EventService
 from src.ui.main_ui import MainUI
 
+# Storage backend: "json" keeps events.jsonl/users.json, "sqlite" uses SQLITE_DATABASE
+STORAGE_BACKEND = os.environ.get("EVENT_APP_STORAGE", "json")
+SQLITE_DATABASE = "events.db"
+
+# Write-behind settings: mutations are flushed together after FLUSH_DELAY
+# seconds, or as soon as FLUSH_MAX_PENDING of them are waiting
+FLUSH_DELAY = 1.0
+FLUSH_MAX_PENDING = 50
+
+# Web events fetched less than this many seconds ago are served from web_events.json
+WEB_EVENTS_CACHE_TTL = 15 * 60
+
+# Password hashing cost: "pbkdf2_sha256" (PASSWORD_HASH_ITERATIONS) or "scrypt".
+# Raising it is safe, stored hashes are upgraded on the next successful login
+PASSWORD_HASH_ALGORITHM = "pbkdf2_sha256"
+PASSWORD_HASH_ITERATIONS = 260000
+# A login repeated within this many seconds is not hashed again
+LOGIN_SESSION_TTL = 5 * 60
+
+# Rejected rows listed by the import command, the rest are only counted
+MAX_LISTED_IMPORT_ERRORS = 20
+
+def create_repositories():
+    if STORAGE_BACKEND == "sqlite":
+        from src.repository.sqlite_database import SQLiteDatabase, migrate_from_json
+        from src.repository.sqlite_event_repository import SQLiteEventRepository
+        from src.repository.sqlite_user_repository import SQLiteUserRepository
+
+        database = SQLiteDatabase(SQLITE_DATABASE)
+        # One-shot import of the JSON files the first time the database is used
+        legacy_files = ("events.jsonl", "events.json", "users.json")
+        if database.is_empty() and any(os.path.exists(path) for path in legacy_files):
+            migrate_from_json(database, EventRepository(flush_delay=0), UserRepository(flush_delay=0))
+        return SQLiteUserRepository(database), SQLiteEventRepository(database)
+
+    event_repository = EventRepository(flush_delay=FLUSH_DELAY, max_pending=FLUSH_MAX_PENDING)
+    user_repository = UserRepository(
+        flush_delay=FLUSH_DELAY,
+        max_pending=FLUSH_MAX_PENDING,
+        event_repository=event_repository
+    )
+    return user_repository, event_repository
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Event Management System")
+    commands = parser.add_subparsers(dest="command")
+    import_parser = commands.add_parser("import", help="bulk-import events from a CSV or JSON Lines file, without the UI")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--format", choices=IMPORT_FORMATS, help="file format (default: from the extension)")
+    return parser.parse_args()
+
+def run_import(event_service: EventService, path: str, file_format: Optional[str] = None) -> int:
+    def print_progress(rows: int, elapsed: float):
+        rate = rows / elapsed if elapsed else 0
+        print(f"\r{rows} rows read ({rate:.0f} rows/s)", end="", flush=True)
+
+    try:
+        report = event_service.import_events(path, file_format, on_progress=print_progress)
+    except (OSError, ValueError) as e:
+        # Unreadable file or unknown format, nothing was imported
+        print(f"Import failed: {e}")
+        return 1
+    print()
+    for line_number, reason in report.errors[:MAX_LISTED_IMPORT_ERRORS]:
+        print(f"line {line_number}: {reason}")
+    if len(report.errors) > MAX_LISTED_IMPORT_ERRORS:
+        print(f"... and {len(report.errors) - MAX_LISTED_IMPORT_ERRORS} more rejected rows")
+    print(report.summary())
+    return 1 if report.errors and not report.imported else 0
+
 def main():
+    args = parse_args()
+
     # Initialize repositories
-    user_repository = UserRepository()
-    event_repository = EventRepository()
-    
+    user_repository, event_repository = create_repositories()
+
     # Initialize services
-    user_service = UserService(user_repository)
-    event_service = EventService(event_repository, user_repository)
-    
+    event_service = EventService(event_repository, user_repository, web_cache_ttl=WEB_EVENTS_CACHE_TTL)
+    user_service = UserService(
+        user_repository,
+        password_hasher=PasswordHasher(PASSWORD_HASH_ALGORITHM, iterations=PASSWORD_HASH_ITERATIONS),
+        session_ttl=LOGIN_SESSION_TTL,
+        on_user_deleted=event_service.user_deleted
+    )
+
     # Create default admin user if no users exist
     if not user_repository.get_all_users():
         user_service.register_user('admin', 'admin123', 'admin')
-    
-    # Initialize and run UI
-    root = ctk.CTk()
-    app = MainUI(user_service, event_service)
-    app.run()
+
+    try:
+        # Headless bulk import
+        if args.command == "import":
+            return run_import(event_service, args.path, args.format)
+
+        # Initialize and run UI
+        root = ctk.CTk()
+        app = MainUI(user_service, event_service)
+        app.run()
+    finally:
+        event_service.shutdown()
+        user_service.shutdown()
+        # Flush anything still pending in the write-behind buffers
+        event_repository.close()
+        user_repository.close()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    raise SystemExit(main())
@@ -1,12 +1,59 @@
-from dataclasses import dataclass
-from typing import List
+import sys
+from array import array
+from typing import Iterable, List
+from src.model.symbol_table import USERNAMES
 
-@dataclass
 class Event:
-    id: str
-    title: str
-    description: str
-    assigned_users: List[str]
+    """An event; slotted, with assignees kept as username symbol ids.
+
+    `assigned_users` reads and writes plain lists of usernames, but what is
+    stored is an unsigned int array of USERNAMES ids (an empty tuple when
+    nobody is assigned), so large catalogs don't hold one string per
+    assignment.
+
+    `date` is an ISO date (YYYY-MM-DD) and `location` free text; both are
+    empty when unknown.
+    """
+    __slots__ = ('id', 'title', 'description', 'assigned_ids', 'date', 'location')
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        description: str,
+        assigned_users: Iterable[str],
+        date: str = "",
+        location: str = ""
+    ):
+        self.id = sys.intern(id)
+        self.title = title
+        self.description = description
+        self.assigned_users = assigned_users
+        self.date = date
+        self.location = location
+
+    @property
+    def assigned_users(self) -> List[str]:
+        return [USERNAMES.name_of(symbol) for symbol in self.assigned_ids]
+
+    @assigned_users.setter
+    def assigned_users(self, usernames: Iterable[str]):
+        symbols = [USERNAMES.id_of(username) for username in usernames]
+        self.assigned_ids = array('I', symbols) if symbols else ()
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.id, self.title, self.description, list(self.assigned_ids), self.date, self.location) == \
+            (other.id, other.title, other.description, list(other.assigned_ids), other.date, other.location)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Event(id={self.id!r}, title={self.title!r}, description={self.description!r}, "
+            f"assigned_users={self.assigned_users!r}, date={self.date!r}, location={self.location!r})"
+        )
 
     @classmethod
     def from_dict(cls, event_id: str, data: dict) -> 'Event':
@@ -14,12 +61,16 @@ class Event:
             id=event_id,
             title=data['title'],
             description=data['description'],
-            assigned_users=data.get('assigned_users', [])
+            assigned_users=data.get('assigned_users', []),
+            date=data.get('date', ''),
+            location=data.get('location', '')
         )
 
     def to_dict(self) -> dict:
         return {
             'title': self.title,
             'description': self.description,
-            'assigned_users': self.assigned_users
-        }
\ No newline at end of file
+            'assigned_users': self.assigned_users,
+            'date': self.date,
+            'location': self.location
+        }
@@ -0,0 +1,37 @@
+import sys
+import threading
+from typing import Dict, List
+
+class SymbolTable:
+    """Two-way mapping between strings and small integer ids.
+
+    Models store ids instead of repeating the same string in every record;
+    each string is kept once, interned. The table only grows, so an id stays
+    valid for the life of the process.
+    """
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.lock = threading.Lock()
+
+    def id_of(self, name: str) -> int:
+        symbol = self.ids.get(name)
+        if symbol is None:
+            with self.lock:
+                symbol = self.ids.get(name)
+                if symbol is None:
+                    name = sys.intern(name)
+                    symbol = len(self.names)
+                    self.names.append(name)
+                    self.ids[name] = symbol
+        return symbol
+
+    def name_of(self, symbol: int) -> str:
+        return self.names[symbol]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+# Usernames referenced by event assignments
+USERNAMES = SymbolTable()
@@ -1,12 +1,40 @@
-from dataclasses import dataclass
-from typing import List
+import sys
+from typing import Iterable, List
 
-@dataclass
 class User:
-    username: str
-    password: str
-    role: str
-    assigned_events: List[str]
+    """A user; slotted, with interned username, role and event ids.
+
+    `assigned_events` reads and writes plain lists but is stored as a tuple.
+    """
+    __slots__ = ('username', 'password', 'role', 'assigned_event_ids')
+
+    def __init__(self, username: str, password: str, role: str, assigned_events: Iterable[str]):
+        self.username = sys.intern(username)
+        self.password = password
+        self.role = sys.intern(role)
+        self.assigned_events = assigned_events
+
+    @property
+    def assigned_events(self) -> List[str]:
+        return list(self.assigned_event_ids)
+
+    @assigned_events.setter
+    def assigned_events(self, event_ids: Iterable[str]):
+        self.assigned_event_ids = tuple(sys.intern(event_id) for event_id in event_ids)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.username, self.password, self.role, self.assigned_event_ids) == \
+            (other.username, other.password, other.role, other.assigned_event_ids)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"User(username={self.username!r}, password={self.password!r}, role={self.role!r}, "
+            f"assigned_events={self.assigned_events!r})"
+        )
 
     @classmethod
     def from_dict(cls, username: str, data: dict) -> 'User':
@@ -22,4 +50,4 @@ class User:
             'password': self.password,
             'role': self.role,
             'assigned_events': self.assigned_events
-        } 
\ No newline at end of file
+        }
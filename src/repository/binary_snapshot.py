@@ -0,0 +1,206 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+MAGIC = b'EVAPSNAP'
+VERSION = 1
+FLAG_COMPRESSED = 1
+
+# magic, version, flags, record count, ref count, link count, source size,
+# source mtime_ns, then offsets of the key blob, ref blob, offset table,
+# link table, JSON metadata and the end of the file
+HEADER = struct.Struct('<8sHHIIIQqQQQQQQ')
+FIELD_LENGTH = struct.Struct('<I')
+BLOB_LENGTH = struct.Struct('<Q')
+
+# Text fields shorter than this are never worth a zlib stream
+COMPRESS_MIN_BYTES = 256
+
+# (size, mtime_ns) of the JSON file a snapshot was taken from
+SourceStamp = Tuple[int, int]
+
+def source_stamp(path: str) -> Optional[SourceStamp]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def native_array(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()  # Stored little-endian
+    return values
+
+def little_endian_bytes(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def encode_record(fields: Sequence[str], compress: bool) -> bytes:
+    mask = 0
+    parts = []
+    for position, value in enumerate(fields):
+        data = value.encode('utf-8')
+        if compress and len(data) >= COMPRESS_MIN_BYTES:
+            packed = zlib.compress(data, 6)
+            if len(packed) < len(data):
+                data = packed
+                mask |= 1 << position
+        parts.append(FIELD_LENGTH.pack(len(data)))
+        parts.append(data)
+    return bytes([mask]) + b''.join(parts)
+
+def write_snapshot(
+    path: str,
+    records: Iterable[Tuple[str, Sequence[str], Sequence[str]]],
+    stamp: SourceStamp,
+    compress: bool = False,
+    meta: Optional[dict] = None
+) -> None:
+    """Write (key, text fields, linked names) records as a binary snapshot.
+
+    Layout: a fixed header, the length-prefixed records, then the key and
+    ref string tables, the record offset table, the (record, ref) link
+    table and a small JSON `meta` object. Link targets (usernames, event
+    ids) are stored once in the ref table and referenced by index. Written
+    to a temp file and renamed.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b'\0' * HEADER.size)
+            keys = []
+            offsets = array('Q')
+            refs: Dict[str, int] = {}
+            link_records = array('I')
+            link_refs = array('I')
+            position = HEADER.size
+            for index, (key, fields, links) in enumerate(records):
+                keys.append(key)
+                offsets.append(position)
+                record = encode_record(fields, compress)
+                f.write(record)
+                position += len(record)
+                for name in links:
+                    link_records.append(index)
+                    link_refs.append(refs.setdefault(name, len(refs)))
+            offsets.append(position)
+
+            sections = []
+            for blob in (
+                '\0'.join(keys).encode('utf-8'),
+                '\0'.join(refs).encode('utf-8'),
+                little_endian_bytes(offsets),
+                little_endian_bytes(link_records) + little_endian_bytes(link_refs),
+                json.dumps(meta or {}).encode('utf-8'),
+            ):
+                sections.append(position)
+                f.write(BLOB_LENGTH.pack(len(blob)))
+                f.write(blob)
+                position += BLOB_LENGTH.size + len(blob)
+
+            f.seek(0)
+            f.write(HEADER.pack(
+                MAGIC, VERSION, FLAG_COMPRESSED if compress else 0,
+                len(keys), len(refs), len(link_records), stamp[0], stamp[1],
+                *sections, position
+            ))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+class Snapshot:
+    """Read side of a binary snapshot, mapped with mmap.
+
+    Opening reads only the header and the tables; records are decoded one
+    at a time with fields(). open() returns None for a missing, damaged or
+    foreign file, or one taken from a different version of the source.
+    """
+
+    def __init__(self, file, mapped: mmap.mmap, header: tuple):
+        self.file = file
+        self.mmap = mapped
+        (_, _, self.flags, self.count, ref_count, link_count, _, _,
+         keys_offset, refs_offset, offsets_offset, links_offset, meta_offset, _) = header
+        self.keys = self.strings(keys_offset, self.count)
+        self.refs = self.strings(refs_offset, ref_count)
+        self.offsets = native_array('Q', self.blob(offsets_offset))
+        links = self.blob(links_offset)
+        self.link_records = native_array('I', links[:4 * link_count])
+        self.link_refs = native_array('I', links[4 * link_count:])
+        self.meta = json.loads(self.blob(meta_offset).decode('utf-8'))
+
+    @classmethod
+    def open(cls, path: str, stamp: Optional[SourceStamp]) -> Optional['Snapshot']:
+        if stamp is None:
+            return None
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+        try:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError("truncated snapshot")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            header = HEADER.unpack_from(mapped, 0)
+            magic, version, _, _, _, _, source_size, source_mtime_ns = header[:8]
+            if magic != MAGIC or version != VERSION or header[-1] != size:
+                mapped.close()
+                raise ValueError("not a snapshot of this version")
+            if (source_size, source_mtime_ns) != tuple(stamp):
+                mapped.close()
+                raise ValueError("stale snapshot")
+            return cls(f, mapped, header)
+        except (ValueError, struct.error, OSError):
+            f.close()
+            return None
+
+    def blob(self, offset: int) -> bytes:
+        (length,) = BLOB_LENGTH.unpack_from(self.mmap, offset)
+        start = offset + BLOB_LENGTH.size
+        return self.mmap[start:start + length]
+
+    def strings(self, offset: int, count: int) -> List[str]:
+        return self.blob(offset).decode('utf-8').split('\0') if count else []
+
+    def fields(self, index: int) -> List[str]:
+        start = self.offsets[index]
+        end = self.offsets[index + 1]
+        mask = self.mmap[start]
+        position = start + 1
+        fields = []
+        while position < end:
+            (length,) = FIELD_LENGTH.unpack_from(self.mmap, position)
+            position += FIELD_LENGTH.size
+            data = self.mmap[position:position + length]
+            if mask & (1 << len(fields)):
+                data = zlib.decompress(data)
+            fields.append(data.decode('utf-8'))
+            position += length
+        return fields
+
+    def links(self) -> Dict[str, List[str]]:
+        """key -> linked names, for records that have any"""
+        links: Dict[str, List[str]] = {}
+        for record, ref in zip(self.link_records, self.link_refs):
+            links.setdefault(self.keys[record], []).append(self.refs[ref])
+        return links
+
+    def close(self):
+        self.mmap.close()
+        self.file.close()
@@ -0,0 +1,76 @@
+import json
+import os
+from typing import Iterator, List, Optional
+
+class EventJournal:
+    """Append-only log of event mutations, replayed on top of the snapshot."""
+
+    def __init__(self, journal_file: str, compact_threshold: int = 1000):
+        self.journal_file = journal_file
+        self.compact_threshold = compact_threshold
+        self.entry_count = 0
+        self.buffer: List[str] = []
+
+    def append(self, op: str, event_id: str, data: Optional[dict] = None):
+        entry = {'op': op, 'id': event_id}
+        if data is not None:
+            entry['data'] = data
+        self.buffer.append(json.dumps(entry, ensure_ascii=False) + '\n')
+        self.entry_count += 1
+
+    def flush(self):
+        # Write every buffered entry with a single append
+        if not self.buffer:
+            return
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(''.join(self.buffer))
+            f.flush()
+            os.fsync(f.fileno())
+        self.buffer = []
+
+    def replay(self) -> Iterator[dict]:
+        self.entry_count = 0
+        try:
+            f = open(self.journal_file, 'rb')
+        except FileNotFoundError:
+            return
+        # Bytes up to the end of the last whole entry
+        valid_end = 0
+        unterminated = False
+        with f:
+            for line in f:
+                if line.strip():
+                    try:
+                        entry = json.loads(line.decode('utf-8'))
+                    except ValueError:  # UnicodeDecodeError is a ValueError too
+                        # A torn write at the tail (crash mid-append), nothing after it is valid
+                        break
+                    self.entry_count += 1
+                    yield entry
+                valid_end += len(line)
+                unterminated = not line.endswith(b'\n')
+        self.repair(valid_end, unterminated)
+
+    def repair(self, valid_end: int, unterminated: bool):
+        # Cut a torn tail off, or the next flush would append behind it and
+        # every later entry would be skipped by the next replay as well
+        with open(self.journal_file, 'r+b') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == valid_end and not unterminated:
+                return
+            f.truncate(valid_end)
+            if unterminated:
+                f.seek(valid_end)
+                f.write(b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def needs_compaction(self) -> bool:
+        return self.entry_count >= self.compact_threshold
+
+    def truncate(self):
+        # Buffered entries are already part of the snapshot that triggered this
+        self.buffer = []
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self.entry_count = 0
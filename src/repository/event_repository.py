@@ -1,17 +1,93 @@
 import json
-from typing import Dict, List, Optional
+import threading
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
 from src.model.event import Event
+from src.repository.event_journal import EventJournal
+from src.repository.event_store import EventStore, LazyEventMap
+from src.repository.id_allocator import IdAllocator
+from src.repository.pagination import EventPage, OrderedIndex, paginate, sorted_entries
+from src.repository.write_behind import WriteBehind
+
+def event_id_sort_key(event_id: str):
+    # Numeric ids in numeric order, anything else after them
+    if event_id.isdigit():
+        return (0, int(event_id), '')
+    return (1, 0, event_id)
+
+# (title, description, assigned usernames, date, location) of an event to create
+EventDraft = Tuple[str, str, List[str], str, str]
+
+def allocate_events(drafts: Iterable[EventDraft], id_allocator, block_size: int = 1000) -> List[Event]:
+    """Events for drafts, ids reserved a block at a time"""
+    events = []
+    drafts = iter(drafts)
+    while True:
+        chunk = list(islice(drafts, block_size))
+        if not chunk:
+            return events
+        for event_id, (title, description, assigned_users, date, location) in zip(
+            id_allocator.reserve(len(chunk)), chunk
+        ):
+            events.append(Event(
+                id=str(event_id),
+                title=title,
+                description=description,
+                assigned_users=assigned_users,
+                date=date,
+                location=location
+            ))
 
 class EventRepository:
-    def __init__(self):
+    def __init__(
+        self,
+        compact_threshold: int = 1000,
+        flush_delay: float = 0.5,
+        max_pending: int = 50,
+        compress_snapshot: bool = False
+    ):
+        # Legacy single-document snapshot, only read to migrate to the store
         self.events_file = "events.json"
+        self.store = EventStore("events.jsonl", "events.idx", "events.snap", compress_snapshot)
+        self.journal = EventJournal("events.journal", compact_threshold)
+        self.id_allocator = IdAllocator("events.seq")
+        self.lock = threading.RLock()
+        self.writer = WriteBehind(self.persist, flush_delay, max_pending, self.lock)
+        # username -> ids of the events the user is assigned to
+        self.user_index: Dict[str, Set[str]] = {}
+        # event id -> usernames the event is currently indexed under
+        self.indexed_assignees: Dict[str, FrozenSet[str]] = {}
+        # Every event id in event_id_sort_key order, built on the first paged read
+        self.id_order: Optional[OrderedIndex] = None
         self.load_events()
 
     def load_events(self):
+        self.events = LazyEventMap(self.store, self.lock)
+        self.id_order = None
+        if self.store.exists():
+            # Only the binary snapshot's tables or the offset index are read
+            # here, events are decoded on access
+            self.events.reset(*self.store.open())
+        else:
+            self.load_legacy_events()
+            self.save_events()
+        # The binary snapshot is rewritten on close if it is missing or behind
+        self.snapshot_stale = not self.store.has_current_snapshot()
+        self.replay_journal()
+        # The allocator must never hand out an id that already exists
+        self.id_allocator.ensure_floor(self.max_numeric_id())
+
+    def max_numeric_id(self) -> int:
+        stored_max = self.store.snapshot_meta().get('max_numeric_id')
+        if stored_max is None:
+            return max(map(int, filter(str.isdigit, self.events)), default=0)
+        # Only ids put by the journal can be above the snapshot's maximum
+        return max(stored_max, max(map(int, filter(str.isdigit, self.events.changed_ids)), default=0))
+
+    def load_legacy_events(self):
         try:
             with open(self.events_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                self.events = {}
                 # Handle both old and new format
                 if isinstance(data, dict):
                     if 'events' in data:  # New format
@@ -20,7 +96,9 @@ class EventRepository:
                                 id=event_data.get('id', ''),
                                 title=event_data.get('title', ''),
                                 description=event_data.get('description', ''),
-                                assigned_users=event_data.get('assigned_users', [])
+                                assigned_users=event_data.get('assigned_users', []),
+                                date=event_data.get('date', ''),
+                                location=event_data.get('location', '')
                             )
                             self.events[event.id] = event
                     else:  # Old format (direct event mapping)
@@ -29,60 +107,200 @@ class EventRepository:
                                 id=event_id,
                                 title=event_data.get('title', ''),
                                 description=event_data.get('description', ''),
-                                assigned_users=event_data.get('assigned_users', [])
+                                assigned_users=event_data.get('assigned_users', []),
+                                date=event_data.get('date', ''),
+                                location=event_data.get('location', '')
                             )
                             self.events[event_id] = event
         except FileNotFoundError:
-            self.events = {}
+            pass
+
+    def replay_journal(self):
+        # Fold mutations logged since the last snapshot on top of it
+        for entry in self.journal.replay():
+            event_id = entry.get('id', '')
+            if entry.get('op') == 'put':
+                event_data = entry.get('data', {})
+                self.events[event_id] = Event(
+                    id=event_id,
+                    title=event_data.get('title', ''),
+                    description=event_data.get('description', ''),
+                    assigned_users=event_data.get('assigned_users', []),
+                    date=event_data.get('date', ''),
+                    location=event_data.get('location', '')
+                )
+            elif entry.get('op') == 'delete':
+                self.events.pop(event_id, None)
+        self.rebuild_user_index()
+
+    def rebuild_user_index(self):
+        self.user_index = {}
+        self.indexed_assignees = {}
+        for event_id, assigned_users in self.events.iter_assignees():
+            self.index_assignees(event_id, assigned_users)
+
+    def index_event(self, event: Event):
+        self.index_assignees(event.id, event.assigned_users)
+        if self.id_order is not None:
+            self.id_order.add(event.id, event_id_sort_key(event.id))
+
+    def index_assignees(self, event_id: str, assigned_users: List[str]):
+        # Apply only the difference between the indexed and the current assignees
+        old_users = self.indexed_assignees.get(event_id, frozenset())
+        new_users = frozenset(assigned_users)
+        for username in old_users - new_users:
+            event_ids = self.user_index.get(username)
+            if event_ids is not None:
+                event_ids.discard(event_id)
+                if not event_ids:
+                    del self.user_index[username]
+        for username in new_users - old_users:
+            self.user_index.setdefault(username, set()).add(event_id)
+        if new_users:
+            self.indexed_assignees[event_id] = new_users
+        else:
+            self.indexed_assignees.pop(event_id, None)
+
+    def unindex_event(self, event_id: str):
+        if self.id_order is not None:
+            self.id_order.remove(event_id)
+        for username in self.indexed_assignees.pop(event_id, frozenset()):
+            event_ids = self.user_index.get(username)
+            if event_ids is not None:
+                event_ids.discard(event_id)
+                if not event_ids:
+                    del self.user_index[username]
+
+    def compact(self):
+        # Fold the journal back into the snapshot
+        with self.lock:
             self.save_events()
+            self.journal.truncate()
+
+    def persist(self):
+        # Called by the write-behind layer once per coalesced batch of mutations
+        if self.journal.needs_compaction():
+            self.compact()
+        else:
+            self.journal.flush()
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        self.flush()
+        # Journal entries already in the snapshot replay to the same state
+        if self.snapshot_stale:
+            self.save_snapshot()
+        self.store.close()
+        self.id_allocator.release()
+
+    def log_put(self, event: Event):
+        self.journal.append('put', event.id, event.to_dict())
+        self.snapshot_stale = True
+        self.writer.mark_dirty()
+
+    def log_delete(self, event_id: str):
+        self.journal.append('delete', event_id)
+        self.snapshot_stale = True
+        self.writer.mark_dirty()
 
     def save_events(self):
-        data = {
-            'events': [
-                {
-                    'id': event.id,
-                    'title': event.title,
-                    'description': event.description,
-                    'assigned_users': event.assigned_users
-                }
-                for event in self.events.values()
-            ]
-        }
-        with open(self.events_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-
-    def create_event(self, title: str, description: str = "") -> Event:
-        # Generate a new ID based on existing IDs
-        existing_ids = [int(id) for id in self.events.keys() if id.isdigit()]
-        next_id = str(max(existing_ids) + 1) if existing_ids else "1"
-        
-        event = Event(
-            id=next_id,
-            title=title,
-            description=description,
-            assigned_users=[]
-        )
-        self.events[next_id] = event
-        self.save_events()
-        return event
+        # Rewrite the store; events that did not change are copied byte for byte
+        with self.lock:
+            self.events.reset(*self.store.write(self.events.records()))
+            self.save_snapshot()
+
+    def save_snapshot(self):
+        with self.lock:
+            self.events.reset(*self.store.write_snapshot(self.events.snapshot_records()))
+            self.snapshot_stale = False
+
+    def create_event(self, title: str, description: str = "", date: str = "", location: str = "") -> Event:
+        with self.lock:
+            next_id = self.id_allocator.allocate()
+            event = Event(
+                id=next_id,
+                title=title,
+                description=description,
+                assigned_users=[],
+                date=date,
+                location=location
+            )
+            self.events[next_id] = event
+            self.index_event(event)
+            self.log_put(event)
+            return event
+
+    def create_events(self, drafts: Iterable[EventDraft]) -> List[Event]:
+        """Create an event per draft, persisted together.
+
+        The drafts are all read before the catalog is touched, so a draft
+        source that fails midway leaves it as it was. A batch past the
+        compaction threshold is written with one store rewrite instead of
+        through the journal.
+        """
+        events = allocate_events(drafts, self.id_allocator)
+        with self.writer.batch():
+            for event in events:
+                self.events[event.id] = event
+                self.index_event(event)
+                self.log_put(event)
+        return events
+
+    def batch(self):
+        """Hold the lock for a read-modify-write and persist its changes together"""
+        return self.writer.batch()
 
     def get_event(self, event_id: str) -> Optional[Event]:
         return self.events.get(event_id)
 
-    def get_all_events(self) -> Dict[str, Event]:
+    def get_all_events(self) -> Mapping[str, Event]:
         return self.events
 
+    def get_events_page(self, limit: int = 50, cursor: Optional[str] = None, username: Optional[str] = None) -> EventPage:
+        """One page of events in id order, optionally only a user's.
+
+        Only the events on the page are decoded. Pass the page's next_cursor
+        or prev_cursor back to move from it.
+        """
+        with self.lock:
+            if username is None:
+                if self.id_order is None:
+                    self.id_order = OrderedIndex((event_id, event_id_sort_key(event_id)) for event_id in self.events)
+                entries = self.id_order.entries
+            else:
+                entries = sorted_entries(
+                    (event_id, event_id_sort_key(event_id)) for event_id in self.user_index.get(username, ())
+                )
+            event_ids, next_cursor, prev_cursor = paginate(entries, limit, cursor)
+            return EventPage([self.events[event_id] for event_id in event_ids], next_cursor, prev_cursor)
+
     def update_event(self, event: Event) -> Event:
-        self.events[event.id] = event
-        self.save_events()
-        return event
+        with self.lock:
+            self.events[event.id] = event
+            self.index_event(event)
+            self.log_put(event)
+            return event
+
+    def update_events(self, events: Iterable[Event]) -> List[Event]:
+        """update_event for every event, persisted together"""
+        with self.writer.batch():
+            return [self.update_event(event) for event in events]
 
     def delete_event(self, event_id: str) -> bool:
-        if event_id in self.events:
-            del self.events[event_id]
-            self.save_events()
-            return True
-        return False
+        with self.lock:
+            if event_id in self.events:
+                del self.events[event_id]
+                self.unindex_event(event_id)
+                self.log_delete(event_id)
+                return True
+            return False
+
+    def delete_events(self, event_ids: Iterable[str]) -> Dict[str, bool]:
+        """delete_event for every id, persisted together; id -> whether it existed"""
+        with self.writer.batch():
+            return {event_id: self.delete_event(event_id) for event_id in event_ids}
 
     def assign_users_to_event(self, event_id: str, usernames: List[str]) -> bool:
         event = self.get_event(event_id)
@@ -92,9 +310,21 @@ class EventRepository:
             return True
         return False
 
+    def get_user_event_ids(self, username: str) -> List[str]:
+        with self.lock:
+            event_ids = self.user_index.get(username, ())
+            return sorted(event_ids, key=event_id_sort_key)
+
     def get_user_events(self, username: str) -> Dict[str, Event]:
         return {
-            event_id: event
-            for event_id, event in self.events.items()
-            if username in event.assigned_users
-        } 
\ No newline at end of file
+            event_id: self.events[event_id]
+            for event_id in self.get_user_event_ids(username)
+        }
+
+    def remove_user(self, username: str):
+        # Unassign a deleted user from every event they were assigned to
+        with self.writer.batch():
+            for event_id in list(self.user_index.get(username, ())):
+                event = self.events[event_id]
+                event.assigned_users = [name for name in event.assigned_users if name != username]
+                self.update_event(event)
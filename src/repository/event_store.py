@@ -0,0 +1,327 @@
+import json
+import mmap
+import os
+import tempfile
+import threading
+from collections.abc import MutableMapping
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from src.model.event import Event
+from src.repository.binary_snapshot import Snapshot, source_stamp, write_snapshot
+
+INDEX_VERSION = 1
+# Text fields of a snapshot record, in order; a snapshot written with other
+# fields is ignored like a stale one
+SNAPSHOT_FIELDS = ['title', 'description', 'date', 'location']
+
+# event id -> (byte offset, byte length) of its line in the data file,
+# or record number in the binary snapshot
+Offsets = Dict[str, object]
+# event id -> assigned usernames, only for events that have any
+Assignees = Dict[str, List[str]]
+
+def encode_event(event: Event) -> bytes:
+    return json.dumps({
+        'id': event.id,
+        'title': event.title,
+        'description': event.description,
+        'assigned_users': event.assigned_users,
+        'date': event.date,
+        'location': event.location
+    }, ensure_ascii=False).encode('utf-8')
+
+def decode_event(raw: bytes) -> Event:
+    data = json.loads(raw.decode('utf-8'))
+    return Event(
+        id=data.get('id', ''),
+        title=data.get('title', ''),
+        description=data.get('description', ''),
+        assigned_users=data.get('assigned_users', []),
+        date=data.get('date', ''),
+        location=data.get('location', '')
+    )
+
+class EventStore:
+    """Events as JSON Lines plus a sidecar offset index, read through mmap.
+
+    Opening the store only loads the index (id -> offset/length, and the
+    assignees needed for the user index); a record is decoded when it is
+    asked for. The index remembers the size of the data file it describes;
+    if they disagree (crash between the two renames, hand edits) the index
+    is rebuilt with one scan of the data file.
+
+    A binary snapshot of the same events (see binary_snapshot), when it was
+    taken from the current data file, is preferred: its tables load without
+    any JSON parsing. The JSON Lines file stays the fallback and the format
+    other tools read.
+    """
+
+    def __init__(
+        self,
+        data_file: str = "events.jsonl",
+        index_file: str = "events.idx",
+        snapshot_file: Optional[str] = "events.snap",
+        compress_snapshot: bool = False
+    ):
+        self.data_file = data_file
+        self.index_file = index_file
+        self.snapshot_file = snapshot_file
+        self.compress_snapshot = compress_snapshot
+        self.file = None
+        self.mmap: Optional[mmap.mmap] = None
+        self.snapshot: Optional[Snapshot] = None
+        self.lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return os.path.exists(self.data_file)
+
+    def open(self) -> Tuple[Offsets, Assignees]:
+        with self.lock:
+            if self.snapshot_file:
+                self.close_snapshot()
+                self.snapshot = Snapshot.open(self.snapshot_file, source_stamp(self.data_file))
+                if self.snapshot is not None and self.snapshot.meta.get('fields') != SNAPSHOT_FIELDS:
+                    self.close_snapshot()
+                if self.snapshot is not None:
+                    slots = dict(zip(self.snapshot.keys, range(self.snapshot.count)))
+                    return slots, self.snapshot.links()
+            self.map_data_file()
+            index = self.load_index()
+            if index is None:
+                index = self.scan()
+                self.write_index(*index)
+            return index
+
+    def map_data_file(self):
+        self.unmap()
+        self.file = open(self.data_file, 'rb')
+        if os.fstat(self.file.fileno()).st_size:
+            self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def unmap(self):
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def data_size(self) -> int:
+        return len(self.mmap) if self.mmap is not None else 0
+
+    def load_index(self) -> Optional[Tuple[Offsets, Assignees]]:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if data.get('version') != INDEX_VERSION or data.get('data_size') != self.data_size():
+            return None
+        offsets = dict(zip(data['ids'], zip(data['offsets'], data['lengths'])))
+        return offsets, data['assignees']
+
+    def scan(self) -> Tuple[Offsets, Assignees]:
+        offsets = {}
+        assignees = {}
+        if self.mmap is None:
+            return offsets, assignees
+        offset = 0
+        size = len(self.mmap)
+        while offset < size:
+            end = self.mmap.find(b'\n', offset)
+            if end < 0:
+                end = size
+            if end > offset:
+                try:
+                    event = decode_event(self.mmap[offset:end])
+                except ValueError:
+                    break  # Torn last line, everything before it is intact
+                offsets[event.id] = (offset, end - offset)
+                if event.assigned_users:
+                    assignees[event.id] = event.assigned_users
+            offset = end + 1
+        return offsets, assignees
+
+    def write_index(self, offsets: Offsets, assignees: Assignees, data_size: Optional[int] = None):
+        # Flat columns parse much faster than one small list per event
+        data = {
+            'version': INDEX_VERSION,
+            'data_size': self.data_size() if data_size is None else data_size,
+            'ids': list(offsets),
+            'offsets': [offset for offset, _ in offsets.values()],
+            'lengths': [length for _, length in offsets.values()],
+            'assignees': assignees
+        }
+        self.replace_file(self.index_file, lambda f: f.write(json.dumps(data, ensure_ascii=False).encode('utf-8')))
+
+    def read(self, offset: int, length: int) -> bytes:
+        with self.lock:
+            return self.mmap[offset:offset + length]
+
+    def read_fields(self, record: int) -> List[str]:
+        with self.lock:
+            return self.snapshot.fields(record)
+
+    def has_current_snapshot(self) -> bool:
+        return self.snapshot is not None
+
+    def snapshot_meta(self) -> dict:
+        return self.snapshot.meta if self.snapshot is not None else {}
+
+    def write_snapshot(self, records: Iterable[Tuple[str, Sequence[str], Sequence[str]]]) -> Tuple[Offsets, Assignees]:
+        """Snapshot (id, SNAPSHOT_FIELDS values, assignees) records of the current data file"""
+        # The largest numeric id rides along so loading can seed the id
+        # allocator without a pass over every key; the metadata is only
+        # serialized after the last record, so it can be filled in on the way
+        meta = {'fields': SNAPSHOT_FIELDS, 'max_numeric_id': 0}
+
+        def track_ids():
+            for record in records:
+                if record[0].isdigit():
+                    meta['max_numeric_id'] = max(meta['max_numeric_id'], int(record[0]))
+                yield record
+
+        write_snapshot(self.snapshot_file, track_ids(), source_stamp(self.data_file), self.compress_snapshot, meta)
+        with self.lock:
+            self.close_snapshot()
+            self.snapshot = Snapshot.open(self.snapshot_file, source_stamp(self.data_file))
+            return dict(zip(self.snapshot.keys, range(self.snapshot.count))), self.snapshot.links()
+
+    def close_snapshot(self):
+        if self.snapshot is not None:
+            self.snapshot.close()
+            self.snapshot = None
+
+    def write(self, records: Iterable[Tuple[str, bytes, List[str]]]) -> Tuple[Offsets, Assignees]:
+        """Replace the store with (id, encoded event, assignees) records"""
+        offsets = {}
+        assignees = {}
+
+        def write_records(f):
+            offset = 0
+            for event_id, raw, users in records:
+                f.write(raw)
+                f.write(b'\n')
+                offsets[event_id] = (offset, len(raw))
+                if users:
+                    assignees[event_id] = list(users)
+                offset += len(raw) + 1
+
+        # `records` may still be reading the old mapping, so it stays open until here
+        tmp_path = self.write_temp(self.data_file, write_records)
+        with self.lock:
+            self.unmap()
+            # Taken from the previous data file, no longer valid
+            self.close_snapshot()
+            os.replace(tmp_path, self.data_file)
+            self.map_data_file()
+            self.write_index(offsets, assignees)
+        return offsets, assignees
+
+    def write_temp(self, path: str, write) -> str:
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return tmp_path
+
+    def replace_file(self, path: str, write):
+        os.replace(self.write_temp(path, write), path)
+
+    def close(self):
+        with self.lock:
+            self.unmap()
+            self.close_snapshot()
+
+class LazyEventMap(MutableMapping):
+    """Mapping of event id -> Event that decodes stored events on access.
+
+    Events written since the store was last rewritten live in memory; all
+    others are only an offset into the store until they are read, and are
+    decoded afresh on every read so iterating the catalog never pins it in
+    memory. Insertion order is kept, like a dict.
+    """
+
+    def __init__(self, store: EventStore, lock):
+        self.store = store
+        self.lock = lock
+        # id -> Event (changed since the last rewrite) or (offset, length) in the store
+        self.slots: Dict[str, object] = {}
+        self.stored_assignees: Assignees = {}
+        # Ids whose slot holds an in-memory Event
+        self.changed_ids: Set[str] = set()
+
+    def reset(self, offsets: Offsets, assignees: Assignees):
+        with self.lock:
+            self.slots = offsets
+            self.stored_assignees = assignees
+            self.changed_ids = set()
+
+    def __getitem__(self, event_id: str) -> Event:
+        with self.lock:
+            return self.decode(event_id, self.slots[event_id])
+
+    def decode(self, event_id: str, slot) -> Event:
+        if isinstance(slot, Event):
+            return slot
+        if isinstance(slot, tuple):
+            return decode_event(self.store.read(*slot))
+        # Snapshot record: text fields inline, assignees from the link table
+        title, description, date, location = self.store.read_fields(slot)
+        return Event(event_id, title, description, list(self.stored_assignees.get(event_id, [])), date, location)
+
+    def __setitem__(self, event_id: str, event: Event):
+        with self.lock:
+            self.slots[event_id] = event
+            self.changed_ids.add(event_id)
+
+    def __delitem__(self, event_id: str):
+        with self.lock:
+            del self.slots[event_id]
+            self.changed_ids.discard(event_id)
+
+    def __contains__(self, event_id) -> bool:
+        return event_id in self.slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.slots))
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def assigned_users(self, event_id: str) -> List[str]:
+        """Assignees of an event without decoding it"""
+        slot = self.slots[event_id]
+        if isinstance(slot, Event):
+            return slot.assigned_users
+        return self.stored_assignees.get(event_id, [])
+
+    def iter_assignees(self) -> Iterator[Tuple[str, List[str]]]:
+        """(id, assignees) of every event that has any, without decoding events"""
+        for event_id, users in self.stored_assignees.items():
+            # Skip events changed or deleted since the store was written
+            if event_id in self.slots and event_id not in self.changed_ids:
+                yield event_id, users
+        for event_id in self.changed_ids:
+            assigned_users = self.slots[event_id].assigned_users
+            if assigned_users:
+                yield event_id, assigned_users
+
+    def records(self) -> Iterator[Tuple[str, bytes, List[str]]]:
+        # Unchanged JSON lines are copied as raw bytes, everything else is encoded
+        for event_id, slot in list(self.slots.items()):
+            if isinstance(slot, tuple):
+                yield event_id, self.store.read(*slot), self.stored_assignees.get(event_id, [])
+            else:
+                event = self.decode(event_id, slot)
+                yield event_id, encode_event(event), event.assigned_users
+
+    def snapshot_records(self) -> Iterator[Tuple[str, Tuple[str, ...], List[str]]]:
+        for event_id, slot in list(self.slots.items()):
+            event = self.decode(event_id, slot)
+            yield event_id, (event.title, event.description, event.date, event.location), event.assigned_users
@@ -0,0 +1,82 @@
+import os
+from contextlib import contextmanager
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+@contextmanager
+def locked_file(path: str):
+    """Open `path` for read/write while holding an exclusive OS-level lock on it."""
+    with open(path, 'a+b') as f:
+        if os.name == 'nt':
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield f
+        finally:
+            if os.name == 'nt':
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+class IdAllocator:
+    """Hands out event ids from a high-water mark persisted next to the data.
+
+    Ids are reserved from the counter file in blocks while holding a file lock,
+    so processes sharing the data directory never hand out the same id.
+    Allocating from the current block is O(1). release() gives the unused
+    rest of the block back on close, so ids stay consecutive across restarts;
+    a block that another process has reserved past stays a gap.
+    """
+
+    def __init__(self, counter_file: str, block_size: int = 20):
+        self.counter_file = counter_file
+        self.block_size = block_size
+        # Highest id known to exist in the data, in case the counter file is missing or behind
+        self.floor = 0
+        self.next_id = 0
+        self.block_end = 0
+
+    def ensure_floor(self, value: int):
+        self.floor = max(self.floor, value)
+
+    def reserve(self, count: int) -> range:
+        """Reserve `count` consecutive ids directly from the shared counter."""
+        with locked_file(self.counter_file) as f:
+            f.seek(0)
+            content = f.read().strip()
+            high_water_mark = max(int(content) if content else 0, self.floor)
+            f.seek(0)
+            f.truncate()
+            f.write(str(high_water_mark + count).encode('ascii'))
+            f.flush()
+            os.fsync(f.fileno())
+        return range(high_water_mark + 1, high_water_mark + count + 1)
+
+    def release(self):
+        """Give back the unused rest of the current block, if nobody reserved past it."""
+        if self.next_id >= self.block_end:
+            return
+        with locked_file(self.counter_file) as f:
+            f.seek(0)
+            content = f.read().strip()
+            if content and int(content) == self.block_end - 1:
+                f.seek(0)
+                f.truncate()
+                f.write(str(self.next_id - 1).encode('ascii'))
+                f.flush()
+                os.fsync(f.fileno())
+        self.next_id = self.block_end = 0
+
+    def allocate(self) -> str:
+        if self.next_id >= self.block_end:
+            block = self.reserve(self.block_size)
+            self.next_id, self.block_end = block.start, block.stop
+        event_id = self.next_id
+        self.next_id += 1
+        return str(event_id)
@@ -0,0 +1,108 @@
+import base64
+import json
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from src.model.event import Event
+
+# (sort key, id): ids break ties, so every entry has a unique position
+Entry = Tuple[tuple, str]
+
+class EventPage:
+    """One page of events plus the cursors of the pages around it.
+
+    A cursor is None when there is nothing in that direction.
+    """
+
+    def __init__(self, events: List[Event], next_cursor: Optional[str] = None, prev_cursor: Optional[str] = None):
+        self.events = events
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    def __repr__(self) -> str:
+        return f"EventPage({len(self.events)} events, next={self.next_cursor!r}, prev={self.prev_cursor!r})"
+
+def encode_cursor(direction: str, entry: Entry) -> str:
+    sort_key, item_id = entry
+    data = json.dumps([direction, list(sort_key), item_id], ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor: str) -> Tuple[str, Entry]:
+    """(direction, entry) of a cursor; raises ValueError for one that was not made by encode_cursor"""
+    try:
+        direction, sort_key, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+    except (TypeError, UnicodeError, ValueError):  # binascii.Error is a ValueError
+        raise ValueError(f"Invalid page cursor: {cursor!r}")
+    if direction not in ('after', 'before') or not isinstance(sort_key, list) or not isinstance(item_id, str):
+        raise ValueError(f"Invalid page cursor: {cursor!r}")
+    return direction, (tuple(sort_key), item_id)
+
+def paginate(
+    entries: List[Entry],
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = False
+) -> Tuple[List[str], Optional[str], Optional[str]]:
+    """(ids, next cursor, previous cursor) of one page of sorted entries.
+
+    Cursors hold the entry at the page boundary rather than an offset, so
+    pages stay put while entries are added or removed elsewhere, including
+    the boundary entry itself. With `descending` the pages walk the entries
+    from the end, without reversing the list.
+    """
+    direction, entry = decode_cursor(cursor) if cursor is not None else (None, None)
+    # Walking forward through the list: the next page when ascending, the previous one when descending
+    forward = direction == ('before' if descending else 'after')
+    try:
+        if direction is None:
+            start, end = (max(len(entries) - limit, 0), len(entries)) if descending else (0, limit)
+        elif forward:
+            start = bisect_right(entries, entry)
+            end = start + limit
+        else:
+            end = bisect_left(entries, entry)
+            start = max(end - limit, 0)
+    except TypeError:
+        # A cursor from an ordering whose keys do not compare with these
+        raise ValueError(f"Invalid page cursor: {cursor!r}")
+    page = entries[start:end]
+    if not page:
+        return [], None, None
+    more_before, more_after = start > 0, end < len(entries)
+    if descending:
+        page.reverse()
+        more_before, more_after = more_after, more_before
+    next_cursor = encode_cursor('after', page[-1]) if more_after else None
+    prev_cursor = encode_cursor('before', page[0]) if more_before else None
+    return [item_id for _, item_id in page], next_cursor, prev_cursor
+
+class OrderedIndex:
+    """Ids kept sorted by a sort key, maintained incrementally.
+
+    Adding or removing an id is a bisect plus a list insert/delete, so the
+    order never has to be rebuilt by sorting the whole catalog again.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, tuple]] = ()):
+        # id -> its sort key, to find the entry again on removal
+        self.sort_keys: Dict[str, tuple] = dict(items)
+        self.entries: List[Entry] = sorted((sort_key, item_id) for item_id, sort_key in self.sort_keys.items())
+
+    def add(self, item_id: str, sort_key: tuple):
+        old_key = self.sort_keys.get(item_id)
+        if old_key == sort_key:
+            return
+        if old_key is not None:
+            self.remove(item_id)
+        self.sort_keys[item_id] = sort_key
+        insort(self.entries, (sort_key, item_id))
+
+    def remove(self, item_id: str):
+        sort_key = self.sort_keys.pop(item_id, None)
+        if sort_key is None:
+            return
+        index = bisect_left(self.entries, (sort_key, item_id))
+        del self.entries[index]
+
+def sorted_entries(items: Iterable[Tuple[str, Any]]) -> List[Entry]:
+    """Entries of (id, sort key) pairs, for a one-off ordering of a subset"""
+    return sorted((sort_key, item_id) for item_id, sort_key in items)
@@ -0,0 +1,154 @@
+import sqlite3
+import threading
+from src.repository.event_repository import EventRepository
+from src.repository.user_repository import UserRepository
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    date TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_events_title ON events(title);
+
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    role TEXT NOT NULL DEFAULT 'user'
+);
+
+CREATE TABLE IF NOT EXISTS event_users (
+    event_id TEXT NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    username TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (event_id, username)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_event_users_username ON event_users(username, event_id);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+class SQLiteDatabase:
+    """Shared connection for the SQLite-backed repositories."""
+
+    def __init__(self, database_file: str = "events.db"):
+        self.database_file = database_file
+        self.lock = threading.RLock()
+        # The write-behind timer and UI worker threads may touch the connection,
+        # every access goes through self.lock
+        self.connection = sqlite3.connect(database_file, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+        self.add_missing_columns()
+        self.connection.commit()
+
+    def add_missing_columns(self):
+        # Databases created before events had a date and a location
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(events)")}
+        for column in ('date', 'location'):
+            if column not in columns:
+                self.connection.execute(f"ALTER TABLE events ADD COLUMN {column} TEXT NOT NULL DEFAULT ''")
+
+    def is_empty(self) -> bool:
+        with self.lock:
+            for table in ('events', 'users'):
+                if self.connection.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone():
+                    return False
+            return True
+
+    def close(self):
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
+
+class SQLiteIdAllocator:
+    """Event id allocator whose high-water mark lives in the meta table.
+
+    Blocks are reserved inside a BEGIN IMMEDIATE transaction, which SQLite
+    serializes across every process using the same database file. Like
+    IdAllocator, the unused rest of a block is given back by release().
+    """
+
+    def __init__(self, database: SQLiteDatabase, block_size: int = 20):
+        self.database = database
+        self.block_size = block_size
+        self.next_id = 0
+        self.block_end = 0
+
+    def reserve(self, count: int) -> range:
+        connection = self.database.connection
+        with self.database.lock:
+            if connection.in_transaction:
+                connection.commit()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute("SELECT value FROM meta WHERE key = 'event_id_hwm'").fetchone()
+                if row is None:
+                    # First reservation: start above whatever ids are already stored
+                    row = connection.execute(
+                        "SELECT MAX(CAST(id AS INTEGER)) FROM events WHERE id NOT GLOB '*[^0-9]*'"
+                    ).fetchone()
+                high_water_mark = row[0] or 0
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('event_id_hwm', ?)",
+                    (high_water_mark + count,)
+                )
+                connection.commit()
+            except BaseException:
+                connection.rollback()
+                raise
+        return range(high_water_mark + 1, high_water_mark + count + 1)
+
+    def release(self):
+        """Give back the unused rest of the current block, if nobody reserved past it."""
+        if self.next_id >= self.block_end:
+            return
+        with self.database.lock, self.database.connection:
+            self.database.connection.execute(
+                "UPDATE meta SET value = ? WHERE key = 'event_id_hwm' AND value = ?",
+                (self.next_id - 1, self.block_end - 1)
+            )
+        self.next_id = self.block_end = 0
+
+    def allocate(self) -> str:
+        if self.next_id >= self.block_end:
+            block = self.reserve(self.block_size)
+            self.next_id, self.block_end = block.start, block.stop
+        event_id = self.next_id
+        self.next_id += 1
+        return str(event_id)
+
+def migrate_from_json(
+    database: SQLiteDatabase,
+    event_repository: EventRepository,
+    user_repository: UserRepository
+):
+    """Copy everything held by the JSON repositories into the database in one transaction."""
+    events = event_repository.get_all_events().values()
+    users = user_repository.get_all_users().values()
+    with database.lock, database.connection:
+        database.connection.executemany(
+            "INSERT OR REPLACE INTO events (id, title, description, date, location) VALUES (?, ?, ?, ?, ?)",
+            (
+                (event.id, event.title, event.description or '', event.date or '', event.location or '')
+                for event in events
+            )
+        )
+        database.connection.executemany(
+            "INSERT OR IGNORE INTO event_users (event_id, username, position) VALUES (?, ?, ?)",
+            (
+                (event.id, username, position)
+                for event in events
+                for position, username in enumerate(event.assigned_users)
+            )
+        )
+        database.connection.executemany(
+            "INSERT OR REPLACE INTO users (username, password, role) VALUES (?, ?, ?)",
+            ((user.username, user.password, user.role) for user in users)
+        )
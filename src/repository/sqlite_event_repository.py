@@ -0,0 +1,293 @@
+from collections.abc import Mapping
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from src.model.event import Event
+from src.repository.event_repository import EventDraft, allocate_events, event_id_sort_key
+from src.repository.pagination import EventPage, decode_cursor, encode_cursor
+from src.repository.sqlite_database import SQLiteDatabase, SQLiteIdAllocator
+
+# Column order of the rows rows_to_events() takes
+EVENT_COLUMNS = "id, title, description, date, location"
+UPSERT_EVENT_SQL = f"INSERT OR REPLACE INTO events ({EVENT_COLUMNS}) VALUES (?, ?, ?, ?, ?)"
+
+def event_row(event: Event) -> tuple:
+    return event.id, event.title, event.description or '', event.date or '', event.location or ''
+
+# event_id_sort_key in SQL, over events aliased as e, plus the id as tie-break
+NON_NUMERIC_ID_SQL = "(e.id = '' OR e.id GLOB '*[^0-9]*')"
+PAGE_ORDER_SQL = (
+    NON_NUMERIC_ID_SQL,
+    f"CASE WHEN {NON_NUMERIC_ID_SQL} THEN 0 ELSE CAST(e.id AS INTEGER) END",
+    f"CASE WHEN {NON_NUMERIC_ID_SQL} THEN e.id ELSE '' END",
+    "e.id",
+)
+
+class SQLiteEventMapping(Mapping):
+    """Read-only, lazily evaluated view of the events table.
+
+    Iterating values()/items() streams rows in chunks instead of loading the
+    whole catalog into memory.
+    """
+
+    def __init__(self, repository: 'SQLiteEventRepository'):
+        self.repository = repository
+
+    def __getitem__(self, event_id: str) -> Event:
+        event = self.repository.get_event(event_id)
+        if event is None:
+            raise KeyError(event_id)
+        return event
+
+    def __contains__(self, event_id) -> bool:
+        return self.repository.get_event(event_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for event in self.repository.iter_events():
+            yield event.id
+
+    def __len__(self) -> int:
+        return self.repository.count_events()
+
+    def values(self):
+        return self.repository.iter_events()
+
+    def items(self):
+        return ((event.id, event) for event in self.repository.iter_events())
+
+class SQLiteEventRepository:
+    def __init__(self, database: SQLiteDatabase, chunk_size: int = 500):
+        self.database = database
+        self.connection = database.connection
+        self.lock = database.lock
+        self.chunk_size = chunk_size
+        self.id_allocator = SQLiteIdAllocator(database)
+
+    def load_assignments(self, event_ids: List[str]) -> Dict[str, List[str]]:
+        assignments = {event_id: [] for event_id in event_ids}
+        if not event_ids:
+            return assignments
+        placeholders = ",".join("?" * len(event_ids))
+        rows = self.connection.execute(
+            f"SELECT event_id, username FROM event_users WHERE event_id IN ({placeholders}) "
+            "ORDER BY event_id, position",
+            event_ids
+        )
+        for event_id, username in rows:
+            assignments[event_id].append(username)
+        return assignments
+
+    def rows_to_events(self, rows) -> List[Event]:
+        assignments = self.load_assignments([row[0] for row in rows])
+        return [
+            Event(
+                id=event_id,
+                title=title,
+                description=description,
+                assigned_users=assignments[event_id],
+                date=date,
+                location=location
+            )
+            for event_id, title, description, date, location in rows
+        ]
+
+    def iter_events(self) -> Iterator[Event]:
+        last_rowid = 0
+        while True:
+            with self.lock:
+                rows = self.connection.execute(
+                    f"SELECT rowid, {EVENT_COLUMNS} FROM events WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, self.chunk_size)
+                ).fetchall()
+                if not rows:
+                    return
+                last_rowid = rows[-1][0]
+                events = self.rows_to_events([row[1:] for row in rows])
+            yield from events
+
+    def get_events_page(self, limit: int = 50, cursor: Optional[str] = None, username: Optional[str] = None) -> EventPage:
+        """One page of events in the same order as EventRepository.get_events_page"""
+        source = "events e"
+        conditions = []
+        params = []
+        if username is not None:
+            source = "event_users eu JOIN events e ON e.id = eu.event_id"
+            conditions.append("eu.username = ?")
+            params.append(username)
+        direction, boundary = decode_cursor(cursor) if cursor is not None else ('after', None)
+        order_columns = ", ".join(PAGE_ORDER_SQL)
+
+        def beyond(operator: str, entry) -> Tuple[str, list]:
+            sort_key, event_id = entry
+            return f"({order_columns}) {operator} (?, ?, ?, ?)", list(sort_key) + [event_id]
+
+        def where(extra: Optional[Tuple[str, list]] = None) -> Tuple[str, list]:
+            clauses = list(conditions)
+            values = list(params)
+            if extra is not None:
+                clauses.append(extra[0])
+                values.extend(extra[1])
+            return (" WHERE " + " AND ".join(clauses) if clauses else ""), values
+
+        descending = direction == 'before'
+        with self.lock:
+            where_sql, values = where(beyond('<' if descending else '>', boundary) if boundary else None)
+            ordering = ", ".join(f"{column} {'DESC' if descending else 'ASC'}" for column in PAGE_ORDER_SQL)
+            # One extra row says whether there is more in this direction
+            rows = self.connection.execute(
+                f"SELECT e.id, e.title, e.description, e.date, e.location, {order_columns} FROM {source}{where_sql} "
+                f"ORDER BY {ordering} LIMIT ?",
+                values + [limit + 1]
+            ).fetchall()
+            more = len(rows) > limit
+            rows = rows[:limit]
+            if descending:
+                rows.reverse()
+            if not rows:
+                return EventPage([])
+            first = (tuple(rows[0][5:8]), rows[0][0])
+            last = (tuple(rows[-1][5:8]), rows[-1][0])
+            # Whether anything lies on the side the cursor came from
+            if boundary is None:
+                more_behind = False
+            else:
+                where_sql, values = where(beyond('>' if descending else '<', last if descending else first))
+                more_behind = self.connection.execute(
+                    f"SELECT 1 FROM {source}{where_sql} LIMIT 1", values
+                ).fetchone() is not None
+            events = self.rows_to_events([row[:5] for row in rows])
+        has_next, has_prev = (more_behind, more) if descending else (more, more_behind)
+        return EventPage(
+            events,
+            encode_cursor('after', last) if has_next else None,
+            encode_cursor('before', first) if has_prev else None
+        )
+
+    def count_events(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def write_assignments(self, event: Event):
+        self.connection.execute("DELETE FROM event_users WHERE event_id = ?", (event.id,))
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO event_users (event_id, username, position) VALUES (?, ?, ?)",
+            ((event.id, username, position) for position, username in enumerate(event.assigned_users))
+        )
+
+    def create_event(self, title: str, description: str = "", date: str = "", location: str = "") -> Event:
+        next_id = self.id_allocator.allocate()
+        with self.lock, self.connection:
+            event = Event(
+                id=next_id,
+                title=title,
+                description=description,
+                assigned_users=[],
+                date=date,
+                location=location
+            )
+            self.connection.execute(
+                f"INSERT INTO events ({EVENT_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                event_row(event)
+            )
+            return event
+
+    def create_events(self, drafts: Iterable[EventDraft]) -> List[Event]:
+        """Create an event per draft, all inserted in a single transaction"""
+        # Ids are reserved first, reserving commits whatever transaction is open
+        events = allocate_events(drafts, self.id_allocator)
+        with self.lock, self.connection:
+            self.connection.executemany(
+                f"INSERT INTO events ({EVENT_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                (event_row(event) for event in events)
+            )
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO event_users (event_id, username, position) VALUES (?, ?, ?)",
+                (
+                    (event.id, username, position)
+                    for event in events
+                    for position, username in enumerate(event.assigned_users)
+                )
+            )
+        return events
+
+    @contextmanager
+    def batch(self):
+        """Hold the lock for a read-modify-write, like EventRepository.batch"""
+        with self.lock:
+            yield
+
+    def get_event(self, event_id: str) -> Optional[Event]:
+        with self.lock:
+            row = self.connection.execute(
+                f"SELECT {EVENT_COLUMNS} FROM events WHERE id = ?", (event_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            return self.rows_to_events([row])[0]
+
+    def get_all_events(self) -> Mapping:
+        return SQLiteEventMapping(self)
+
+    def update_event(self, event: Event) -> Event:
+        with self.lock, self.connection:
+            self.connection.execute(UPSERT_EVENT_SQL, event_row(event))
+            self.write_assignments(event)
+            return event
+
+    def update_events(self, events: Iterable[Event]) -> List[Event]:
+        """update_event for every event, in a single transaction"""
+        events = list(events)
+        with self.lock, self.connection:
+            self.connection.executemany(UPSERT_EVENT_SQL, (event_row(event) for event in events))
+            for event in events:
+                self.write_assignments(event)
+            return events
+
+    def delete_event(self, event_id: str) -> bool:
+        with self.lock, self.connection:
+            cursor = self.connection.execute("DELETE FROM events WHERE id = ?", (event_id,))
+            return cursor.rowcount > 0
+
+    def delete_events(self, event_ids: Iterable[str]) -> Dict[str, bool]:
+        """delete_event for every id, in a single transaction; id -> whether it existed"""
+        results = {}
+        with self.lock, self.connection:
+            for event_id in event_ids:
+                cursor = self.connection.execute("DELETE FROM events WHERE id = ?", (event_id,))
+                results[event_id] = cursor.rowcount > 0
+        return results
+
+    def assign_users_to_event(self, event_id: str, usernames: List[str]) -> bool:
+        event = self.get_event(event_id)
+        if event:
+            event.assigned_users = usernames
+            self.update_event(event)
+            return True
+        return False
+
+    def get_user_event_ids(self, username: str) -> List[str]:
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT event_id FROM event_users WHERE username = ?", (username,)
+            ).fetchall()
+        return sorted((event_id for (event_id,) in rows), key=event_id_sort_key)
+
+    def remove_user(self, username: str):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM event_users WHERE username = ?", (username,))
+
+    def get_user_events(self, username: str) -> Dict[str, Event]:
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT e.id, e.title, e.description, e.date, e.location FROM event_users eu "
+                "JOIN events e ON e.id = eu.event_id WHERE eu.username = ? ORDER BY e.rowid",
+                (username,)
+            ).fetchall()
+            return {event.id: event for event in self.rows_to_events(rows)}
+
+    def flush(self):
+        with self.lock:
+            self.connection.commit()
+
+    def close(self):
+        self.flush()
+        self.id_allocator.release()
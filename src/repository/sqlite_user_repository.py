@@ -0,0 +1,83 @@
+from typing import Dict, Optional
+from src.model.user import User
+from src.repository.event_repository import event_id_sort_key
+from src.repository.sqlite_database import SQLiteDatabase
+
+class SQLiteUserRepository:
+    def __init__(self, database: SQLiteDatabase):
+        self.database = database
+        self.connection = database.connection
+        self.lock = database.lock
+
+    def row_to_user(self, row) -> User:
+        username, password, role = row
+        # assigned_events comes straight from the indexed assignment table
+        assigned_events = sorted(
+            (
+                event_id for (event_id,) in self.connection.execute(
+                    "SELECT event_id FROM event_users WHERE username = ?", (username,)
+                )
+            ),
+            key=event_id_sort_key
+        )
+        return User(
+            username=username,
+            password=password,
+            role=role,
+            assigned_events=assigned_events
+        )
+
+    def get_user(self, username: str) -> Optional[User]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT username, password, role FROM users WHERE username = ?", (username,)
+            ).fetchone()
+            return self.row_to_user(row) if row else None
+
+    def get_all_users(self) -> Dict[str, User]:
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT username, password, role FROM users ORDER BY rowid"
+            ).fetchall()
+            return {row[0]: self.row_to_user(row) for row in rows}
+
+    def create_user(self, username: str, password: str, role: str = "user") -> User:
+        user = User(
+            username=username,
+            password=password,
+            role=role,
+            assigned_events=[]
+        )
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO users (username, password, role) VALUES (?, ?, ?)",
+                (user.username, user.password, user.role)
+            )
+        return user
+
+    def update_user(self, user: User) -> User:
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO users (username, password, role) VALUES (?, ?, ?)",
+                (user.username, user.password, user.role)
+            )
+        return user
+
+    def delete_user(self, username: str) -> bool:
+        with self.lock, self.connection:
+            cursor = self.connection.execute("DELETE FROM users WHERE username = ?", (username,))
+            self.connection.execute("DELETE FROM event_users WHERE username = ?", (username,))
+            return cursor.rowcount > 0
+
+    def user_exists(self, username: str) -> bool:
+        with self.lock:
+            return self.connection.execute(
+                "SELECT 1 FROM users WHERE username = ?", (username,)
+            ).fetchone() is not None
+
+    def flush(self):
+        with self.lock:
+            self.connection.commit()
+
+    def close(self):
+        self.flush()
@@ -1,13 +1,31 @@
 import json
+import threading
 from typing import Dict, Optional
 from src.model.user import User
+from src.repository.binary_snapshot import Snapshot, source_stamp, write_snapshot
+from src.repository.event_repository import EventRepository
+from src.repository.write_behind import WriteBehind, atomic_write_json
 
 class UserRepository:
-    def __init__(self):
+    def __init__(
+        self,
+        flush_delay: float = 0.5,
+        max_pending: int = 50,
+        event_repository: Optional[EventRepository] = None
+    ):
         self.users_file = "users.json"
+        # Binary copy of users.json, loaded instead of it while it is current
+        self.snapshot_file = "users.snap"
+        # When set, assigned_events is served from the event repository's user index
+        self.event_repository = event_repository
+        self.lock = threading.RLock()
+        self.writer = WriteBehind(self.write_users, flush_delay, max_pending, self.lock)
         self.load_users()
 
     def load_users(self):
+        self.snapshot_stale = not self.load_snapshot()
+        if not self.snapshot_stale:
+            return
         try:
             with open(self.users_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -24,22 +42,68 @@ class UserRepository:
             self.users = {}
             self.save_users()
 
+    def load_snapshot(self) -> bool:
+        snapshot = Snapshot.open(self.snapshot_file, source_stamp(self.users_file))
+        if snapshot is None:
+            return False
+        try:
+            assigned = snapshot.links()
+            self.users = {}
+            for index, username in enumerate(snapshot.keys):
+                password, role = snapshot.fields(index)
+                self.users[username] = User(username, password, role, assigned.get(username, []))
+        finally:
+            snapshot.close()
+        return True
+
+    def save_snapshot(self):
+        with self.lock:
+            records = (
+                (username, (user.password, user.role), user.assigned_events)
+                for username, user in self.users.items()
+            )
+            write_snapshot(self.snapshot_file, records, source_stamp(self.users_file))
+            self.snapshot_stale = False
+
     def save_users(self):
-        data = {
-            username: {
-                'password': user.password,
-                'role': user.role,
-                'assigned_events': user.assigned_events
+        # Deferred: the write-behind layer coalesces this with nearby mutations
+        self.snapshot_stale = True
+        self.writer.mark_dirty()
+
+    def sync_assigned_events(self, user: User) -> User:
+        if self.event_repository is not None:
+            user.assigned_events = self.event_repository.get_user_event_ids(user.username)
+        return user
+
+    def write_users(self):
+        with self.lock:
+            for user in self.users.values():
+                self.sync_assigned_events(user)
+            data = {
+                username: {
+                    'password': user.password,
+                    'role': user.role,
+                    'assigned_events': user.assigned_events
+                }
+                for username, user in self.users.items()
             }
-            for username, user in self.users.items()
-        }
-        with open(self.users_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+            atomic_write_json(self.users_file, data)
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        self.flush()
+        if self.snapshot_stale and source_stamp(self.users_file) is not None:
+            self.save_snapshot()
 
     def get_user(self, username: str) -> Optional[User]:
-        return self.users.get(username)
+        user = self.users.get(username)
+        return self.sync_assigned_events(user) if user else None
 
     def get_all_users(self) -> Dict[str, User]:
+        for user in self.users.values():
+            self.sync_assigned_events(user)
         return self.users
 
     def create_user(self, username: str, password: str, role: str = "user") -> User:
@@ -49,21 +113,26 @@ class UserRepository:
             role=role,
             assigned_events=[]
         )
-        self.users[username] = user
-        self.save_users()
+        with self.lock:
+            self.users[username] = user
+            self.save_users()
         return user
 
     def update_user(self, user: User) -> User:
-        self.users[user.username] = user
-        self.save_users()
+        with self.lock:
+            self.users[user.username] = user
+            self.save_users()
         return user
 
     def delete_user(self, username: str) -> bool:
-        if username in self.users:
-            del self.users[username]
-            self.save_users()
-            return True
-        return False
+        with self.lock:
+            if username in self.users:
+                del self.users[username]
+                if self.event_repository is not None:
+                    self.event_repository.remove_user(username)
+                self.save_users()
+                return True
+            return False
 
     def user_exists(self, username: str) -> bool:
         return username in self.users 
\ No newline at end of file
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+def atomic_write_json(path: str, data) -> None:
+    """Write JSON to a temp file next to `path`, then rename it into place."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+class WriteBehind:
+    """Coalesces repository mutations into a single deferred flush.
+
+    A flush runs `delay` seconds after the first pending change, or right away
+    once `max_pending` changes have piled up. A delay of 0 flushes synchronously.
+    Inside batch(), mutations only count once, when the batch ends.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[], None],
+        delay: float = 0.5,
+        max_pending: int = 50,
+        lock: Optional[threading.RLock] = None
+    ):
+        self.flush_fn = flush_fn
+        self.delay = delay
+        self.max_pending = max_pending
+        self.lock = lock or threading.RLock()
+        self.pending = 0
+        self.timer: Optional[threading.Timer] = None
+        # Nesting depth of batch() blocks, and whether one was marked dirty
+        self.batch_depth = 0
+        self.batch_dirty = False
+
+    @property
+    def dirty(self) -> bool:
+        return self.pending > 0
+
+    def mark_dirty(self):
+        with self.lock:
+            if self.batch_depth:
+                self.batch_dirty = True
+                return
+            self.pending += 1
+            if self.delay <= 0 or self.pending >= self.max_pending:
+                self.flush()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    @contextmanager
+    def batch(self):
+        """Hold the lock and coalesce every mark_dirty() in the block into one"""
+        with self.lock:
+            self.batch_depth += 1
+            try:
+                yield
+            finally:
+                self.batch_depth -= 1
+                # Mutations applied before an error still have to be persisted
+                if not self.batch_depth and self.batch_dirty:
+                    self.batch_dirty = False
+                    self.mark_dirty()
+
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.pending:
+                return
+            self.pending = 0
+            self.flush_fn()
@@ -0,0 +1,326 @@
+from html.parser import HTMLParser
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+# Event containers, highest priority first: only the first kind that occurs
+# on the page is used, like the old chain of find_all calls
+CONTAINER_SELECTORS: List[Tuple[str, Optional[str]]] = [
+    ('div', 'event-item'),
+    ('div', 'event-card'),
+    ('article', None),
+    ('div', 'event'),
+    ('div', 'event-list-item'),
+    ('div', 'event-section'),
+]
+
+TITLE_EXCLUDED_KEYWORDS = ['địa điểm', 'location', 'date', 'time']
+DATE_KEYWORDS = ['ngày', 'date', 'thời gian', 'time']
+LOCATION_KEYWORDS = ['địa điểm', 'location', 'venue']
+FALLBACK_KEYWORDS = ['sự kiện', 'event', 'hội thảo', 'seminar']
+
+VOID_TAGS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+])
+BLOCK_TAGS = frozenset([
+    'div', 'section', 'article', 'p', 'ul', 'ol', 'li', 'table',
+    'header', 'footer', 'main', 'aside', 'nav', 'form'
+])
+SKIPPED_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+
+class FieldRule:
+    """One way of finding a field inside an event container.
+
+    Lower ranks win; within a rank the element that starts first wins.
+    `leaf_only` stands in for BeautifulSoup's `string=` filter, which only
+    matches elements without child tags.
+    """
+
+    def __init__(
+        self,
+        rank: int,
+        tags: Optional[FrozenSet[str]] = None,
+        classes: Optional[FrozenSet[str]] = None,
+        text_test: Optional[Callable[[str], bool]] = None,
+        leaf_only: bool = False
+    ):
+        self.rank = rank
+        self.tags = tags
+        self.classes = classes
+        self.text_test = text_test
+        self.leaf_only = leaf_only
+
+    def matches_element(self, tag: str, classes: FrozenSet[str], has_children: bool) -> bool:
+        if self.tags is not None and tag not in self.tags:
+            return False
+        if self.classes is not None and not (self.classes & classes):
+            return False
+        if self.leaf_only and has_children:
+            return False
+        return True
+
+def contains_any(keywords: List[str]) -> Callable[[str], bool]:
+    return lambda text: any(keyword in text.lower() for keyword in keywords)
+
+def looks_like_title(text: str) -> bool:
+    return 5 < len(text) < 100 and not contains_any(TITLE_EXCLUDED_KEYWORDS)(text)
+
+# Compiled once; the rank order reproduces the old find()/or-chains per field
+FIELD_RULES: Dict[str, List[FieldRule]] = {
+    'title': [
+        FieldRule(0, classes=frozenset(['title'])),
+        FieldRule(1, classes=frozenset(['event-title'])),
+        FieldRule(2, classes=frozenset(['event-name'])),
+        FieldRule(3, classes=frozenset(['event-heading'])),
+        FieldRule(4, tags=frozenset(['h1'])),
+        FieldRule(5, tags=frozenset(['h2'])),
+        FieldRule(6, tags=frozenset(['h3'])),
+        FieldRule(7, tags=frozenset(['h4'])),
+        FieldRule(8, tags=frozenset(['h5'])),
+        FieldRule(9, tags=frozenset(['h6'])),
+        FieldRule(10, tags=frozenset(['div', 'span', 'p']), text_test=looks_like_title),
+    ],
+    'date': [
+        FieldRule(0, tags=frozenset(['time'])),
+        FieldRule(1, tags=frozenset(['span', 'div']), classes=frozenset(['date', 'event-date', 'time', 'event-time'])),
+        FieldRule(2, tags=frozenset(['div']), text_test=contains_any(DATE_KEYWORDS), leaf_only=True),
+    ],
+    'location': [
+        FieldRule(0, tags=frozenset(['span', 'div']), classes=frozenset(['location', 'event-location', 'venue', 'event-venue'])),
+        FieldRule(1, tags=frozenset(['div']), text_test=contains_any(LOCATION_KEYWORDS), leaf_only=True),
+    ],
+    'description': [
+        FieldRule(0, tags=frozenset(['div', 'p']), classes=frozenset(['description', 'event-description', 'content', 'event-content'])),
+        FieldRule(1, tags=frozenset(['p'])),
+    ],
+}
+
+class ElementFrame:
+    __slots__ = ('tag', 'classes', 'order', 'text_start', 'has_children', 'has_block_child', 'container', 'fields')
+
+    def __init__(self, tag: str, classes: FrozenSet[str], order: int, text_start: int, container: Optional[int]):
+        self.tag = tag
+        self.classes = classes
+        self.order = order
+        self.text_start = text_start
+        self.has_children = False
+        self.has_block_child = False
+        # Index into CONTAINER_SELECTORS when this element is an event container
+        self.container = container
+        # field -> (rank, order, text) of the best match so far
+        self.fields: Dict[str, Tuple[int, int, str]] = {}
+
+class EventExtractor(HTMLParser):
+    """Single-pass event extractor built on the incremental stdlib HTML parser.
+
+    No document tree is built: elements are matched against the compiled
+    container selectors and field rules as they open and close, and each
+    element's text is only assembled when some rule actually needs it.
+    Feed the page with feed(), then call close() and read events().
+
+    With `streaming=True` the page can be fed in chunks and finished events
+    are collected with take_events() as soon as their container closes. The
+    extractor then locks onto the highest-priority container kind among the
+    first finished block (instead of the whole page), drops every container
+    it has emitted and trims text that no open element can still need, so
+    memory stays flat however long the page is.
+    """
+
+    def __init__(self, streaming: bool = False):
+        super().__init__(convert_charrefs=True)
+        self.streaming = streaming
+        self.stack: List[ElementFrame] = []
+        self.texts: List[str] = []
+        # Number of leading text pieces already trimmed from self.texts
+        self.text_offset = 0
+        # Raw data since the last tag; a text run may arrive split across feeds
+        self.pending_data: List[str] = []
+        self.order = 0
+        self.skip_depth = 0
+        # Open event containers, outermost first
+        self.open_containers: List[ElementFrame] = []
+        # Closed containers per kind, in document order
+        self.containers: List[List[ElementFrame]] = [[] for _ in CONTAINER_SELECTORS]
+        # Leaf-level text blocks for the keyword fallback
+        self.fallback_blocks: List[Tuple[int, str]] = []
+        # Streaming state: the container kind in use and events not yet taken
+        self.locked_kind: Optional[int] = None
+        self.emitted = False
+        self.ready: List[Dict[str, Optional[str]]] = []
+
+    def container_kind(self, tag: str, classes: FrozenSet[str]) -> Optional[int]:
+        for kind, (selector_tag, selector_class) in enumerate(CONTAINER_SELECTORS):
+            if tag == selector_tag and (selector_class is None or selector_class in classes):
+                return kind
+        return None
+
+    def handle_starttag(self, tag, attrs):
+        self.flush_data()
+        if tag in SKIPPED_TEXT_TAGS:
+            self.skip_depth += 1
+        classes = frozenset()
+        for name, value in attrs:
+            if name == 'class' and value:
+                classes = frozenset(value.split())
+                break
+        if self.stack:
+            parent = self.stack[-1]
+            parent.has_children = True
+            if tag in BLOCK_TAGS:
+                parent.has_block_child = True
+        self.order += 1
+        frame = ElementFrame(tag, classes, self.order, self.text_offset + len(self.texts), self.container_kind(tag, classes))
+        if tag in VOID_TAGS:
+            self.close_frame(frame)
+            return
+        self.stack.append(frame)
+        if frame.container is not None:
+            self.open_containers.append(frame)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        self.flush_data()
+        if tag in SKIPPED_TEXT_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+        # Tolerate sloppy markup: close everything up to the matching open tag
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if self.stack[depth].tag == tag:
+                while len(self.stack) > depth:
+                    self.close_frame(self.stack.pop())
+                return
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.pending_data.append(data)
+
+    def flush_data(self):
+        if not self.pending_data:
+            return
+        text = ''.join(self.pending_data).strip()
+        self.pending_data = []
+        if text:
+            self.texts.append(text)
+
+    def element_text(self, frame: ElementFrame) -> str:
+        return ''.join(self.texts[frame.text_start - self.text_offset:])
+
+    def close_frame(self, frame: ElementFrame):
+        if frame.container is not None and self.open_containers and self.open_containers[-1] is frame:
+            self.open_containers.pop()
+        text = None
+        # Offer the element to every event container it sits in
+        for container in self.open_containers:
+            for field, rules in FIELD_RULES.items():
+                best = container.fields.get(field)
+                for rule in rules:
+                    if best is not None and (rule.rank, frame.order) >= best[:2]:
+                        break
+                    if not rule.matches_element(frame.tag, frame.classes, frame.has_children):
+                        continue
+                    if text is None:
+                        text = self.element_text(frame)
+                    if rule.text_test is not None and not (text and rule.text_test(text)):
+                        continue
+                    container.fields[field] = (rule.rank, frame.order, text)
+                    break
+        if frame.container is not None:
+            self.containers[frame.container].append(frame)
+            if self.streaming and not self.open_containers:
+                self.release_containers()
+        if frame.tag == 'div' and not frame.has_block_child and not self.emitted:
+            if text is None:
+                text = self.element_text(frame)
+            if len(text) > 5 and contains_any(FALLBACK_KEYWORDS)(text):
+                self.fallback_blocks.append((frame.order, text))
+
+    def release_containers(self):
+        # An outermost container has closed, so every container inside it is final
+        if self.locked_kind is None:
+            self.locked_kind = next(kind for kind, containers in enumerate(self.containers) if containers)
+        for container in sorted(self.containers[self.locked_kind], key=lambda frame: frame.order):
+            fields = self.container_fields(container)
+            if fields is not None:
+                self.ready.append(fields)
+                self.emitted = True
+        if self.emitted:
+            self.fallback_blocks = []
+        for containers in self.containers:
+            containers.clear()
+
+    def trim_texts(self):
+        # Text before the earliest element that may still ask for it is dead
+        needed = self.text_offset + len(self.texts)
+        first_container = self.open_containers[0].order if self.open_containers else None
+        for frame in self.stack:
+            if (first_container is not None and frame.order >= first_container) or (
+                    frame.tag == 'div' and not frame.has_block_child and not self.emitted):
+                needed = frame.text_start
+                break
+        if needed > self.text_offset:
+            del self.texts[:needed - self.text_offset]
+            self.text_offset = needed
+
+    def feed(self, data):
+        super().feed(data)
+        if self.streaming:
+            self.trim_texts()
+
+    def close(self):
+        super().close()
+        self.flush_data()
+        while self.stack:
+            self.close_frame(self.stack.pop())
+        if self.streaming and not self.emitted:
+            self.ready.extend(self.fallback_events())
+
+    def take_events(self) -> List[Dict[str, Optional[str]]]:
+        """Streaming mode: events finished since the last call"""
+        events, self.ready = self.ready, []
+        return events
+
+    def container_fields(self, container: ElementFrame) -> Optional[Dict[str, Optional[str]]]:
+        fields = {
+            field: container.fields[field][2] if field in container.fields else None
+            for field in FIELD_RULES
+        }
+        return fields if any(fields.values()) else None
+
+    def fallback_events(self) -> List[Dict[str, Optional[str]]]:
+        return [
+            {'title': text, 'date': None, 'location': None, 'description': None}
+            for _, text in sorted(self.fallback_blocks)
+        ]
+
+    def events(self) -> List[Dict[str, Optional[str]]]:
+        """Extracted events as dicts with title, date, location and description"""
+        for containers in self.containers:
+            if not containers:
+                continue
+            events = []
+            for container in sorted(containers, key=lambda frame: frame.order):
+                fields = self.container_fields(container)
+                if fields is not None:
+                    events.append(fields)
+            if events:
+                return events
+            break  # Only the first container kind present on the page counts
+        # No structured events: fall back to leaf text blocks mentioning events
+        return self.fallback_events()
+
+def extract_events(html: str) -> List[Dict[str, Optional[str]]]:
+    extractor = EventExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.events()
+
+def iter_extract_events(chunks: Iterable[str]) -> Iterator[Dict[str, Optional[str]]]:
+    """Yield events while the page is still arriving, one text chunk at a time"""
+    extractor = EventExtractor(streaming=True)
+    for chunk in chunks:
+        extractor.feed(chunk)
+        yield from extractor.take_events()
+    extractor.close()
+    yield from extractor.take_events()
@@ -0,0 +1,121 @@
+import csv
+import json
+import os
+import time
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+from src.model.event import Event
+from src.repository.event_repository import EventDraft
+from src.service.event_query import check_event_date
+
+IMPORT_FORMATS = ("csv", "jsonl")
+# Separates usernames inside the assigned_users column of a CSV file
+CSV_ASSIGNEE_SEPARATOR = ";"
+
+# Called with the rows read so far and the seconds since the import started
+ProgressCallback = Callable[[int, float], None]
+
+class ImportReport:
+    """Outcome of a bulk import: rows read, events created, rejected rows"""
+
+    def __init__(self):
+        self.rows = 0
+        self.imported = 0
+        # (line number, reason) of every row that was skipped
+        self.errors: List[Tuple[int, str]] = []
+        self.elapsed = 0.0
+        # The created events, for the caller to index on its own thread
+        self.events: List[Event] = []
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Imported {self.imported} of {self.rows} rows in {self.elapsed:.1f}s "
+            f"({self.rows_per_second:.0f} rows/s), {len(self.errors)} rejected"
+        )
+
+def detect_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Cannot tell the format of {path}, expected a .csv or .jsonl file")
+
+def read_rows(path: str, file_format: Optional[str] = None) -> Iterator[Tuple[int, object]]:
+    """(line number, row) of every record in the file, read one at a time.
+
+    CSV rows are dicts keyed by the header line. JSON Lines rows are the
+    parsed values, or None for a line that is not valid JSON.
+    """
+    file_format = file_format or detect_format(path)
+    if file_format not in IMPORT_FORMATS:
+        raise ValueError(f"Unknown import format: {file_format}")
+    # utf-8-sig: spreadsheet exports often start with a byte order mark
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if file_format == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError:
+                yield line_number, None
+
+def validate_row(row, known_users: Optional[Set[str]] = None) -> EventDraft:
+    """The draft of one import row; raises ValueError saying what is wrong with it"""
+    if not isinstance(row, dict):
+        raise ValueError("not a JSON object")
+    title = row.get('title')
+    if not isinstance(title, str) or not title.strip():
+        raise ValueError("missing title")
+    description = row.get('description') or ""
+    if not isinstance(description, str):
+        raise ValueError("description must be text")
+    assigned_users = row.get('assigned_users') or []
+    if isinstance(assigned_users, str):
+        assigned_users = [name.strip() for name in assigned_users.split(CSV_ASSIGNEE_SEPARATOR)]
+    elif not isinstance(assigned_users, list) or not all(isinstance(name, str) for name in assigned_users):
+        raise ValueError("assigned_users must be a list of usernames")
+    # Drop blanks and repeats, keep the order
+    assigned_users = list(dict.fromkeys(name for name in assigned_users if name))
+    if known_users is not None:
+        unknown = [name for name in assigned_users if name not in known_users]
+        if unknown:
+            raise ValueError("unknown users: " + ", ".join(unknown))
+    event_date = row.get('date') or ""
+    if not isinstance(event_date, str):
+        raise ValueError("date must be text")
+    event_date = check_event_date(event_date)
+    location = row.get('location') or ""
+    if not isinstance(location, str):
+        raise ValueError("location must be text")
+    return title.strip(), description, assigned_users, event_date, location.strip()
+
+def iter_drafts(
+    path: str,
+    report: ImportReport,
+    file_format: Optional[str] = None,
+    known_users: Optional[Set[str]] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    progress_every: int = 1000
+) -> Iterator[EventDraft]:
+    """Drafts of the valid rows of a file; rejected rows are recorded in `report`"""
+    started = time.perf_counter()
+    for line_number, row in read_rows(path, file_format):
+        report.rows += 1
+        try:
+            draft = validate_row(row, known_users)
+        except ValueError as e:
+            report.errors.append((line_number, str(e)))
+        else:
+            yield draft
+        if on_progress is not None and report.rows % progress_every == 0:
+            on_progress(report.rows, time.perf_counter() - started)
@@ -0,0 +1,217 @@
+import re
+import unicodedata
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+from src.service.search_index import normalize_text
+
+# A date with no year is taken to be in the current year, unless that puts
+# it further in the past than this, then it is next year's
+PAST_DATE_TOLERANCE = timedelta(days=90)
+
+ENGLISH_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+MONTH_NAME = '|'.join(sorted(ENGLISH_MONTHS, key=len, reverse=True))
+ORDINAL = r'(?:st|nd|rd|th)?'
+
+# Clock times would otherwise read as day/month pairs: 19:30, 7:00 pm, 19h30, 9 giờ sáng
+TIME_PATTERN = re.compile(r'\b\d{1,2}\s*(?::\d{2}|h\d{0,2}\b|giờ)(?:\s*(?:am|pm|sáng|chiều|tối))?|\b\d{1,2}\s*(?:am|pm)\b')
+# "ngày 12 tháng 10 năm 2025", "12 tháng 10, 2025"
+VIETNAMESE_DATE = re.compile(r'(\d{1,2})\s*tháng\s*(\d{1,2})(?:\s*(?:năm|,)\s*(\d{4}))?')
+# "12 October 2025", "12th of Oct"
+ENGLISH_DAY_FIRST = re.compile(rf'\b(\d{{1,2}}){ORDINAL}\s+(?:of\s+)?({MONTH_NAME})\b\.?(?:,?\s*(\d{{4}}))?')
+# "October 12, 2025", "Oct 12-14, 2025"
+ENGLISH_MONTH_FIRST = re.compile(
+    rf'\b({MONTH_NAME})\b\.?\s+(\d{{1,2}}){ORDINAL}(?:\s*[-–—]\s*(\d{{1,2}}){ORDINAL})?(?:,?\s*(\d{{4}}))?'
+)
+# Numeric forms every format above is rewritten to, in the order they may appear
+DATE_MENTION = re.compile(
+    r'(?<![\d.])(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})(?!\d)'
+    r'|(?<![\d.])(?P<day>\d{1,2})(?P<sep>[/.])(?P<month>\d{1,2})(?:(?P=sep)(?P<year>\d{4}))?(?![\d.]*\d)'
+    r'|(?<![\d.])(?P<dash_day>\d{1,2})-(?P<dash_month>\d{1,2})-(?P<dash_year>\d{4})(?!\d)'
+    # The first day of "12 - 14/10/2025", month and year come from the end
+    r'|(?<![\d.])(?P<range_day>\d{1,2})\s*(?:[-–—]|đến|to|until)\s*(?=\d{1,2}[/.-]\d)'
+)
+ISO_DAY = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Aliases of the cities events are usually in -> the name they are filed under
+CITY_ALIASES = {
+    'Hồ Chí Minh': ['hồ chí minh', 'ho chi minh', 'tp.hcm', 'tp. hcm', 'tphcm', 'tp hcm', 'hcm', 'hcmc', 'sài gòn', 'sai gon', 'saigon'],
+    'Hà Nội': ['hà nội', 'ha noi', 'hanoi'],
+    'Đà Nẵng': ['đà nẵng', 'da nang', 'danang'],
+    'Hải Phòng': ['hải phòng', 'hai phong'],
+    'Cần Thơ': ['cần thơ', 'can tho'],
+    'Huế': ['huế', 'hue'],
+    'Nha Trang': ['nha trang'],
+    'Đà Lạt': ['đà lạt', 'da lat', 'dalat'],
+    'Vũng Tàu': ['vũng tàu', 'vung tau'],
+}
+CITY_NAMES = {alias: city for city, aliases in CITY_ALIASES.items() for alias in aliases}
+CITY_PATTERNS = [
+    (city, re.compile(r'(?<!\w)(?:' + '|'.join(re.escape(alias) for alias in aliases) + r')(?!\w)', re.IGNORECASE))
+    for city, aliases in CITY_ALIASES.items()
+]
+# "TP. Hồ Chí Minh", "Thành phố Huế", "Hanoi City"
+CITY_AFFIXES = re.compile(r'^(?:tp\.?|thành phố|city of)\s+|\s+city$')
+# "Địa điểm: ...", "Location - ...", "Tại ..."; a whole word followed by a
+# separator or a space, so "Atlanta" or "AT&T Hall" keep their first letters
+LOCATION_LABEL = re.compile(
+    r'^\s*(?:địa điểm|location|venue|nơi tổ chức|tại|at)(?!\w)(?:\s*[:\-–]\s*|\s+)', re.IGNORECASE
+)
+
+Mention = Tuple[int, Optional[int], Optional[int]]
+
+def rewrite_month_names(text: str) -> str:
+    text = VIETNAMESE_DATE.sub(lambda m: f"{m.group(1)}/{m.group(2)}" + (f"/{m.group(3)}" if m.group(3) else ""), text)
+    text = ENGLISH_DAY_FIRST.sub(
+        lambda m: f"{m.group(1)}/{ENGLISH_MONTHS[m.group(2)]}" + (f"/{m.group(3)}" if m.group(3) else ""), text
+    )
+
+    def month_first(m) -> str:
+        month = ENGLISH_MONTHS[m.group(1)]
+        year = f"/{m.group(4)}" if m.group(4) else ""
+        if m.group(3):
+            return f"{m.group(2)}/{month}{year} - {m.group(3)}/{month}{year}"
+        return f"{m.group(2)}/{month}{year}"
+    return ENGLISH_MONTH_FIRST.sub(month_first, text)
+
+def date_mentions(text: str) -> List[Mention]:
+    """(day, month, year) of every date in the text, month and year None when left out"""
+    text = unicodedata.normalize('NFC', text).casefold()
+    text = rewrite_month_names(TIME_PATTERN.sub(' ', text))
+    mentions = []
+    for match in DATE_MENTION.finditer(text):
+        if match.group('iso_year'):
+            mention = (int(match.group('iso_day')), int(match.group('iso_month')), int(match.group('iso_year')))
+        elif match.group('day'):
+            year = match.group('year')
+            mention = (int(match.group('day')), int(match.group('month')), int(year) if year else None)
+        elif match.group('dash_day'):
+            mention = (int(match.group('dash_day')), int(match.group('dash_month')), int(match.group('dash_year')))
+        else:
+            mention = (int(match.group('range_day')), None, None)
+        day, month, _ = mention
+        # Prices and phone numbers such as 1.500.000 are not dates
+        if 1 <= day <= 31 and (month is None or 1 <= month <= 12):
+            mentions.append(mention)
+    return mentions
+
+def to_date(day: int, month: int, year: Optional[int], today: date) -> Optional[date]:
+    try:
+        if year is not None:
+            return date(year, month, day)
+        candidate = date(today.year, month, day)
+        if candidate < today - PAST_DATE_TOLERANCE:
+            candidate = date(today.year + 1, month, day)
+        return candidate
+    except ValueError:
+        return None
+
+def parse_event_date(text: Optional[str], today: Optional[date] = None) -> Optional[Tuple[date, date]]:
+    """(first day, last day) of the date an event listing gives, or None.
+
+    Reads day-first numeric dates (12/10/2025, 12.10, 2025-10-12), Vietnamese
+    ("Thứ Bảy, ngày 12 tháng 10 năm 2025") and English ("Sat, October 12,
+    2025 7:00 PM", "12 Oct") dates, and ranges such as "12 - 14/10/2025" or
+    "Oct 12-14, 2025". Clock times and weekdays are ignored; a missing year
+    is inferred from `today`.
+    """
+    if not text:
+        return None
+    mentions = date_mentions(text)[:2]
+    if not mentions:
+        return None
+    today = today or date.today()
+    start_day, start_month, start_year = mentions[0]
+    end_day, end_month, end_year = mentions[-1]
+    # "12 - 14/10/2025": the start borrows what it leaves out from the end
+    start_month = start_month or end_month
+    if start_month is None:
+        return None
+    end_month = end_month or start_month
+    if start_year is None and end_year is not None:
+        start_year = end_year if (start_month, start_day) <= (end_month, end_day) else end_year - 1
+    start = to_date(start_day, start_month, start_year, today)
+    if start is None:
+        return None
+    if len(mentions) == 1:
+        return start, start
+    end = to_date(end_day, end_month, end_year if end_year is not None else start.year, today)
+    if end is None:
+        return start, start
+    if end < start:
+        # "28/12 - 02/01": the range runs into the next year
+        end = to_date(end_day, end_month, start.year + 1, today) if end_year is None else None
+        if end is None or end < start:
+            return start, start
+    return start, end
+
+def format_date_range(start: date, end: date) -> str:
+    """How a range is stored in Event.date: YYYY-MM-DD, or YYYY-MM-DD/YYYY-MM-DD for several days"""
+    if start == end:
+        return start.isoformat()
+    return f"{start.isoformat()}/{end.isoformat()}"
+
+def date_range(value: Optional[str]) -> Optional[Tuple[date, date]]:
+    """The (first day, last day) a stored Event.date stands for, None when it has none"""
+    if not value:
+        return None
+    parts = value.split('/')
+    if len(parts) > 2 or not all(ISO_DAY.fullmatch(part) for part in parts):
+        return None
+    try:
+        days = [date(int(part[:4]), int(part[5:7]), int(part[8:])) for part in parts]
+    except ValueError:
+        return None
+    if days[-1] < days[0]:
+        return None
+    return days[0], days[-1]
+
+def normalize_event_date(text: Optional[str], today: Optional[date] = None) -> str:
+    """A scraped date as stored in Event.date, or "" when it cannot be read"""
+    if date_range(text) is not None:
+        return text
+    parsed = parse_event_date(text, today)
+    return format_date_range(*parsed) if parsed else ""
+
+def normalize_location(text: Optional[str]) -> str:
+    """A scraped location without its label, with the city under its usual name.
+
+    "Địa điểm: GEM Center, TP.HCM" becomes "GEM Center, Hồ Chí Minh".
+    """
+    if not text:
+        return ""
+    location = ' '.join(unicodedata.normalize('NFC', text).split())
+    location = LOCATION_LABEL.sub('', location, count=1)
+    # Only a part that is nothing but the city is renamed, not "Hanoi Opera House"
+    parts = [part.strip() for part in location.split(',')]
+    parts = [CITY_NAMES.get(CITY_AFFIXES.sub('', part.casefold()), part) for part in parts]
+    return ', '.join(part for part in parts if part).strip(' -–')
+
+def location_city(location: Optional[str]) -> str:
+    """The city of a location, or the whole location when no known city is in it"""
+    location = normalize_location(location)
+    parts = location.split(', ')
+    for part in reversed(parts):
+        if part in CITY_ALIASES:
+            return part
+    # Named inside a longer part, as in "Nhà hát Lớn Hà Nội"
+    for city, pattern in CITY_PATTERNS:
+        if pattern.search(location) is not None:
+            return city
+    return location
+
+def city_key(location: Optional[str]) -> str:
+    # Compared ignoring case and diacritics, so "ho chi minh" finds "Hồ Chí Minh"
+    return normalize_text(location_city(location))
+
+def month_range(today: Optional[date] = None, months_ahead: int = 0) -> Tuple[date, date]:
+    """(first day, last day) of this month, or of the month `months_ahead` after it"""
+    today = today or date.today()
+    month_index = today.year * 12 + today.month - 1 + months_ahead
+    first = date(month_index // 12, month_index % 12 + 1, 1)
+    following = date((month_index + 1) // 12, (month_index + 1) % 12 + 1, 1)
+    return first, following - timedelta(days=1)
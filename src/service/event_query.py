@@ -0,0 +1,288 @@
+import unicodedata
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.model.event import Event
+from src.repository.event_repository import event_id_sort_key
+from src.repository.pagination import OrderedIndex, paginate, sorted_entries
+from src.service.event_normalizer import city_key, date_range, location_city
+from src.service.search_index import normalize_text
+
+SORT_FIELDS = ("id", "title", "date", "assignees")
+
+# Base letters in Vietnamese alphabetical order: ă after a, đ after d, ư after u...
+VIETNAMESE_ALPHABET = "aăâbcdđeêfghijklmnoôơpqrstuưvwxyz"
+ALPHABET_INDEX = {letter: index for index, letter in enumerate(VIETNAMESE_ALPHABET)}
+# Letters are mapped into the private use area so they sort after digits and punctuation
+PRIMARY_BASE = 0xE000
+# Breve, circumflex and horn make a different letter, the rest are tones
+LETTER_MARKS = {'\u0306', '\u0302', '\u031b'}
+# No tone, huyền, hỏi, ngã, sắc, nặng
+TONE_ORDER = {'\u0300': '1', '\u0309': '2', '\u0303': '3', '\u0301': '4', '\u0323': '5'}
+
+def collation_key(text: str) -> str:
+    """Sort key putting Vietnamese text in dictionary order.
+
+    Letters compare first (case-insensitively, "đ" after "d"), then tones,
+    then the original text, so "Ba" < "bà" < "bả" < "Bắc" < "Bình" < "Đà".
+    A single string, so the key also fits in a page cursor.
+    """
+    decomposed = unicodedata.normalize('NFD', ' '.join((text or '').casefold().split()))
+    primary = []
+    tones = []
+    i = 0
+    while i < len(decomposed):
+        char = decomposed[i]
+        tone = '0'
+        i += 1
+        while i < len(decomposed) and unicodedata.combining(decomposed[i]):
+            mark = decomposed[i]
+            i += 1
+            if mark in LETTER_MARKS:
+                composed = unicodedata.normalize('NFC', char + mark)
+                if composed in ALPHABET_INDEX:
+                    char = composed
+            else:
+                tone = TONE_ORDER.get(mark, tone)
+        index = ALPHABET_INDEX.get(char)
+        if index is None:
+            primary.append(char)
+        else:
+            primary.append(chr(PRIMARY_BASE + index))
+            tones.append(tone)
+    return ''.join(primary) + '\0' + ''.join(tones) + '\0' + (text or '')
+
+def check_event_date(value: str) -> str:
+    """An event date as stored, or "" for none; raises ValueError otherwise.
+
+    A date is YYYY-MM-DD, or YYYY-MM-DD/YYYY-MM-DD for an event running
+    several days.
+    """
+    value = (value or '').strip()
+    if value and date_range(value) is None:
+        raise ValueError(f"date must be YYYY-MM-DD or YYYY-MM-DD/YYYY-MM-DD, got {value!r}")
+    return value
+
+class QueryRow:
+    """What the query index knows about one event: its sort keys and filter values"""
+    __slots__ = ('sort_keys', 'location_key', 'location', 'assigned')
+
+    def __init__(self, event: Event):
+        self.sort_keys = {
+            'id': event_id_sort_key(event.id),
+            'title': (collation_key(event.title),),
+            # Undated events last, in both directions
+            'date': (0, event.date) if event.date else (1, ''),
+            'date_descending': (1, event.date) if event.date else (0, ''),
+            'assignees': (len(event.assigned_users),),
+        }
+        self.location = ' '.join((event.location or '').split())
+        self.location_key = normalize_text(self.location)
+        self.assigned = bool(event.assigned_users)
+
+    def partition(self, by_location: bool, by_assigned: bool) -> Tuple[Optional[str], Optional[bool]]:
+        return (self.location_key if by_location else None, self.assigned if by_assigned else None)
+
+# (sort field, filtered by location, filtered by assignment)
+IndexShape = Tuple[str, bool, bool]
+
+class EventQueryIndex:
+    """Sorted, filtered views of the events, maintained incrementally.
+
+    Sort keys are computed once per event. An ordered index is built the
+    first time a combination of sort field and filters is asked for, split
+    into one partition per filter value, and from then on every add/remove
+    touches only the partitions the event moves in or out of. A page is then
+    a bisect and a slice of one partition.
+    """
+
+    def __init__(self, events: Iterable[Event] = ()):
+        self.rows: Dict[str, QueryRow] = {event.id: QueryRow(event) for event in events}
+        self.indexes: Dict[IndexShape, Dict[tuple, OrderedIndex]] = {}
+        # Normalized location -> (how it is displayed, number of events there)
+        self.location_counts: Dict[str, Tuple[str, int]] = {}
+        for row in self.rows.values():
+            self.count_location(row, 1)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def count_location(self, row: QueryRow, delta: int):
+        if not row.location_key:
+            return
+        name, count = self.location_counts.get(row.location_key, (row.location, 0))
+        if count + delta > 0:
+            self.location_counts[row.location_key] = (name, count + delta)
+        else:
+            self.location_counts.pop(row.location_key, None)
+
+    def add(self, event: Event):
+        """Index a new event, or re-index an edited one"""
+        row = QueryRow(event)
+        old_row = self.rows.get(event.id)
+        if old_row is not None:
+            self.count_location(old_row, -1)
+        self.rows[event.id] = row
+        self.count_location(row, 1)
+        for (sort, by_location, by_assigned), partitions in self.indexes.items():
+            partition = row.partition(by_location, by_assigned)
+            if old_row is not None:
+                old_partition = old_row.partition(by_location, by_assigned)
+                if old_partition != partition:
+                    self.remove_from(partitions, old_partition, event.id)
+            partitions.setdefault(partition, OrderedIndex()).add(event.id, row.sort_keys[sort])
+
+    def remove(self, event_id: str):
+        row = self.rows.pop(event_id, None)
+        if row is None:
+            return
+        self.count_location(row, -1)
+        for (_, by_location, by_assigned), partitions in self.indexes.items():
+            self.remove_from(partitions, row.partition(by_location, by_assigned), event_id)
+
+    def remove_from(self, partitions: Dict[tuple, OrderedIndex], partition: tuple, event_id: str):
+        index = partitions.get(partition)
+        if index is not None:
+            index.remove(event_id)
+            if not index.entries:
+                del partitions[partition]
+
+    def get_index(self, shape: IndexShape) -> Dict[tuple, OrderedIndex]:
+        partitions = self.indexes.get(shape)
+        if partitions is None:
+            sort, by_location, by_assigned = shape
+            grouped: Dict[tuple, List[Tuple[str, tuple]]] = {}
+            for event_id, row in self.rows.items():
+                grouped.setdefault(row.partition(by_location, by_assigned), []).append((event_id, row.sort_keys[sort]))
+            partitions = {partition: OrderedIndex(items) for partition, items in grouped.items()}
+            self.indexes[shape] = partitions
+        return partitions
+
+    def locations(self) -> List[str]:
+        """Every location some event is at, in Vietnamese alphabetical order"""
+        return sorted((name for name, _ in self.location_counts.values()), key=collation_key)
+
+    def query(
+        self,
+        sort: str = 'id',
+        descending: bool = False,
+        location: Optional[str] = None,
+        assigned: Optional[bool] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        within: Optional[Iterable[str]] = None
+    ) -> Tuple[List[str], Optional[str], Optional[str]]:
+        """(ids, next cursor, previous cursor) of one page of matching events.
+
+        `location` matches ignoring case and diacritics; `assigned` keeps only
+        events with (True) or without (False) assignees. `within` restricts
+        the page to those ids, which are sorted on the spot instead of using
+        an index, for small subsets such as one user's events.
+        """
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field: {sort}")
+        location_key = normalize_text(location) if location else None
+        if sort == 'date' and descending:
+            sort = 'date_descending'
+        if within is not None:
+            rows = ((event_id, self.rows.get(event_id)) for event_id in within)
+            entries = sorted_entries(
+                (event_id, row.sort_keys[sort]) for event_id, row in rows
+                if row is not None
+                and (location_key is None or row.location_key == location_key)
+                and (assigned is None or row.assigned == assigned)
+            )
+        else:
+            partitions = self.get_index((sort, location_key is not None, assigned is not None))
+            index = partitions.get((location_key, assigned))
+            entries = index.entries if index is not None else []
+        return paginate(entries, limit, cursor, descending)
+
+class DatePartition:
+    """The dated events of one city, sorted by first day"""
+
+    def __init__(self):
+        # (first day, last day, id), days as ordinals
+        self.entries: List[Tuple[int, int, str]] = []
+        # Days the longest event lasts; only grows, which just widens the scan
+        self.longest = 0
+
+    def add(self, entry: Tuple[int, int, str]):
+        insort(self.entries, entry)
+        self.longest = max(self.longest, entry[1] - entry[0])
+
+    def remove(self, entry: Tuple[int, int, str]):
+        index = bisect_left(self.entries, entry)
+        if index < len(self.entries) and self.entries[index] == entry:
+            del self.entries[index]
+
+    def between(self, first: int, last: int) -> Iterable[str]:
+        # Only events starting within `longest` days before `first` can still be running then
+        start = bisect_left(self.entries, (first - self.longest,))
+        end = bisect_left(self.entries, (last + 1,))
+        return (event_id for _, event_last, event_id in self.entries[start:end] if event_last >= first)
+
+class DateRangeIndex:
+    """Events by the days they run on, per city, for date range queries.
+
+    "What is on in Hồ Chí Minh next month" is two bisects into that city's
+    events sorted by first day, instead of parsing and comparing every
+    event's date. Events without a date are left out.
+    """
+
+    def __init__(self, events: Iterable[Event] = ()):
+        self.events: Dict[str, Event] = {}
+        # id -> (city key, entry) to find it again on removal
+        self.entries: Dict[str, Tuple[str, Tuple[int, int, str]]] = {}
+        # City key -> its events; None holds every event
+        self.partitions: Dict[Optional[str], DatePartition] = {}
+        # City key -> how the city is displayed
+        self.cities: Dict[str, str] = {}
+        for event in events:
+            self.add(event)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, event: Event):
+        self.remove(event.id)
+        days = date_range(event.date)
+        if days is None:
+            return
+        entry = (days[0].toordinal(), days[1].toordinal(), event.id)
+        key = city_key(event.location)
+        self.events[event.id] = event
+        self.entries[event.id] = (key, entry)
+        self.partitions.setdefault(None, DatePartition()).add(entry)
+        if key:
+            self.partitions.setdefault(key, DatePartition()).add(entry)
+            self.cities.setdefault(key, location_city(event.location))
+
+    def remove(self, event_id: str):
+        found = self.entries.pop(event_id, None)
+        if found is None:
+            return
+        key, entry = found
+        del self.events[event_id]
+        self.partitions[None].remove(entry)
+        if key:
+            partition = self.partitions[key]
+            partition.remove(entry)
+            if not partition.entries:
+                del self.partitions[key]
+                del self.cities[key]
+
+    def between(self, first: date, last: date, location: Optional[str] = None) -> List[Event]:
+        """Events running on any day from `first` to `last`, by first day.
+
+        `location` is a city (any of its usual spellings, ignoring case and
+        diacritics) or another location as it was scraped.
+        """
+        partition = self.partitions.get(city_key(location) if location else None)
+        if partition is None:
+            return []
+        return [self.events[event_id] for event_id in partition.between(first.toordinal(), last.toordinal())]
+
+    def city_names(self) -> List[str]:
+        """Every city some dated event is in, in Vietnamese alphabetical order"""
+        return sorted(self.cities.values(), key=collation_key)
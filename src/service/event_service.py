@@ -1,21 +1,77 @@
 import json
-import requests
-from bs4 import BeautifulSoup
-from typing import Optional, List
+import os
+import queue
+import threading
+import time
+from collections.abc import Mapping
+from datetime import date
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, Optional, List, Tuple, Union
 from src.model.event import Event
 from src.repository.event_repository import EventRepository
+from src.repository.pagination import EventPage
 from src.repository.user_repository import UserRepository
+from src.service.event_import import ImportReport, ProgressCallback, iter_drafts
+from src.service.event_normalizer import date_range, normalize_event_date, normalize_location
+from src.service.event_query import DateRangeIndex, EventQueryIndex, check_event_date
+from src.service.search_index import TrigramIndex
+from src.service.web_event_store import WebEventStore, WebEventsDelta, web_event_id
+
+if TYPE_CHECKING:
+    # The scraping stack pulls in requests; it is imported on the first scrape
+    from src.service.http_client import HttpClient
+    from src.service.web_crawler import WebCrawler
+    from src.service.web_sources import WebSource
+
+WEB_EVENTS_FILE = "web_events.json"
+
+# Sent with every scrape request to mimic a browser
+SCRAPER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+}
+
+def web_event_sort_key(event: Event):
+    # Soonest first, undated last; sorted() keeps the listing order among equals
+    days = date_range(event.date)
+    return (0, days[0], days[1]) if days is not None else (1,)
 
 class EventService:
-    def __init__(self, event_repository: EventRepository, user_repository: UserRepository):
+    def __init__(
+        self,
+        event_repository: EventRepository,
+        user_repository: UserRepository,
+        web_cache_ttl: float = 900,
+        http_client: Optional['HttpClient'] = None,
+        web_sources: Optional[List['WebSource']] = None
+    ):
         self.event_repository = event_repository
         self.user_repository = user_repository
+        # Registry of portals to crawl for web events (the defaults when None)
+        self.web_sources = web_sources
+        # One pooled session for every scrape, so connections are reused
+        self.http_client = http_client
+        self.web_cache_ttl = web_cache_ttl
+        # Built by get_web_crawler() the first time web events are scraped
+        self.web_crawler: Optional['WebCrawler'] = None
+        self.web_event_store = WebEventStore(WEB_EVENTS_FILE)
+        # Web events by date and city, rebuilt whenever the cached list is read
+        self.web_date_index: Optional[DateRangeIndex] = None
+        self.scrape_lock = threading.Lock()
+        # Built on the first search, then kept in sync by the mutation methods below
+        self.search_index: Optional[TrigramIndex] = None
+        # Built on the first sorted or filtered query, maintained the same way
+        self.query_index: Optional[EventQueryIndex] = None
+        # Network work (web scraping) runs here, never on the Tk thread
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="event-service")
 
     def get_events(self) -> List[Event]:
         events_data = self.event_repository.get_all_events()
         events = []
         # Convert dictionary or list of data to Event objects
-        if isinstance(events_data, dict):
+        if isinstance(events_data, Mapping):
             events_data = events_data.values()
         for event_data in events_data:
             if isinstance(event_data, dict):
@@ -28,20 +84,255 @@ class EventService:
                 events.append(event)
             elif isinstance(event_data, Event):
                 events.append(event_data)
-        shouldKnow = True
-        if shouldKnow: 
-            print("Something is going wrong")                                                                                                                                                                                                                                                                                                                                                                                                                                                                                 #let go of the past, focus on the present
         return events
 
-    def create_event(self, title: str, description: str = "") -> Event:
-        """Create a new event"""
-        return self.event_repository.create_event(title, description)
+    def get_events_page(self, limit: int = 50, cursor: Optional[str] = None, username: Optional[str] = None) -> EventPage:
+        """One page of events in a stable order, optionally only a user's.
+
+        Pass the returned next_cursor or prev_cursor to fetch the page after
+        or before it; a cursor is None when there is nothing that way.
+        """
+        return self.event_repository.get_events_page(limit, cursor, username)
+
+    def index_events(self, events: Iterable[Event]):
+        # Keep whichever of the in-memory indexes have been built in sync
+        if self.search_index is None and self.query_index is None:
+            return
+        for event in events:
+            if self.search_index is not None:
+                self.search_index.add(event.id, event.title)
+            if self.query_index is not None:
+                self.query_index.add(event)
+
+    def unindex_events(self, event_ids: Iterable[str]):
+        for event_id in event_ids:
+            if self.search_index is not None:
+                self.search_index.remove(event_id)
+            if self.query_index is not None:
+                self.query_index.remove(event_id)
+
+    def create_event(self, title: str, description: str = "", date: str = "", location: str = "") -> Event:
+        """Create a new event; `date` is YYYY-MM-DD or empty, raises ValueError otherwise"""
+        event = self.event_repository.create_event(title, description, check_event_date(date), location.strip())
+        self.index_events([event])
+        return event
 
     def update_event(self, event: Event) -> Event:
-        return self.event_repository.update_event(event)
+        event.date = check_event_date(event.date)
+        event = self.event_repository.update_event(event)
+        self.index_events([event])
+        return event
 
     def delete_event(self, event_id: str) -> bool:
-        return self.event_repository.delete_event(event_id)
+        deleted = self.event_repository.delete_event(event_id)
+        if deleted:
+            self.unindex_events([event_id])
+        return deleted
+
+    # Batch versions of the methods above: every change is applied under one
+    # hold of the repository lock and persisted together
+
+    def create_events(self, drafts: Iterable[Tuple[str, ...]]) -> List[Union[Event, ValueError]]:
+        """Create an event per (title, description[, date, location]).
+
+        Returns, in draft order, the created event or the ValueError that
+        kept a draft out; the valid drafts are created either way.
+        """
+        results: List[Union[Event, ValueError, None]] = []
+        valid = []
+        for draft in drafts:
+            title, description, event_date, location = tuple(draft) + ("",) * (4 - len(draft))
+            try:
+                valid.append((title, description, [], check_event_date(event_date), location.strip()))
+            except ValueError as e:
+                results.append(e)
+            else:
+                results.append(None)
+        events = self.event_repository.create_events(valid)
+        self.index_events(events)
+        created = iter(events)
+        return [next(created) if result is None else result for result in results]
+
+    def bulk_update(self, events: Iterable[Event]) -> Dict[str, Union[Event, ValueError, None]]:
+        """Save edited events; id -> saved event, the ValueError that kept it
+        from being saved, or None for an unknown id.
+
+        The given events are not modified; the valid ones are saved either way.
+        """
+        results: Dict[str, Union[Event, ValueError, None]] = {}
+        valid = []
+        for event in events:
+            try:
+                event_date = check_event_date(event.date)
+            except ValueError as e:
+                results[event.id] = e
+                continue
+            results[event.id] = None
+            valid.append(Event(event.id, event.title, event.description, event.assigned_users, event_date, event.location))
+        # Checking which ids exist and saving happen under one hold of the lock
+        with self.event_repository.batch():
+            existing = self.event_repository.get_all_events()
+            updated = self.event_repository.update_events(event for event in valid if event.id in existing)
+            self.index_events(updated)
+        for event in updated:
+            results[event.id] = event
+        return results
+
+    def delete_events(self, event_ids: Iterable[str]) -> Dict[str, bool]:
+        """id -> whether the event existed and was deleted"""
+        results = self.event_repository.delete_events(event_ids)
+        self.unindex_events(event_id for event_id, deleted in results.items() if deleted)
+        return results
+
+    def assign_user_to_events(self, username: str, event_ids: Iterable[str]) -> Dict[str, Optional[Event]]:
+        """Add one user to many events; id -> event, or None for an unknown id.
+
+        Nothing is assigned if the user does not exist.
+        """
+        event_ids = list(event_ids)
+        if not self.user_repository.user_exists(username):
+            return {event_id: None for event_id in event_ids}
+        results = {}
+        changed = []
+        # Read, change and save under one hold of the lock, so a concurrent
+        # edit cannot land in between and be overwritten
+        with self.event_repository.batch():
+            for event_id in event_ids:
+                event = self.event_repository.get_event(event_id)
+                results[event_id] = event
+                if event is not None and username not in event.assigned_users:
+                    event.assigned_users = event.assigned_users + [username]
+                    changed.append(event)
+            self.event_repository.update_events(changed)
+            self.index_events(changed)
+        return results
+
+    def import_events(
+        self,
+        path: str,
+        file_format: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        index: bool = True
+    ) -> ImportReport:
+        """Bulk-create events from a CSV or JSON Lines file.
+
+        Rows are validated as they are read (assignees must be existing
+        users) and the valid ones are created together, with a single
+        persist. `on_progress` gets (rows read, seconds elapsed) as the
+        file is read, and once more at the end. With `index=False` the
+        search and query indexes are left to the caller: pass
+        report.events to index_events() on the thread that reads them.
+        """
+        started = time.perf_counter()
+        report = ImportReport()
+        known_users = set(self.user_repository.get_all_users())
+        drafts = iter_drafts(path, report, file_format, known_users, on_progress)
+        events = self.event_repository.create_events(drafts)
+        # On disk before the report says so
+        self.event_repository.flush()
+        report.events = events
+        report.imported = len(events)
+        report.elapsed = time.perf_counter() - started
+        if on_progress is not None:
+            on_progress(report.rows, report.elapsed)
+        if index:
+            self.index_events(events)
+        return report
+
+    def import_events_async(
+        self,
+        path: str,
+        file_format: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> Future:
+        """Run import_events on a worker thread; the future resolves to its report.
+
+        The indexes are not thread-safe, so the worker leaves them alone:
+        call index_events(report.events) once the future is done, on the
+        thread that searches and queries.
+        """
+        return self.executor.submit(self.import_events, path, file_format, on_progress, False)
+
+    def get_search_index(self) -> TrigramIndex:
+        if self.search_index is None:
+            search_index = TrigramIndex()
+            for event in self.event_repository.get_all_events().values():
+                search_index.add(event.id, event.title)
+            self.search_index = search_index
+        return self.search_index
+
+    def get_query_index(self) -> EventQueryIndex:
+        if self.query_index is None:
+            self.query_index = EventQueryIndex(self.event_repository.get_all_events().values())
+        return self.query_index
+
+    def query_events(
+        self,
+        sort: str = 'id',
+        descending: bool = False,
+        location: Optional[str] = None,
+        assigned: Optional[bool] = None,
+        username: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> EventPage:
+        """One page of events sorted by id, title, date or assignee count.
+
+        Titles sort in Vietnamese alphabetical order and undated events come
+        last. `location` (ignoring case and diacritics) and `assigned` filter
+        the events, `username` keeps only that user's. Cursors work as in
+        get_events_page but only with the same sort and filters.
+        """
+        if sort == 'id' and not descending and location is None and assigned is None:
+            return self.get_events_page(limit, cursor, username)
+        within = None
+        if username is not None:
+            within = self.event_repository.get_user_event_ids(username)
+        event_ids, next_cursor, prev_cursor = self.get_query_index().query(
+            sort, descending, location, assigned, limit, cursor, within
+        )
+        events = []
+        for event_id in event_ids:
+            event = self.event_repository.get_event(event_id)
+            if event:
+                events.append(event)
+        return EventPage(events, next_cursor, prev_cursor)
+
+    def get_event_locations(self) -> List[str]:
+        """Locations to offer in the location filter"""
+        return self.get_query_index().locations()
+
+    def user_deleted(self, username: str, event_ids: Iterable[str]):
+        # The user was removed from these events behind our back: re-index just them
+        if self.query_index is None:
+            return
+        for event_id in event_ids:
+            event = self.event_repository.get_event(event_id)
+            if event is not None:
+                self.query_index.add(event)
+
+    def search_events(
+        self,
+        query: str,
+        username: Optional[str] = None,
+        limit: Optional[int] = 50,
+        offset: int = 0
+    ) -> Tuple[List[Event], int]:
+        """Search event titles ignoring case and Vietnamese diacritics.
+
+        Returns one ranked page of events and the total number of matches.
+        Pass a username to restrict the search to that user's assigned events.
+        """
+        allowed_ids = None
+        if username is not None:
+            allowed_ids = set(self.event_repository.get_user_event_ids(username))
+        event_ids, total = self.get_search_index().search(query, limit, offset, allowed_ids)
+        events = []
+        for event_id in event_ids:
+            event = self.event_repository.get_event(event_id)
+            if event:
+                events.append(event)
+        return events, total
 
     def assign_users_to_event(self, event_id: str, usernames: List[str]) -> Optional[Event]:
         event = self.event_repository.get_event(event_id)
@@ -56,16 +347,20 @@ class EventService:
                 id=event_id,
                 title=event.title,
                 description=event.description,
-                assigned_users=valid_users
+                assigned_users=valid_users,
+                date=event.date,
+                location=event.location
             )
-            return self.event_repository.update_event(updated_event)
+            updated_event = self.event_repository.update_event(updated_event)
+            self.index_events([updated_event])
+            return updated_event
         return None
 
     def get_user_events(self, username: str) -> List[Event]:
         events_data = self.event_repository.get_user_events(username)
         events = []
         # Convert dictionary or list of data to Event objects
-        if isinstance(events_data, dict):
+        if isinstance(events_data, Mapping):
             events_data = events_data.values()
         for event_data in events_data:
             if isinstance(event_data, dict):
@@ -80,155 +375,169 @@ class EventService:
                 events.append(event_data)
         return events
 
-    def scrape_and_save_web_events(self):
-        """Scrape events from web and save to JSON file"""
+    def get_web_crawler(self) -> 'WebCrawler':
+        if self.web_crawler is None:
+            from src.service.http_client import HttpClient
+            from src.service.scrape_cache import ScrapeCache
+            from src.service.web_crawler import WebCrawler
+            from src.service.web_sources import DEFAULT_WEB_SOURCES
+
+            if self.web_sources is None:
+                self.web_sources = list(DEFAULT_WEB_SOURCES)
+            if self.http_client is None:
+                self.http_client = HttpClient(headers=SCRAPER_HEADERS)
+            self.web_crawler = WebCrawler(self.http_client, ScrapeCache(ttl=self.web_cache_ttl))
+        return self.web_crawler
+
+    def scrape_and_save_web_events(self, on_event: Optional[Callable[[Event], None]] = None):
+        """Scrape events from web and save to JSON file.
+
+        `on_event` is called from crawler threads with each event as soon as
+        it has been parsed, before the scrape as a whole is done.
+        """
+        # Opening the screen twice in a row must not run two scrapes side by side
+        with self.scrape_lock:
+            return self.scrape_web_events_locked(on_event)
+
+    def scrape_web_events_locked(self, on_event: Optional[Callable[[Event], None]] = None):
         try:
-            # Add headers to mimic a browser request
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Connection': 'keep-alive',
-            }
-            response = requests.get("https://sansukien.com/", headers=headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            events = []
-            
-            # Try to find events in different sections
-            event_sections = [
-                soup.find_all('div', class_='event-item'),
-                soup.find_all('div', class_='event-card'),
-                soup.find_all('article'),
-                soup.find_all('div', class_='event'),
-                soup.find_all('div', class_='event-list-item'),
-                soup.find_all('div', class_='event-section')
+            crawler_callback = None
+            if on_event is not None:
+                crawler_callback = lambda source, url, extracted: on_event(
+                    self.web_event_from_dict(self.build_web_event(extracted, source.name))
+                )
+            web_crawler = self.get_web_crawler()
+            results = web_crawler.crawl(self.web_sources, on_event=crawler_callback)
+            failed_sources = set()
+            for result in results:
+                if result.error is not None:
+                    failed_sources.add(result.source.name)
+                    print(f"Error scraping {result.url}: {str(result.error)}")
+            web_crawler.scrape_cache.save()
+
+            # Every page fresh in cache or answered 304: web_events.json is still current
+            if all(result.from_cache for result in results) and os.path.exists(WEB_EVENTS_FILE):
+                return True
+
+            events = [
+                self.build_web_event(extracted, result.source.name)
+                for result in results
+                for extracted in result.events
             ]
-            
-            for section in event_sections:
-                if section:
-                    for event in section:
-                        # Extract event information
-                        title = None
-                        date = None
-                        location = None
-                        description = None
-                        
-                        # Try to find title - more comprehensive approach
-                        title_elem = None
-                        # First try common title classes
-                        for class_name in ['title', 'event-title', 'event-name', 'event-heading']:
-                            title_elem = event.find(class_=class_name)
-                            if title_elem:
-                                break
-                        
-                        # If not found, try heading tags
-                        if not title_elem:
-                            for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                                title_elem = event.find(tag)
-                                if title_elem:
-                                    break
-                        
-                        # If still not found, try finding any text that looks like a title
-                        if not title_elem:
-                            # Look for text that's not too long and not too short
-                            for elem in event.find_all(['div', 'span', 'p']):
-                                text = elem.get_text(strip=True)
-                                if 5 < len(text) < 100 and not any(keyword in text.lower() for keyword in ['địa điểm', 'location', 'date', 'time']):
-                                    title_elem = elem
-                                    break
-                        
-                        if title_elem:
-                            title = title_elem.get_text(strip=True)
-                        
-                        # Try to find date
-                        date_elem = (
-                            event.find('time') or
-                            event.find(['span', 'div'], class_=['date', 'event-date', 'time', 'event-time']) or
-                            event.find('div', string=lambda text: text and any(keyword in text.lower() for keyword in ['ngày', 'date', 'thời gian', 'time']))
-                        )
-                        if date_elem:
-                            date = date_elem.get_text(strip=True)
-                        
-                        # Try to find location
-                        location_elem = (
-                            event.find(['span', 'div'], class_=['location', 'event-location', 'venue', 'event-venue']) or
-                            event.find('div', string=lambda text: text and any(keyword in text.lower() for keyword in ['địa điểm', 'location', 'venue']))
-                        )
-                        if location_elem:
-                            location = location_elem.get_text(strip=True)
-                        
-                        # Try to find description
-                        desc_elem = (
-                            event.find(['div', 'p'], class_=['description', 'event-description', 'content', 'event-content']) or
-                            event.find('p')
-                        )
-                        if desc_elem:
-                            description = desc_elem.get_text(strip=True)
-                        
-                        # If we found any information, create an event
-                        if any([title, date, location, description]):
-                            # Combine location into description if available
-                            full_description = []
-                            if location:
-                                full_description.append(f"Location: {location}")
-                            if description:
-                                full_description.append(description)
-                            
-                            events.append({
-                                "id": f"web_{len(events) + 1}",
-                                "title": title or "No title",
-                                "description": "\n".join(full_description) if full_description else "",
-                                "date": date or ""
-                            })
-                    break  # Stop after finding the first valid section
-            
-            # If no events found with specific classes, try finding by content
-            if not events:
-                for div in soup.find_all('div'):
-                    text = div.get_text(strip=True)
-                    if any(keyword in text.lower() for keyword in ['sự kiện', 'event', 'hội thảo', 'seminar']):
-                        if len(text) > 5:  # Only add if text seems valid
-                            events.append({
-                                "id": f"web_{len(events) + 1}",
-                                "title": text,
-                                "description": "",
-                            })
-            
-            # Save events to JSON file
-            with open('web_events.json', 'w', encoding='utf-8') as f:
-                json.dump({"events": events}, f, ensure_ascii=False, indent=4)
-                
+            # Only what changed is written; a scrape that changed nothing writes
+            # nothing. What changed is kept for get_web_events_delta
+            self.web_event_store.merge(
+                events,
+                complete_sources={source.name for source in self.web_sources} - failed_sources
+            )
             return True
         except Exception as e:
             print(f"Error scraping web events: {str(e)}")
             return False
 
-    def get_web_events(self) -> List[Event]:
-        """Get events from JSON file"""
+    def build_web_event(self, extracted: dict, source: str) -> dict:
+        title = extracted.get('title')
+        raw_date = extracted.get('date')
+        raw_location = extracted.get('location')
+        description = extracted.get('description') or ""
+
+        event_date = normalize_event_date(raw_date)
+        if raw_date and not event_date:
+            # Unreadable as a date, keep what the site said where users can see it
+            description = f"Date: {raw_date}\n{description}" if description else f"Date: {raw_date}"
+
+        return {
+            # From the text as scraped, so IDs do not change with the parsing rules
+            "id": web_event_id(title, raw_date, raw_location),
+            "title": title or "No title",
+            "description": description,
+            "date": event_date,
+            "location": normalize_location(raw_location),
+            "source": source
+        }
+
+    def get_web_events(self, on_event: Optional[Callable[[Event], None]] = None) -> List[Event]:
+        """Scrape fresh web events, then return everything in the JSON file"""
+        # First try to scrape and save new events
+        self.scrape_and_save_web_events(on_event)
+        return self.get_cached_web_events()
+
+    def get_web_events_async(self, on_event: Optional[Callable[[Event], None]] = None) -> Future:
+        """Run get_web_events on a worker thread; the future resolves to the event list.
+
+        `on_event` streams the events in as they are parsed (from worker threads).
+        """
+        return self.executor.submit(self.get_web_events, on_event)
+
+    def iter_web_events(self) -> Iterator[Event]:
+        """Scrape and yield every web event as soon as its block has been parsed"""
+        arrived: queue.Queue = queue.Queue()
+        finished = object()
+        future = self.executor.submit(self.scrape_and_save_web_events, arrived.put)
+        future.add_done_callback(lambda _: arrived.put(finished))
+        while True:
+            event = arrived.get()
+            if event is finished:
+                return
+            yield event
+
+    def get_cached_web_events(self) -> List[Event]:
+        """Get events from JSON file without touching the network, soonest first.
+
+        Undated events follow the dated ones in listing order.
+        """
         try:
-            # First try to scrape and save new events
-            self.scrape_and_save_web_events()
-            
-            # Then read from the JSON file
-            with open('web_events.json', 'r', encoding='utf-8') as f:
+            with open(WEB_EVENTS_FILE, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                events = []
-                for event_data in data['events']:
-                    # Add date to description if available
-                    description = event_data.get('description', '')
-                    date = event_data.get('date', '')
-                    if date:
-                        description = f"Date: {date}\n{description}"
-                    
-                    event = Event(
-                        id=event_data.get('id', ''),
-                        title=event_data.get('title', 'No title'),
-                        description=description,
-                        assigned_users=[]  # Web events don't have assigned users
-                    )
-                    events.append(event)
-                return events
+                events = [
+                    self.web_event_from_dict(event_data)
+                    for event_data in data['events']
+                    if not event_data.get('removed_at')  # Tombstone of a removed event
+                ]
         except Exception as e:
             print(f"Error reading web events: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+        self.web_date_index = DateRangeIndex(events)
+        return sorted(events, key=web_event_sort_key)
+
+    def get_web_events_between(self, first: date, last: date, location: Optional[str] = None) -> List[Event]:
+        """Cached web events running on any day from `first` to `last`, soonest first.
+
+        `location` narrows it to a city, e.g. "Hồ Chí Minh" (or "TP.HCM",
+        "Sài Gòn"...); see event_normalizer.month_range for whole months.
+        """
+        if self.web_date_index is None:
+            self.get_cached_web_events()
+        return self.web_date_index.between(first, last, location)
+
+    def get_web_event_cities(self) -> List[str]:
+        if self.web_date_index is None:
+            self.get_cached_web_events()
+        return self.web_date_index.city_names()
+
+    def get_web_events_delta(self) -> WebEventsDelta:
+        """What the last scrape that changed anything added, changed and removed"""
+        return self.web_event_store.last_delta
+
+    def web_event_from_dict(self, event_data: dict) -> Event:
+        description = event_data.get('description', '')
+        # Entries saved before dates were parsed hold the date as the site wrote it
+        raw_date = event_data.get('date', '')
+        event_date = normalize_event_date(raw_date)
+        if raw_date and not event_date:
+            description = f"Date: {raw_date}\n{description}"
+
+        return Event(
+            id=event_data.get('id', ''),
+            title=event_data.get('title', 'No title'),
+            description=description,
+            assigned_users=[],  # Web events don't have assigned users
+            date=event_date,
+            location=normalize_location(event_data.get('location', ''))
+        )
+
+    def shutdown(self):
+        # Don't wait for an in-flight scrape, its result has nobody left to read it
+        self.executor.shutdown(wait=False)
+        if self.http_client is not None:
+            self.http_client.close()
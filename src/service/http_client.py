@@ -0,0 +1,87 @@
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+# Statuses worth another attempt: throttling and transient server/gateway errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class HttpClient:
+    """Shared, pooled HTTP session used by the web event scraper.
+
+    Connections are kept alive across scrapes, every request has a connect and
+    a read timeout, failed attempts are retried with exponential backoff and
+    full jitter, and no more than `per_host_limit` requests run against the
+    same host at once.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        connect_timeout: float = 5,
+        read_timeout: float = 15,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8,
+        per_host_limit: int = 2,
+        pool_size: int = 10
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.per_host_limit = per_host_limit
+
+        self.session = requests.Session()
+        # Retries are handled here, not by urllib3, so they can share the backoff policy
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+        self.host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self.host_limits_lock = threading.Lock()
+
+    def host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+        with self.host_limits_lock:
+            if host not in self.host_limits:
+                self.host_limits[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self.host_limits[host]
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        # Full jitter: anywhere between 0 and the exponential cap
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, stream: bool = False) -> requests.Response:
+        """GET `url`, retrying connection errors, timeouts and retryable statuses.
+
+        After the last attempt, the final response is returned as is (even with
+        a retryable status) or the final network error is raised.
+        """
+        limit = self.host_limit(url)
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            with limit:
+                try:
+                    response = self.session.get(url, headers=headers, timeout=self.timeout, stream=stream)
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt == self.max_retries:
+                        raise
+                else:
+                    if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                        return response
+                    retry_after = response.headers.get("Retry-After")
+                    response.close()
+            # Back off without holding the host slot
+            time.sleep(self.backoff_delay(attempt, retry_after))
+        raise RuntimeError("unreachable")
+
+    def close(self):
+        self.session.close()
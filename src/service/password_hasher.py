@@ -0,0 +1,151 @@
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+PBKDF2_ALGORITHM = "pbkdf2_sha256"
+SCRYPT_ALGORITHM = "scrypt"
+SALT_BYTES = 16
+
+def b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii')
+
+def b64decode(data: str) -> bytes:
+    return base64.b64decode(data.encode('ascii'))
+
+class PasswordHasher:
+    """Salted, deliberately slow password hashing.
+
+    Hashes are stored as `pbkdf2_sha256$<iterations>$<salt>$<hash>` or
+    `scrypt$<n>$<r>$<p>$<salt>$<hash>`, so the work factor travels with
+    each hash and can be raised later: needs_rehash() tells when a stored
+    hash (or a legacy plaintext password) should be replaced.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = PBKDF2_ALGORITHM,
+        iterations: int = 260000,
+        scrypt_n: int = 2 ** 14,
+        scrypt_r: int = 8,
+        scrypt_p: int = 1
+    ):
+        if algorithm not in (PBKDF2_ALGORITHM, SCRYPT_ALGORITHM):
+            raise ValueError(f"Unknown password hash algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.iterations = iterations
+        self.scrypt_n = scrypt_n
+        self.scrypt_r = scrypt_r
+        self.scrypt_p = scrypt_p
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(SALT_BYTES)
+        if self.algorithm == SCRYPT_ALGORITHM:
+            params = (self.scrypt_n, self.scrypt_r, self.scrypt_p)
+            digest = self.scrypt(password, salt, *params)
+        else:
+            params = (self.iterations,)
+            digest = self.pbkdf2(password, salt, self.iterations)
+        return "$".join([self.algorithm, *map(str, params), b64encode(salt), b64encode(digest)])
+
+    def verify(self, password: str, stored: str) -> bool:
+        """Check a password against a stored hash, or a legacy plaintext value"""
+        parsed = self.parse(stored)
+        if parsed is None:
+            return hmac.compare_digest(password.encode('utf-8'), stored.encode('utf-8'))
+        algorithm, params, salt, digest = parsed
+        if algorithm == SCRYPT_ALGORITHM:
+            candidate = self.scrypt(password, salt, *params)
+        else:
+            candidate = self.pbkdf2(password, salt, *params)
+        return hmac.compare_digest(candidate, digest)
+
+    def needs_rehash(self, stored: str) -> bool:
+        parsed = self.parse(stored)
+        if parsed is None:
+            return True  # Plaintext
+        algorithm, params, _, _ = parsed
+        if algorithm != self.algorithm:
+            return True
+        if algorithm == SCRYPT_ALGORITHM:
+            return params != (self.scrypt_n, self.scrypt_r, self.scrypt_p)
+        return params != (self.iterations,)
+
+    def is_hashed(self, stored: str) -> bool:
+        return self.parse(stored) is not None
+
+    def parse(self, stored: str) -> Optional[Tuple[str, Tuple[int, ...], bytes, bytes]]:
+        parts = stored.split("$")
+        try:
+            if parts[0] == PBKDF2_ALGORITHM and len(parts) == 4:
+                return parts[0], (int(parts[1]),), b64decode(parts[2]), b64decode(parts[3])
+            if parts[0] == SCRYPT_ALGORITHM and len(parts) == 6:
+                params = (int(parts[1]), int(parts[2]), int(parts[3]))
+                return parts[0], params, b64decode(parts[4]), b64decode(parts[5])
+        except ValueError:
+            pass
+        return None
+
+    def pbkdf2(self, password: str, salt: bytes, iterations: int) -> bytes:
+        return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+
+    def scrypt(self, password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        # Enough memory for the requested cost (128 * n * r bytes) plus headroom
+        return hashlib.scrypt(
+            password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+            maxmem=256 * n * r + 1024 * 1024, dklen=32
+        )
+
+class VerifiedCredentialCache:
+    """Remembers recently verified logins so repeating one skips the KDF.
+
+    Entries are keyed by an HMAC of username and password under a random
+    per-process key (the password itself is never kept) and tied to the
+    stored hash they were checked against, so a password change or a
+    rehash invalidates them. Entries expire after `ttl` seconds.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.key = secrets.token_bytes(32)
+        # token -> (stored hash at verification, expiry)
+        self.entries: Dict[bytes, Tuple[str, float]] = {}
+        self.lock = threading.Lock()
+
+    def token(self, username: str, password: str) -> bytes:
+        message = username.encode('utf-8') + b'\0' + password.encode('utf-8')
+        return hmac.new(self.key, message, hashlib.sha256).digest()
+
+    def check(self, username: str, password: str, stored: str) -> bool:
+        if self.ttl <= 0:
+            return False
+        token = self.token(username, password)
+        with self.lock:
+            entry = self.entries.get(token)
+            if entry is None:
+                return False
+            if entry[1] < time.monotonic():
+                del self.entries[token]
+                return False
+            return hmac.compare_digest(entry[0].encode('utf-8'), stored.encode('utf-8'))
+
+    def remember(self, username: str, password: str, stored: str):
+        if self.ttl <= 0:
+            return
+        token = self.token(username, password)
+        now = time.monotonic()
+        with self.lock:
+            if len(self.entries) >= self.max_entries:
+                self.entries = {key: entry for key, entry in self.entries.items() if entry[1] >= now}
+                if len(self.entries) >= self.max_entries:
+                    self.entries.clear()
+            self.entries[token] = (stored, now + self.ttl)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
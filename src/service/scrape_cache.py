@@ -0,0 +1,69 @@
+import json
+import threading
+import time
+from typing import Dict, List, Optional
+from src.repository.write_behind import atomic_write_json
+
+class ScrapeCache:
+    """Fetch time and validators (ETag / Last-Modified) of every scraped URL.
+
+    Within `ttl` seconds of the last fetch a URL is not requested at all; after
+    that it is revalidated with a conditional GET so an unchanged page comes
+    back as a bodyless 304. The events extracted from each page are kept with
+    it, so a 304 needs no re-parse. Entries may be updated from several crawler
+    threads; call save() once the crawl is over.
+    """
+
+    def __init__(self, cache_file: str = "web_events.cache.json", ttl: float = 900):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.entries: Dict[str, dict] = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        with self.lock:
+            atomic_write_json(self.cache_file, {'entries': self.entries})
+
+    def get(self, url: str) -> Optional[dict]:
+        return self.entries.get(url)
+
+    def is_fresh(self, url: str, now: Optional[float] = None) -> bool:
+        entry = self.entries.get(url)
+        if entry is None:
+            return False
+        now = time.time() if now is None else now
+        return now - entry.get('fetched_at', 0) < self.ttl
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        entry = self.entries.get(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, headers, events: List[dict]):
+        """Record a full 200 response: its validators, fetch time and extracted events"""
+        with self.lock:
+            self.entries[url] = {
+                'fetched_at': time.time(),
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'events': events
+            }
+
+    def touch(self, url: str):
+        """Record a 304: the cached result is still valid as of now"""
+        with self.lock:
+            entry = self.entries.setdefault(url, {})
+            entry['fetched_at'] = time.time()
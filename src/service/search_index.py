@@ -0,0 +1,107 @@
+import heapq
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from src.repository.event_repository import event_id_sort_key
+
+def normalize_text(text: str) -> str:
+    """Case-fold and strip diacritics so "Triển lãm" and "trien lam" compare equal."""
+    decomposed = unicodedata.normalize('NFD', text.replace('đ', 'd').replace('Đ', 'D'))
+    stripped = ''.join(ch for ch in decomposed if unicodedata.category(ch) != 'Mn')
+    return ' '.join(stripped.casefold().split())
+
+def grams(text: str) -> Set[str]:
+    # Bigrams as well as trigrams so two-letter queries still hit the index
+    padded = f" {text} "
+    return {padded[i:i + n] for n in (2, 3) for i in range(len(padded) - n + 1)}
+
+class TrigramIndex:
+    """Incrementally maintained n-gram index over normalized event titles."""
+
+    def __init__(self):
+        self.titles: Dict[str, str] = {}
+        self.postings: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def add(self, event_id: str, title: str):
+        normalized = normalize_text(title or '')
+        old = self.titles.get(event_id)
+        if old == normalized:
+            return
+        old_grams = grams(old) if old is not None else set()
+        new_grams = grams(normalized)
+        for gram in old_grams - new_grams:
+            self.discard_posting(gram, event_id)
+        for gram in new_grams - old_grams:
+            self.postings.setdefault(gram, set()).add(event_id)
+        self.titles[event_id] = normalized
+
+    def remove(self, event_id: str):
+        old = self.titles.pop(event_id, None)
+        if old is None:
+            return
+        for gram in grams(old):
+            self.discard_posting(gram, event_id)
+
+    def discard_posting(self, gram: str, event_id: str):
+        event_ids = self.postings.get(gram)
+        if event_ids is not None:
+            event_ids.discard(event_id)
+            if not event_ids:
+                del self.postings[gram]
+
+    def candidates(self, query: str) -> Iterable[str]:
+        if len(query) < 2:
+            return self.titles.keys()
+        if len(query) == 2:
+            query_grams = {query}
+        else:
+            query_grams = {query[i:i + 3] for i in range(len(query) - 2)}
+        # Intersect posting lists, smallest first
+        posting_lists = sorted((self.postings.get(gram, set()) for gram in query_grams), key=len)
+        result = set(posting_lists[0])
+        for event_ids in posting_lists[1:]:
+            if not result:
+                break
+            result &= event_ids
+        return result
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 50,
+        offset: int = 0,
+        allowed_ids: Optional[Set[str]] = None
+    ) -> Tuple[List[str], int]:
+        """Return one page of matching event ids, best match first, and the total match count."""
+        query = normalize_text(query)
+        if not query:
+            matches = list(self.titles.keys() if allowed_ids is None else allowed_ids & self.titles.keys())
+            matches.sort(key=event_id_sort_key)
+        else:
+            scored = []
+            for event_id in self.candidates(query):
+                if allowed_ids is not None and event_id not in allowed_ids:
+                    continue
+                title = self.titles[event_id]
+                position = title.find(query)
+                if position < 0:
+                    continue
+                # Prefix match, then word-start match, then anywhere; earlier and shorter first
+                if position == 0:
+                    rank = 0
+                elif title[position - 1] == ' ':
+                    rank = 1
+                else:
+                    rank = 2
+                scored.append((rank, position, len(title), event_id))
+            total = len(scored)
+            # Only the requested page needs to be ordered, not every match
+            if limit is None:
+                scored.sort()
+            else:
+                scored = heapq.nsmallest(offset + limit, scored)
+            return [key[3] for key in scored[offset:]], total
+        end = None if limit is None else offset + limit
+        return matches[offset:end], len(matches)
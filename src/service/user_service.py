@@ -1,16 +1,44 @@
-from typing import Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 from src.model.user import User
 from src.repository.user_repository import UserRepository
+from src.service.password_hasher import PasswordHasher, VerifiedCredentialCache
 
 class UserService:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: Optional[PasswordHasher] = None,
+        session_ttl: float = 300,
+        hash_workers: int = 2,
+        on_user_deleted: Optional[Callable[[str, List[str]], None]] = None
+    ):
         self.user_repository = user_repository
+        self.password_hasher = password_hasher or PasswordHasher()
+        # Repeat logins within session_ttl skip the key derivation
+        self.verified_cache = VerifiedCredentialCache(ttl=session_ttl)
+        # Hashing is slow on purpose; the *_async methods keep it off the Tk thread
+        self.executor = ThreadPoolExecutor(max_workers=hash_workers, thread_name_prefix="password-hash")
+        # Told about every deleted user and the events it has just been unassigned from
+        self.on_user_deleted = on_user_deleted
 
     def authenticate_user(self, username: str, password: str) -> Optional[User]:
         user = self.user_repository.get_user(username)
-        if user and user.password == password:
+        if not user:
+            return None
+        if self.verified_cache.check(username, password, user.password):
             return user
-        return None
+        if not self.password_hasher.verify(password, user.password):
+            return None
+        # Legacy plaintext entry or an outdated work factor: store a fresh hash
+        if self.password_hasher.needs_rehash(user.password):
+            user.password = self.password_hasher.hash(password)
+            self.user_repository.update_user(user)
+        self.verified_cache.remember(username, password, user.password)
+        return user
+
+    def authenticate_user_async(self, username: str, password: str) -> Future:
+        return self.executor.submit(self.authenticate_user, username, password)
 
     def register_user(self, username: str, password: str, role: str = 'user') -> Optional[User]:
         if self.user_repository.user_exists(username):
@@ -18,13 +46,21 @@ class UserService:
 
         user = User(
             username=username,
-            password=password,
+            password=self.password_hasher.hash(password),
             role=role,
             assigned_events=[]
         )
-        self.user_repository.create_user(user.username, user.password, user.role)
+        # Checked again under the lock: two registrations of one name may have
+        # been hashing at the same time, the second must not overwrite the first
+        with self.user_repository.lock:
+            if self.user_repository.user_exists(username):
+                return None
+            self.user_repository.create_user(user.username, user.password, user.role)
         return user
 
+    def register_user_async(self, username: str, password: str, role: str = 'user') -> Future:
+        return self.executor.submit(self.register_user, username, password, role)
+
     def get_user(self, username: str) -> Optional[User]:
         return self.user_repository.get_user(username)
 
@@ -36,7 +72,7 @@ class UserService:
         if user:
             updated_user = User(
                 username=username,
-                password=password,
+                password=self.password_hasher.hash(password),
                 role=role,
                 assigned_events=user.assigned_events
             )
@@ -44,8 +80,19 @@ class UserService:
             return updated_user
         return None
 
+    def update_user_async(self, username: str, password: str, role: str) -> Future:
+        return self.executor.submit(self.update_user, username, password, role)
+
     def delete_user(self, username: str) -> bool:
-        if self.user_repository.user_exists(username):
+        user = self.user_repository.get_user(username)
+        if user:
+            # Read before the delete takes the user off these events
+            event_ids = list(user.assigned_events)
             self.user_repository.delete_user(username)
+            if self.on_user_deleted is not None:
+                self.on_user_deleted(username, event_ids)
             return True
-        return False 
\ No newline at end of file
+        return False
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,133 @@
+import asyncio
+import codecs
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+from src.service.http_client import HttpClient
+from src.service.scrape_cache import ScrapeCache
+from src.service.web_sources import WebSource
+
+# Read size for streamed pages; events are yielded after every chunk
+CHUNK_SIZE = 16 * 1024
+
+# Called from crawler threads with every event as soon as it is extracted
+EventCallback = Callable[[WebSource, str, dict], None]
+
+def iter_text(response, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Decode a streamed response body chunk by chunk"""
+    content_type = response.headers.get('Content-Type', '')
+    # requests assumes ISO-8859-1 for text/* without a charset; pages here are UTF-8
+    encoding = response.encoding if 'charset' in content_type.lower() else 'utf-8'
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+class PageResult:
+    """Events extracted from one listing page, and where they came from."""
+
+    def __init__(self, source: WebSource, url: str, events: List[dict], from_cache: bool, error: Optional[Exception] = None):
+        self.source = source
+        self.url = url
+        self.events = events
+        # True when nothing new was downloaded (fresh cache entry or 304)
+        self.from_cache = from_cache
+        self.error = error
+
+class WebCrawler:
+    """Fetches every page of every source concurrently.
+
+    Pages are scheduled on an asyncio loop under a global and a per-host
+    concurrency cap, and the blocking HTTP calls run on a thread pool, so
+    hosts are crawled side by side: total time tracks the slowest host
+    instead of the sum of all of them.
+    """
+
+    def __init__(
+        self,
+        http_client: HttpClient,
+        scrape_cache: ScrapeCache,
+        max_concurrency: int = 8,
+        per_host_limit: int = 2
+    ):
+        self.http_client = http_client
+        self.scrape_cache = scrape_cache
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+
+    def crawl(self, sources: List[WebSource], on_event: Optional[EventCallback] = None) -> List[PageResult]:
+        """Crawl all sources; results follow source order, then page order.
+
+        `on_event`, if given, sees every event the moment it is parsed, in
+        arrival order, long before the whole crawl is over.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="web-crawler") as executor:
+            return asyncio.run(self.crawl_async(sources, executor, on_event))
+
+    async def crawl_async(
+        self,
+        sources: List[WebSource],
+        executor: ThreadPoolExecutor,
+        on_event: Optional[EventCallback] = None
+    ) -> List[PageResult]:
+        loop = asyncio.get_running_loop()
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def fetch(source: WebSource, url: str) -> PageResult:
+            host = urlsplit(url).netloc.lower()
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+            async with global_limit, host_limit:
+                return await loop.run_in_executor(executor, self.fetch_page, source, url, on_event)
+
+        return await asyncio.gather(*(
+            fetch(source, url) for source in sources for url in source.urls()
+        ))
+
+    def fetch_page(self, source: WebSource, url: str, on_event: Optional[EventCallback] = None) -> PageResult:
+        cached = self.scrape_cache.get(url) or {}
+        cached_events = cached.get('events')
+        events = []
+        try:
+            if cached_events is not None and self.scrape_cache.is_fresh(url):
+                return self.cached_result(source, url, cached_events, on_event)
+
+            headers = self.scrape_cache.conditional_headers(url) if cached_events is not None else {}
+            response = self.http_client.get(url, headers=headers, stream=True)
+            with response:
+                if response.status_code == 304:
+                    # Unchanged since the last fetch, nothing to download or parse
+                    self.scrape_cache.touch(url)
+                    return self.cached_result(source, url, cached_events, on_event)
+                response.raise_for_status()
+                # Parse while downloading: events are passed on as their block closes
+                for event in source.extractor(iter_text(response)):
+                    events.append(event)
+                    if on_event is not None:
+                        on_event(source, url, event)
+            self.scrape_cache.store(url, response.headers, events=events)
+            return PageResult(source, url, events, from_cache=False)
+        except Exception as e:
+            # Serve the last good copy of a page that can't be fetched right now;
+            # a download that broke off midway is only kept if there is none
+            if cached_events is None or events:
+                return PageResult(source, url, cached_events or events, from_cache=True, error=e)
+            result = self.cached_result(source, url, cached_events, on_event)
+            result.error = e
+            return result
+
+    def cached_result(
+        self,
+        source: WebSource,
+        url: str,
+        cached_events: List[dict],
+        on_event: Optional[EventCallback] = None
+    ) -> PageResult:
+        if on_event is not None:
+            for event in cached_events:
+                on_event(source, url, event)
+        return PageResult(source, url, cached_events, from_cache=True)
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import time
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+from src.repository.write_behind import atomic_write_json
+
+# Removed events are remembered this long so consumers can see the removal
+TOMBSTONE_TTL = 7 * 24 * 60 * 60
+
+# Fields that make up an event's content; a difference in any of them is a change
+CONTENT_FIELDS = ('title', 'description', 'date', 'location', 'source')
+
+def normalize_key_part(value: Optional[str]) -> str:
+    if not value:
+        return ''
+    return ' '.join(unicodedata.normalize('NFC', value).casefold().split())
+
+def web_event_id(title: Optional[str], date: Optional[str], location: Optional[str]) -> str:
+    """Stable ID from the normalized title, date and location of a web event"""
+    key = '\x1f'.join(normalize_key_part(value) for value in (title, date, location))
+    return 'web_' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+class WebEventsDelta:
+    """IDs of the web events one scrape added, changed and removed"""
+
+    def __init__(
+        self,
+        revision: int = 0,
+        added: Optional[List[str]] = None,
+        changed: Optional[List[str]] = None,
+        removed: Optional[List[str]] = None
+    ):
+        self.revision = revision
+        self.added = added or []
+        self.changed = changed or []
+        self.removed = removed or []
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def __str__(self) -> str:
+        return f"{len(self.added)} new, {len(self.changed)} changed, {len(self.removed)} removed"
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'WebEventsDelta':
+        return cls(data.get('revision', 0), data.get('added'), data.get('changed'), data.get('removed'))
+
+    def to_dict(self) -> dict:
+        return {'revision': self.revision, 'added': self.added, 'changed': self.changed, 'removed': self.removed}
+
+class WebEventStore:
+    """The scraped web events file, updated by merging instead of rewriting.
+
+    Events are keyed by web_event_id, so an event keeps its ID when the site
+    reorders its listing. Each merge bumps the revision only if something
+    was added, changed or removed; every entry records the revision that
+    last touched it, and removed events stay behind as tombstones for
+    `tombstone_ttl` seconds. When nothing changed the file is not written.
+    """
+
+    def __init__(self, events_file: str = "web_events.json", tombstone_ttl: float = TOMBSTONE_TTL):
+        self.events_file = events_file
+        self.tombstone_ttl = tombstone_ttl
+        self.revision = 0
+        # id -> entry, in listing order (tombstones last)
+        self.events: Dict[str, dict] = {}
+        self.last_delta = WebEventsDelta()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.events_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        self.revision = data.get('revision', 0)
+        self.events = {entry['id']: entry for entry in data.get('events', []) if entry.get('id')}
+        self.last_delta = WebEventsDelta.from_dict(data.get('delta', {}))
+
+    def save(self):
+        atomic_write_json(self.events_file, {
+            'revision': self.revision,
+            'delta': self.last_delta.to_dict(),
+            'events': list(self.events.values())
+        })
+
+    def live_events(self) -> List[dict]:
+        return [entry for entry in self.events.values() if not entry.get('removed_at')]
+
+    def changed_since(self, revision: int) -> List[dict]:
+        """Entries (tombstones included) added, changed or removed after `revision`"""
+        return [entry for entry in self.events.values() if entry.get('revision', 0) > revision]
+
+    def merge(self, scraped: Iterable[dict], complete_sources: Set[str], now: Optional[float] = None) -> WebEventsDelta:
+        """Merge one scrape in and save if anything changed.
+
+        Events missing from the scrape are only tombstoned if their source is
+        in `complete_sources`, i.e. all of that source's pages were read.
+        """
+        now = time.time() if now is None else now
+        revision = self.revision + 1
+        delta = WebEventsDelta(revision)
+        merged: Dict[str, dict] = {}
+
+        for event in scraped:
+            if event['id'] in merged:
+                continue  # Listed twice with the same content
+            previous = self.events.get(event['id'])
+            entry = dict(event)
+            if previous is None or previous.get('removed_at'):
+                entry['revision'] = revision
+                delta.added.append(event['id'])
+            elif any(previous.get(field) != entry.get(field) for field in CONTENT_FIELDS):
+                entry['revision'] = revision
+                delta.changed.append(event['id'])
+            else:
+                entry['revision'] = previous.get('revision', 0)
+            merged[event['id']] = entry
+
+        tombstones_expired = False
+        tombstones = []
+        for event_id, previous in self.events.items():
+            if event_id in merged:
+                continue
+            if previous.get('removed_at'):
+                if now - previous['removed_at'] < self.tombstone_ttl:
+                    tombstones.append(previous)
+                else:
+                    tombstones_expired = True
+            elif previous.get('source', '') in complete_sources or not previous.get('source'):
+                delta.removed.append(event_id)
+                tombstones.append({'id': event_id, 'source': previous.get('source', ''), 'removed_at': now, 'revision': revision})
+            else:
+                # Its source could not be read completely, keep it until it can
+                merged[event_id] = previous
+        for tombstone in tombstones:
+            merged[tombstone['id']] = tombstone
+
+        if delta:
+            self.revision = revision
+            self.last_delta = delta
+        else:
+            delta = WebEventsDelta(self.revision)
+        if delta or tombstones_expired:
+            self.events = merged
+            self.save()
+        return delta
@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from src.service.event_extractor import iter_extract_events
+
+@dataclass
+class WebSource:
+    """An event portal to crawl: where its listing pages are and how to read them.
+
+    `url_template` is formatted with `page` for pages 2..`pages`;
+    `first_page_url`, when set, is used for page 1 (many sites serve the
+    first listing page at a different URL than /page/1/). `extractor` takes
+    the page as an iterable of text chunks and yields events as it finds them.
+    """
+    name: str
+    url_template: str
+    pages: int = 1
+    first_page_url: Optional[str] = None
+    extractor: Callable[[Iterable[str]], Iterator[Dict[str, Optional[str]]]] = field(default=iter_extract_events)
+
+    def urls(self) -> List[str]:
+        urls = []
+        for page in range(1, self.pages + 1):
+            if page == 1 and self.first_page_url:
+                urls.append(self.first_page_url)
+            else:
+                urls.append(self.url_template.format(page=page))
+        return urls
+
+# Only sansukien is registered: it is the one portal whose markup the
+# extractor has been checked against (benchmarks/fixtures). Another portal is
+# added here as one more WebSource once a saved page of it extracts cleanly,
+# with its own `extractor` if the generic selectors do not fit its markup.
+DEFAULT_WEB_SOURCES = [
+    WebSource(
+        name="sansukien",
+        url_template="https://sansukien.com/page/{page}/",
+        pages=3,
+        first_page_url="https://sansukien.com/"
+    ),
+]
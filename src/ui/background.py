@@ -0,0 +1,84 @@
+import queue
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional
+
+class BackgroundTask:
+    """Delivers the result of a worker-thread future back on the Tk thread.
+
+    Tk widgets must only be touched from the main loop, so the worker never
+    calls back directly: the owning widget polls the future with after() and
+    runs the callbacks itself. The task cancels itself when the widget is
+    destroyed, e.g. when the user navigates to another screen.
+
+    Partial results the worker puts on `progress` are drained on every poll
+    and handed to `on_progress` as a list, before `on_done` runs.
+    """
+
+    def __init__(
+        self,
+        widget: Any,
+        future: Future,
+        on_done: Callable[[Any], None],
+        on_error: Optional[Callable[[Exception], None]] = None,
+        poll_ms: int = 100,
+        progress: Optional[queue.Queue] = None,
+        on_progress: Optional[Callable[[List[Any]], None]] = None
+    ):
+        self.widget = widget
+        self.future = future
+        self.on_done = on_done
+        self.on_error = on_error
+        self.progress = progress
+        self.on_progress = on_progress
+        self.poll_ms = poll_ms
+        self.cancelled = False
+        self.after_id = None
+        widget.bind("<Destroy>", lambda _: self.cancel(), add="+")
+        self.schedule()
+
+    def schedule(self):
+        self.after_id = self.widget.after(self.poll_ms, self.poll)
+
+    def poll(self):
+        self.after_id = None
+        if self.cancelled:
+            return
+        # Check first: once the future is done, every progress item is queued
+        done = self.future.done()
+        self.drain_progress()
+        if not done:
+            self.schedule()
+            return
+        if self.future.cancelled():
+            return
+        error = self.future.exception()
+        if error is not None:
+            if self.on_error:
+                self.on_error(error)
+            return
+        self.on_done(self.future.result())
+
+    def drain_progress(self):
+        if self.progress is None or self.on_progress is None:
+            return
+        items = []
+        while True:
+            try:
+                items.append(self.progress.get_nowait())
+            except queue.Empty:
+                break
+        if items:
+            self.on_progress(items)
+
+    def cancel(self):
+        if self.cancelled:
+            return
+        self.cancelled = True
+        # Only helps if the work has not started yet, a running job is just ignored
+        self.future.cancel()
+        if self.after_id is not None:
+            try:
+                self.widget.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
@@ -1,10 +1,61 @@
+import queue
+from bisect import bisect_right
 import customtkinter as ctk
-from typing import Callable, Optional
+from tkinter import filedialog
+from datetime import date
+from typing import Callable, List, Optional, Set
 from src.model.user import User
 from src.model.event import Event
+from src.repository.event_repository import event_id_sort_key
+from src.service.event_normalizer import month_range
+from src.service.event_query import check_event_date
 from src.service.event_service import EventService
 from src.service.user_service import UserService
+from src.ui.background import BackgroundTask
 from src.ui.base_ui import BaseUI
+from src.ui.virtual_list import VirtualList
+
+# Fixed row heights let the virtual list place rows without measuring them
+EVENT_ROW_HEIGHT = 90
+BUTTON_ROW_HEIGHT = 45
+DESCRIPTION_MAX_LINES = 2
+DESCRIPTION_MAX_CHARS = 120
+# Events fetched per page; the list loads the next one as it nears the end
+EVENTS_PAGE_SIZE = 50
+# Labels of the sort and filter menus -> query_events arguments
+SORT_CHOICES = {"ID": "id", "Title": "title", "Date": "date", "Assignees": "assignees"}
+ASSIGNMENT_CHOICES = {"All events": None, "Assigned": True, "Unassigned": False}
+ALL_LOCATIONS = "All locations"
+# query_options() of the list in its initial, unsorted and unfiltered state
+DEFAULT_QUERY = {'sort': 'id', 'descending': False, 'location': None, 'assigned': None}
+# Web event periods -> months after the current one
+WEB_PERIODS = {"All dates": None, "This month": 0, "Next month": 1}
+ALL_CITIES = "All cities"
+
+def event_details(event: Event) -> str:
+    # A multi-day date is stored as first/last
+    event_date = (event.date or "").replace("/", " – ")
+    return " · ".join(part for part in (event_date, event.location) if part)
+
+def summarize_description(description: str) -> str:
+    # Rows have a fixed height, so long descriptions are clipped
+    lines = (description or "").splitlines()[:DESCRIPTION_MAX_LINES]
+    lines = [line if len(line) <= DESCRIPTION_MAX_CHARS else line[:DESCRIPTION_MAX_CHARS - 1] + "…" for line in lines]
+    return "\n".join(lines)
+
+class EventRow:
+    """Widgets of one recyclable row in the event list."""
+
+    def __init__(self):
+        self.frame: Optional[ctk.CTkFrame] = None
+        self.title_label: Optional[ctk.CTkLabel] = None
+        self.desc_label: Optional[ctk.CTkLabel] = None
+        self.edit_btn: Optional[ctk.CTkButton] = None
+        self.delete_btn: Optional[ctk.CTkButton] = None
+        self.assign_btn: Optional[ctk.CTkButton] = None
+        # Only shown in multi-select mode
+        self.select_box: Optional[ctk.CTkCheckBox] = None
+        self.select_var: Optional[ctk.BooleanVar] = None
 
 class EventUI(BaseUI):
     def __init__(
@@ -25,6 +76,15 @@ class EventUI(BaseUI):
         self.view_only = view_only
         self.web_only = web_only
         self.on_back = on_back
+        # Multi-select mode: ids ticked for the batch actions
+        self.select_mode = False
+        self.selected_ids: Set[str] = set()
+        # Cursors around the loaded pages; both None when not paging (search results)
+        self.prev_cursor: Optional[str] = None
+        self.next_cursor: Optional[str] = None
+        # Cursor the first loaded page was fetched with, to fetch it again
+        self.page_cursor: Optional[str] = None
+        self.showing_search = False
         
         self.setup_ui()
         self.load_events()
@@ -44,6 +104,12 @@ class EventUI(BaseUI):
             font=("Arial", 24)
         ).pack(pady=20)
 
+        # Web events refresh in the background, tell the user while they do
+        if self.web_only:
+            self.status_label = ctk.CTkLabel(self.main_frame, text="", font=("Arial", 12))
+            self.status_label.pack(pady=(0, 5))
+            self.create_web_filter_bar()
+
         # Add search box only if not viewing web events
         if not self.web_only:
             search_frame = ctk.CTkFrame(self.main_frame)
@@ -64,13 +130,18 @@ class EventUI(BaseUI):
                 text="Delete",
                 command=self.clear_search
             ).pack(side="left", padx=5)
+
+            self.create_query_bar()
         
         # Create event form if not view only
         if not self.view_only and not self.web_only:
             self.create_event_form()
+            self.create_selection_bar()
         
         # Create event list
         self.create_event_list()
+        if not self.web_only:
+            self.create_pager()
         
         # Back button
         if self.on_back:
@@ -80,6 +151,100 @@ class EventUI(BaseUI):
                 command=self.on_back
             ).pack(pady=20)
 
+    def create_query_bar(self):
+        bar = ctk.CTkFrame(self.main_frame)
+        bar.pack(pady=(0, 10), padx=20, fill="x")
+
+        ctk.CTkLabel(bar, text="Sort by:").pack(side="left", padx=5)
+        self.sort_menu = ctk.CTkOptionMenu(
+            bar,
+            values=list(SORT_CHOICES),
+            width=100,
+            command=lambda _: self.on_query_changed()
+        )
+        self.sort_menu.pack(side="left", padx=5)
+        self.descending_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            bar,
+            text="Descending",
+            variable=self.descending_var,
+            command=self.on_query_changed
+        ).pack(side="left", padx=5)
+
+        # Filled with the known locations once the query index exists; typing one works too
+        self.location_box = ctk.CTkComboBox(
+            bar,
+            values=[ALL_LOCATIONS],
+            width=160,
+            command=lambda _: self.on_query_changed()
+        )
+        self.location_box.set(ALL_LOCATIONS)
+        self.location_box.bind("<Return>", lambda _: self.on_query_changed())
+        self.location_box.pack(side="left", padx=5)
+        self.assignment_menu = ctk.CTkOptionMenu(
+            bar,
+            values=list(ASSIGNMENT_CHOICES),
+            width=110,
+            command=lambda _: self.on_query_changed()
+        )
+        self.assignment_menu.pack(side="left", padx=5)
+
+    def create_web_filter_bar(self):
+        bar = ctk.CTkFrame(self.main_frame)
+        bar.pack(pady=(0, 10), padx=20, fill="x")
+        self.period_menu = ctk.CTkOptionMenu(
+            bar,
+            values=list(WEB_PERIODS),
+            width=110,
+            command=lambda _: self.show_web_events()
+        )
+        self.period_menu.pack(side="left", padx=5)
+        self.city_box = ctk.CTkComboBox(
+            bar,
+            values=[ALL_CITIES],
+            width=160,
+            command=lambda _: self.show_web_events()
+        )
+        self.city_box.set(ALL_CITIES)
+        self.city_box.bind("<Return>", lambda _: self.show_web_events())
+        self.city_box.pack(side="left", padx=5)
+
+    def web_filter_active(self) -> bool:
+        city = self.city_box.get().strip()
+        return WEB_PERIODS[self.period_menu.get()] is not None or (bool(city) and city != ALL_CITIES)
+
+    def show_web_events(self, events: Optional[List[Event]] = None):
+        # All of `events` (the cached list when None), or the ones in the chosen period and city
+        if not self.web_filter_active():
+            if events is None:
+                events = self.event_service.get_cached_web_events()
+            self.event_list.set_items(events, empty_text="No events yet")
+            return
+        months_ahead = WEB_PERIODS[self.period_menu.get()]
+        first, last = (date.min, date.max) if months_ahead is None else month_range(months_ahead=months_ahead)
+        city = self.city_box.get().strip()
+        events = self.event_service.get_web_events_between(first, last, city if city != ALL_CITIES else None)
+        self.event_list.set_items(events, empty_text="No events found")
+
+    def query_options(self) -> dict:
+        # Sort and filters of the query bar, as query_events keyword arguments
+        if self.web_only:
+            return {}
+        location = self.location_box.get().strip()
+        return {
+            'sort': SORT_CHOICES[self.sort_menu.get()],
+            'descending': self.descending_var.get(),
+            'location': location if location and location != ALL_LOCATIONS else None,
+            'assigned': ASSIGNMENT_CHOICES[self.assignment_menu.get()],
+        }
+
+    def on_query_changed(self):
+        try:
+            self.show_page(None)
+            self.location_box.configure(values=[ALL_LOCATIONS] + self.event_service.get_event_locations())
+        except Exception as e:
+            self.show_error(f"Error loading event list: {str(e)}")
+
     def create_event_form(self):
         form_frame = ctk.CTkFrame(self.main_frame)
         form_frame.pack(pady=20, padx=20, fill="x")
@@ -93,135 +258,440 @@ class EventUI(BaseUI):
         ctk.CTkLabel(form_frame, text="Description:").pack(pady=5)
         self.description_entry = ctk.CTkEntry(form_frame)
         self.description_entry.pack(pady=5)
+
+        # Date and location, both optional
+        ctk.CTkLabel(form_frame, text="Date (YYYY-MM-DD):").pack(pady=5)
+        self.date_entry = ctk.CTkEntry(form_frame)
+        self.date_entry.pack(pady=5)
+        ctk.CTkLabel(form_frame, text="Location:").pack(pady=5)
+        self.location_entry = ctk.CTkEntry(form_frame)
+        self.location_entry.pack(pady=5)
         
         # Add button
         ctk.CTkButton(
             form_frame,
             text="Add Event",
             command=self.add_event
-        ).pack(pady=20)
+        ).pack(pady=(20, 5))
+
+        # Bulk import from a file, runs off the Tk thread
+        self.import_btn = ctk.CTkButton(
+            form_frame,
+            text="Import from file...",
+            command=self.import_events
+        )
+        self.import_btn.pack(pady=5)
+        self.import_status = ctk.CTkLabel(form_frame, text="", font=("Arial", 12))
+        self.import_status.pack(pady=(0, 5))
+
+    def create_selection_bar(self):
+        bar = ctk.CTkFrame(self.main_frame)
+        bar.pack(pady=(0, 10), padx=20, fill="x")
+
+        self.select_btn = ctk.CTkButton(bar, text="Select", width=80, command=self.toggle_select_mode)
+        self.select_btn.pack(side="left", padx=5)
+        self.selection_label = ctk.CTkLabel(bar, text="")
+        self.selection_label.pack(side="left", padx=5)
+
+        # Batch actions, enabled in multi-select mode
+        self.batch_buttons = [
+            ctk.CTkButton(bar, text="Select all", width=80, command=self.select_all),
+            ctk.CTkButton(
+                bar,
+                text="Delete selected",
+                width=110,
+                fg_color="red",
+                hover_color="darkred",
+                command=self.delete_selected
+            ),
+        ]
+        if self.current_user.role == "admin":
+            self.batch_buttons.append(
+                ctk.CTkButton(bar, text="Assign user...", width=100, command=self.show_assign_user_to_selected)
+            )
+        for button in self.batch_buttons:
+            button.configure(state="disabled")
+            button.pack(side="left", padx=5)
 
     def create_event_list(self):
-        # Create scrollable frame for events
-        self.events_frame = ctk.CTkScrollableFrame(self.main_frame)
-        self.events_frame.pack(pady=(0, 20), padx=20, fill="both", expand=True)
+        # Only the rows in view get widgets, they are recycled while scrolling
+        self.event_list = VirtualList(
+            self.main_frame,
+            row_height=EVENT_ROW_HEIGHT if self.view_only or self.web_only else EVENT_ROW_HEIGHT + BUTTON_ROW_HEIGHT,
+            create_row=self.create_event_row,
+            bind_row=self.bind_event_row,
+            item_key=lambda event: event.id,
+            empty_text="No events yet",
+            on_scroll_end=None if self.web_only else self.load_more_events
+        )
+        self.event_list.pack(pady=(0, 20), padx=20, fill="both", expand=True)
+
+    def create_pager(self):
+        pager = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        pager.pack(padx=20, fill="x")
+        self.prev_page_btn = ctk.CTkButton(
+            pager,
+            text="Previous page",
+            width=110,
+            command=lambda: self.show_page(self.prev_cursor)
+        )
+        self.prev_page_btn.pack(side="left", padx=5)
+        self.next_page_btn = ctk.CTkButton(
+            pager,
+            text="Next page",
+            width=110,
+            command=lambda: self.show_page(self.next_cursor)
+        )
+        self.next_page_btn.pack(side="right", padx=5)
 
     def load_events(self):
         try:
-            # Clear existing events
-            for widget in self.events_frame.winfo_children():
-                widget.destroy()
-            
             # Get events based on mode
             if self.web_only:
-                events = self.event_service.get_web_events()
-            else:
-                # For regular users, only show assigned events
-                if self.current_user.role == "user":
-                    events = self.event_service.get_user_events(self.current_user.username)
-                else:
-                    events = self.event_service.get_events()
-            
-            if not events:
-                no_events_label = ctk.CTkLabel(
-                    self.events_frame,
-                    text="No events yet",
-                    font=("Arial", 14)
-                )
-                no_events_label.pack(pady=20)
+                self.load_web_events()
                 return
-            
-            # Add events to the container
-            for event in events:
-                self.create_event_widget(event)
-                
+            self.show_page(None)
+        except Exception as e:
+            self.show_error(f"Error loading event list: {str(e)}")
+
+    def page_username(self) -> Optional[str]:
+        # For regular users, only show assigned events
+        return self.current_user.username if self.current_user.role == "user" else None
+
+    def show_page(self, cursor: Optional[str]):
+        self.page_cursor = cursor
+        self.showing_search = False
+        # Replaces the list: the first page, or the page before/after the loaded ones
+        page = self.event_service.query_events(
+            username=self.page_username(), limit=EVENTS_PAGE_SIZE, cursor=cursor, **self.query_options()
+        )
+        self.prev_cursor = page.prev_cursor
+        self.next_cursor = page.next_cursor
+        self.event_list.set_items(page.events, empty_text="No events yet")
+        self.update_pager()
+
+    def load_more_events(self):
+        # Infinite scroll: append the next page once the end of the list is close
+        if self.next_cursor is None or not self.event_list.near_end():
+            return
+        try:
+            page = self.event_service.query_events(
+                username=self.page_username(), limit=EVENTS_PAGE_SIZE, cursor=self.next_cursor, **self.query_options()
+            )
         except Exception as e:
+            self.next_cursor = None
             self.show_error(f"Error loading event list: {str(e)}")
+            return
+        self.next_cursor = page.next_cursor
+        self.event_list.extend_items(page.events)
+        self.update_pager()
+
+    def update_pager(self):
+        self.prev_page_btn.configure(state="normal" if self.prev_cursor else "disabled")
+        self.next_page_btn.configure(state="normal" if self.next_cursor else "disabled")
 
-    def create_event_widget(self, event: Event):
-        frame = ctk.CTkFrame(self.events_frame)
-        frame.pack(fill="x", padx=10, pady=5)
+    def load_web_events(self):
+        # Show what we scraped last time right away, then refresh off the Tk thread
+        events = self.event_service.get_cached_web_events()
+        self.city_box.configure(values=[ALL_CITIES] + self.event_service.get_web_event_cities())
+        self.event_list.set_items(events, empty_text="Loading web events...")
+        self.status_label.configure(text="Updating web events...")
+        self.web_events_streamed = False
+        arrived = queue.Queue()
+        self.web_events_task = BackgroundTask(
+            self.main_frame,
+            self.event_service.get_web_events_async(on_event=arrived.put),
+            on_done=self.on_web_events_loaded,
+            on_error=self.on_web_events_failed,
+            progress=arrived,
+            on_progress=self.on_web_events_arrived
+        )
+
+    def on_web_events_arrived(self, events):
+        # Streamed events are not filtered, the filtered list waits for the saved one
+        if self.web_filter_active():
+            return
+        # The first fresh events replace the cached list, later ones are appended
+        if not self.web_events_streamed:
+            self.web_events_streamed = True
+            self.event_list.set_items(events, empty_text="No events yet")
+        else:
+            self.event_list.extend_items(events)
+
+    def on_web_events_loaded(self, events):
+        self.status_label.configure(text="")
+        self.city_box.configure(values=[ALL_CITIES] + self.event_service.get_web_event_cities())
+        # Swap in the saved, chronological list without jumping back to the top
+        offset = self.event_list.offset
+        self.show_web_events(events)
+        self.event_list.scroll_to(offset)
+
+    def on_web_events_failed(self, error: Exception):
+        self.status_label.configure(text="")
+        self.show_error(f"Error loading event list: {str(error)}")
+
+    def create_event_row(self, parent: ctk.CTkFrame) -> EventRow:
+        row_height = self.event_list.row_height
+        row = EventRow()
+        row.frame = ctk.CTkFrame(parent, height=row_height - 10)
+        row.frame.pack_propagate(False)
         
         # Title
-        title_label = ctk.CTkLabel(
-            frame,
-            text=event.title,
-            font=("Arial", 14, "bold")
+        row.title_label = ctk.CTkLabel(
+            row.frame,
+            text="",
+            font=("Arial", 14, "bold"),
+            anchor="w"
         )
-        title_label.pack(anchor="w", padx=10, pady=(10, 5))
+        row.title_label.pack(fill="x", padx=10, pady=(10, 5))
         
         # Description
-        if event.description:
-            desc_label = ctk.CTkLabel(
-                frame,
-                text=event.description,
-                font=("Arial", 12)
-            )
-            desc_label.pack(anchor="w", padx=10, pady=(0, 10))
+        row.desc_label = ctk.CTkLabel(
+            row.frame,
+            text="",
+            font=("Arial", 12),
+            anchor="w",
+            justify="left"
+        )
+        row.desc_label.pack(fill="x", padx=10, pady=(0, 10))
         
         # Buttons frame
         if not self.view_only and not self.web_only:
-            btn_frame = ctk.CTkFrame(frame)
+            btn_frame = ctk.CTkFrame(row.frame)
             btn_frame.pack(fill="x", padx=10, pady=(0, 10))
+
+            # Packed by bind_event_row while in multi-select mode
+            row.select_var = ctk.BooleanVar(value=False)
+            row.select_box = ctk.CTkCheckBox(btn_frame, text="", width=24, variable=row.select_var)
             
             # Edit button
-            edit_btn = ctk.CTkButton(
+            row.edit_btn = ctk.CTkButton(
                 btn_frame,
                 text="Edit",
-                command=lambda: self.edit_event(event),
                 width=60
             )
-            edit_btn.pack(side="left", padx=5)
+            row.edit_btn.pack(side="left", padx=5)
             
             # Delete button
-            delete_btn = ctk.CTkButton(
+            row.delete_btn = ctk.CTkButton(
                 btn_frame,
                 text="Delete",
-                command=lambda: self.delete_event(event),
                 width=60,
                 fg_color="red",
                 hover_color="darkred"
             )
-            delete_btn.pack(side="left", padx=5)
+            row.delete_btn.pack(side="left", padx=5)
 
             # Assign Users button (only for admin)
             if self.current_user.role == "admin":
-                assign_btn = ctk.CTkButton(
+                row.assign_btn = ctk.CTkButton(
                     btn_frame,
                     text="Assignment",
-                    command=lambda: self.show_assign_users(event),
                     width=80
                 )
-                assign_btn.pack(side="left", padx=5)
+                row.assign_btn.pack(side="left", padx=5)
+        return row
+
+    def bind_event_row(self, row: EventRow, event: Event):
+        row.title_label.configure(text=event.title)
+        details = event_details(event)
+        description = f"{details}\n{event.description or ''}" if details else event.description
+        row.desc_label.configure(text=summarize_description(description))
+        if row.edit_btn is not None:
+            row.edit_btn.configure(command=lambda: self.edit_event(event))
+            row.delete_btn.configure(command=lambda: self.delete_event(event))
+        if row.assign_btn is not None:
+            row.assign_btn.configure(command=lambda: self.show_assign_users(event))
+        if row.select_box is not None:
+            if self.select_mode:
+                row.select_var.set(event.id in self.selected_ids)
+                row.select_box.configure(command=lambda: self.set_selected(event.id, row.select_var.get()))
+                row.select_box.pack(side="left", padx=5, before=row.edit_btn)
+            else:
+                row.select_box.pack_forget()
+
+    def toggle_select_mode(self):
+        self.select_mode = not self.select_mode
+        self.selected_ids = set()
+        self.select_btn.configure(text="Done" if self.select_mode else "Select")
+        for button in self.batch_buttons:
+            button.configure(state="normal" if self.select_mode else "disabled")
+        self.update_selection_label()
+        # Show or hide the checkboxes of the rows in view
+        self.event_list.refresh()
+
+    def set_selected(self, event_id: str, selected: bool):
+        if selected:
+            self.selected_ids.add(event_id)
+        else:
+            self.selected_ids.discard(event_id)
+        self.update_selection_label()
+
+    def select_all(self):
+        self.selected_ids = set(self.event_list.keys)
+        self.update_selection_label()
+        self.event_list.refresh()
+
+    def update_selection_label(self):
+        self.selection_label.configure(text=f"{len(self.selected_ids)} selected" if self.select_mode else "")
+
+    def delete_selected(self):
+        if not self.selected_ids:
+            self.show_error("No events selected")
+            return
+        try:
+            results = self.event_service.delete_events(sorted(self.selected_ids))
+            deleted = [event_id for event_id, was_deleted in results.items() if was_deleted]
+            self.event_list.remove_items(deleted)
+            self.selected_ids = set()
+            self.update_selection_label()
+            self.show_success(f"Deleted {len(deleted)} events")
+        except Exception as e:
+            self.show_error(str(e))
+
+    def show_assign_user_to_selected(self):
+        if not self.selected_ids:
+            self.show_error("No events selected")
+            return
+        usernames = [
+            username for username, user in self.user_service.get_all_users().items()
+            if user.role == "user"  # Only regular users, as in show_assign_users
+        ]
+        if not usernames:
+            self.show_error("There are no users to assign")
+            return
+
+        dialog = ctk.CTkToplevel(self.parent)
+        dialog.title("User assignment")
+        dialog.geometry("400x200")
+
+        ctk.CTkLabel(
+            dialog,
+            text=f"Assign a user to {len(self.selected_ids)} events",
+            font=("Arial", 14, "bold")
+        ).pack(pady=10)
+        username_var = ctk.StringVar(value=usernames[0])
+        ctk.CTkOptionMenu(dialog, values=usernames, variable=username_var).pack(pady=10)
+
+        def save_assignment():
+            try:
+                results = self.event_service.assign_user_to_events(username_var.get(), sorted(self.selected_ids))
+                dialog.destroy()
+                updated = [event for event in results.values() if event is not None]
+                self.show_changed_events(updated)
+                self.show_success(f"Assigned {username_var.get()} to {len(updated)} events")
+            except Exception as e:
+                self.show_error(str(e))
+
+        ctk.CTkButton(
+            dialog,
+            text="Save",
+            command=save_assignment
+        ).pack(pady=10)
 
     def add_event(self):
         title = self.title_entry.get()
         description = self.description_entry.get()
+        event_date = self.date_entry.get()
+        location = self.location_entry.get()
         
         if not title:
             self.show_error("Please enter event title")
             return
             
         try:
-            event = self.event_service.create_event(title, description)
+            event = self.event_service.create_event(title, description, event_date, location)
             if event:
                 # Clear input fields
-                self.title_entry.delete(0, "end")
-                self.description_entry.delete(0, "end")
+                for entry in (self.title_entry, self.description_entry, self.date_entry, self.location_entry):
+                    entry.delete(0, "end")
                 
-                # Reload events
-                self.load_events()
+                self.show_created_event(event)
                 
                 # Show success message
                 self.show_success("Add event successfully!")
         except Exception as e:
             self.show_error(f"Error adding event: {str(e)}")
 
+    def shows_whole_catalog(self) -> bool:
+        # Every event is loaded, in plain id order: a new one can be placed locally
+        return (
+            self.next_cursor is None
+            and not self.showing_search
+            and self.page_username() is None
+            and self.query_options() == DEFAULT_QUERY
+        )
+
+    def show_created_event(self, event: Event):
+        if self.shows_whole_catalog():
+            # Add just the new row, where the next load would put it
+            sort_keys = [event_id_sort_key(item.id) for item in self.event_list.items]
+            self.event_list.insert_item(event, bisect_right(sort_keys, event_id_sort_key(event.id)))
+        else:
+            # Sorted, filtered or partly loaded: only the query knows where it goes
+            self.show_page(self.page_cursor)
+        if self.event_list.index_of(event.id) >= 0:
+            self.event_list.scroll_to_item(event.id)
+
+    def show_changed_events(self, events: List[Event]):
+        if self.showing_search or self.query_options() == DEFAULT_QUERY:
+            # Id order and search results do not move with an edit: patch the rows
+            self.event_list.update_items(events)
+        else:
+            # A sort or filter may move the events or drop them: ask the query again
+            self.show_page(self.page_cursor)
+
+    def import_events(self):
+        path = filedialog.askopenfilename(
+            parent=self.main_frame,
+            title="Import events",
+            filetypes=[("CSV or JSON Lines", "*.csv *.jsonl *.ndjson"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        self.import_btn.configure(state="disabled")
+        self.import_status.configure(text="Importing...")
+        progress = queue.Queue()
+        self.import_task = BackgroundTask(
+            self.main_frame,
+            self.event_service.import_events_async(
+                path,
+                on_progress=lambda rows, elapsed: progress.put((rows, elapsed))
+            ),
+            on_done=self.on_events_imported,
+            on_error=self.on_import_failed,
+            progress=progress,
+            on_progress=self.on_import_progress
+        )
+
+    def on_import_progress(self, updates):
+        # Only the latest count matters
+        rows, elapsed = updates[-1]
+        rate = rows / elapsed if elapsed else 0
+        self.import_status.configure(text=f"{rows} rows read ({rate:.0f} rows/s)")
+
+    def on_events_imported(self, report):
+        # Here on the Tk thread, where the search and query indexes are read
+        self.event_service.index_events(report.events)
+        self.import_btn.configure(state="normal")
+        self.import_status.configure(text="")
+        self.show_success(report.summary())
+        if report.errors:
+            line_number, reason = report.errors[0]
+            self.show_error(f"{len(report.errors)} rows rejected, first at line {line_number}: {reason}")
+        if report.imported:
+            self.load_events()
+
+    def on_import_failed(self, error: Exception):
+        self.import_btn.configure(state="normal")
+        self.import_status.configure(text="")
+        self.show_error(f"Error importing events: {str(error)}")
+
     def edit_event(self, event: Event):
         # Create edit dialog
         dialog = ctk.CTkToplevel(self.parent)
         dialog.title("Edit Event")
-        dialog.geometry("400x300")
+        dialog.geometry("400x420")
         
         # Title
         ctk.CTkLabel(dialog, text="Title:").pack(pady=5)
@@ -234,14 +704,27 @@ class EventUI(BaseUI):
         description_entry = ctk.CTkEntry(dialog)
         description_entry.insert(0, event.description or "")
         description_entry.pack(pady=5)
+
+        ctk.CTkLabel(dialog, text="Date (YYYY-MM-DD):").pack(pady=5)
+        date_entry = ctk.CTkEntry(dialog)
+        date_entry.insert(0, event.date or "")
+        date_entry.pack(pady=5)
+        ctk.CTkLabel(dialog, text="Location:").pack(pady=5)
+        location_entry = ctk.CTkEntry(dialog)
+        location_entry.insert(0, event.location or "")
+        location_entry.pack(pady=5)
         
         def save():
             try:
+                # Checked before anything on the event is touched
+                event_date = check_event_date(date_entry.get())
                 event.title = title_entry.get()
                 event.description = description_entry.get()
-                self.event_service.update_event(event)
+                event.date = event_date
+                event.location = location_entry.get().strip()
+                updated_event = self.event_service.update_event(event)
                 dialog.destroy()
-                self.load_events()
+                self.show_changed_events([updated_event])
                 self.show_success("Event update successful!")
             except Exception as e:
                 self.show_error(str(e))
@@ -254,8 +737,8 @@ class EventUI(BaseUI):
 
     def delete_event(self, event: Event):
         try:
-            self.event_service.delete_event(event.id)
-            self.load_events()
+            if self.event_service.delete_event(event.id):
+                self.event_list.remove_item(event.id)
             self.show_success("Event deleted successfully!")
         except Exception as e:
             self.show_error(str(e))
@@ -304,14 +787,15 @@ class EventUI(BaseUI):
             ]
             
             # Update event assignments
-            self.event_service.assign_users_to_event(event.id, selected_users)
+            updated_event = self.event_service.assign_users_to_event(event.id, selected_users)
             
             # Show success message
             self.show_success("Successful user assignment!")
             
-            # Close dialog and refresh event list
+            # Close dialog and refresh only this event's row
             dialog.destroy()
-            self.load_events()
+            if updated_event:
+                self.show_changed_events([updated_event])
         
         # Save button
         ctk.CTkButton(
@@ -321,38 +805,17 @@ class EventUI(BaseUI):
         ).pack(pady=10)
 
     def search_events(self):
-        search_text = self.search_entry.get().lower()
+        search_text = self.search_entry.get()
         try:
-            # Clear existing events
-            for widget in self.events_frame.winfo_children():
-                widget.destroy()
-            
-            # Get events based on mode
-            if self.web_only:
-                events = self.event_service.get_web_events()
-            else:
-                # For regular users, only show assigned events
-                if self.current_user.role == "user":
-                    events = self.event_service.get_user_events(self.current_user.username)
-                else:
-                    events = self.event_service.get_events()
-            
-            # Filter events by title
-            if search_text:
-                events = [event for event in events if search_text in event.title.lower()]
-            
-            if not events:
-                no_events_label = ctk.CTkLabel(
-                    self.events_frame,
-                    text="No events found",
-                    font=("Arial", 14)
-                )
-                no_events_label.pack(pady=20)
-                return
+            # For regular users, only search assigned events
+            username = self.current_user.username if self.current_user.role == "user" else None
+            events, _ = self.event_service.search_events(search_text, username=username, limit=None)
             
-            # Add events to the container
-            for event in events:
-                self.create_event_widget(event)
+            # Search results are shown whole, not paged
+            self.prev_cursor = self.next_cursor = None
+            self.showing_search = True
+            self.update_pager()
+            self.event_list.set_items(events, empty_text="No events found")
                 
         except Exception as e:
             self.show_error(f"Error while searching for event: {str(e)}")
@@ -2,6 +2,7 @@ import customtkinter as ctk
 from typing import Callable
 from src.model.user import User
 from src.service.user_service import UserService
+from src.ui.background import BackgroundTask
 from src.ui.base_ui import BaseUI
 
 class LoginUI(BaseUI):
@@ -15,6 +16,7 @@ class LoginUI(BaseUI):
         self.parent = parent
         self.user_service = user_service
         self.on_login_success = on_login_success
+        self.login_task = None
         
         self.setup_ui()
 
@@ -41,11 +43,12 @@ class LoginUI(BaseUI):
         self.password_entry.pack(pady=5)
         
         # Login button
-        ctk.CTkButton(
+        self.login_button = ctk.CTkButton(
             form_frame,
             text="Login",
             command=self.login
-        ).pack(pady=10)
+        )
+        self.login_button.pack(pady=10)
         
         # Register button
         ctk.CTkButton(
@@ -68,19 +71,34 @@ class LoginUI(BaseUI):
             text_color="red"
         )
         self.error_label.pack(pady=5)
+        self.form_frame = form_frame
 
     def login(self):
         username = self.username_entry.get()
         password = self.password_entry.get()
         
-        try:
-            user = self.user_service.authenticate_user(username, password)
-            if user:
-                self.on_login_success(user)
-            else:
-                self.error_label.configure(text="Invalid username or password")
-        except Exception as e:
-            self.error_label.configure(text=str(e))
+        # Password hashing is slow on purpose, verify on a worker thread
+        self.login_button.configure(state="disabled")
+        self.error_label.configure(text="Signing in...")
+        self.login_task = BackgroundTask(
+            self.form_frame,
+            self.user_service.authenticate_user_async(username, password),
+            on_done=self.on_login_checked,
+            on_error=self.on_login_failed,
+            poll_ms=50
+        )
+
+    def on_login_checked(self, user):
+        self.login_button.configure(state="normal")
+        if user:
+            self.error_label.configure(text="")
+            self.on_login_success(user)
+        else:
+            self.error_label.configure(text="Invalid username or password")
+
+    def on_login_failed(self, error: Exception):
+        self.login_button.configure(state="normal")
+        self.error_label.configure(text=str(error))
 
     def show_register(self):
         # Create register dialog
@@ -135,22 +153,34 @@ class LoginUI(BaseUI):
                 error_label.configure(text="Passwords do not match")
                 return
             
-            try:
-                user = self.user_service.register_user(username, password)
+            def registered(user):
                 if user:
                     dialog.destroy()
                     self.error_label.configure(text="Registration successful! Please login.")
                 else:
+                    register_button.configure(state="normal")
                     error_label.configure(text="Username already exists")
-            except Exception as e:
-                error_label.configure(text=str(e))
+
+            def failed(error: Exception):
+                register_button.configure(state="normal")
+                error_label.configure(text=str(error))
+
+            register_button.configure(state="disabled")
+            BackgroundTask(
+                form_frame,
+                self.user_service.register_user_async(username, password),
+                on_done=registered,
+                on_error=failed,
+                poll_ms=50
+            )
         
         # Register button
-        ctk.CTkButton(
+        register_button = ctk.CTkButton(
             form_frame,
             text="Register",
             command=register
-        ).pack(pady=20)
+        )
+        register_button.pack(pady=20)
 
     def guest_login(self):
         guest = User(
@@ -5,8 +5,6 @@ from src.service.user_service import UserService
 from src.service.event_service import EventService
 from src.ui.base_ui import BaseUI
 from src.ui.login_ui import LoginUI
-from src.ui.event_ui import EventUI
-from src.ui.user_ui import UserUI
 
 class MainUI(BaseUI):
     def __init__(self, user_service: UserService, event_service: EventService):
@@ -81,7 +79,12 @@ class MainUI(BaseUI):
             command=self.logout
         ).pack(pady=10)
 
+    # Screens past the login window are imported when first opened, so the
+    # login window paints before their modules load
+
     def show_event_management(self):
+        from src.ui.event_ui import EventUI
+
         self.clear_container(self.main_container)
         EventUI(
             self.main_container,
@@ -92,6 +95,8 @@ class MainUI(BaseUI):
         )
 
     def show_user_management(self):
+        from src.ui.user_ui import UserUI
+
         self.clear_container(self.main_container)
         user_ui = UserUI(
             self.main_container,
@@ -101,6 +106,8 @@ class MainUI(BaseUI):
         )
 
     def show_events(self):
+        from src.ui.event_ui import EventUI
+
         self.clear_container(self.main_container)
         EventUI(
             self.main_container,
@@ -112,6 +119,8 @@ class MainUI(BaseUI):
         )
 
     def show_web_events(self):
+        from src.ui.event_ui import EventUI
+
         self.clear_container(self.main_container)
         EventUI(
             self.main_container,
@@ -2,6 +2,7 @@ import customtkinter as ctk
 from typing import Callable
 from ..model.user import User
 from ..service.user_service import UserService
+from .background import BackgroundTask
 from .base_ui import BaseUI
 
 class UserUI(BaseUI):
@@ -86,16 +87,32 @@ class UserUI(BaseUI):
             role = role_var.get()
             
             if username and password:
-                user = self.user_service.register_user(username, password, role)
-                if user:
-                    window.destroy()
-                    self.show_success("User added successfully!", self.setup_ui)
-                else:
-                    self.show_error("Username already exists")
+                def saved(user):
+                    if user:
+                        window.destroy()
+                        self.show_success("User added successfully!", self.setup_ui)
+                    else:
+                        save_button.configure(state="normal")
+                        self.show_error("Username already exists")
+
+                def failed(error):
+                    save_button.configure(state="normal")
+                    self.show_error(str(error))
+
+                # Hashing the password takes a moment, keep the window responsive
+                save_button.configure(state="disabled")
+                BackgroundTask(
+                    window,
+                    self.user_service.register_user_async(username, password, role),
+                    on_done=saved,
+                    on_error=failed,
+                    poll_ms=50
+                )
             else:
                 self.show_error("Please fill all fields")
         
-        ctk.CTkButton(window, text="Save User", command=save_user).pack(pady=20)
+        save_button = ctk.CTkButton(window, text="Save User", command=save_user)
+        save_button.pack(pady=20)
 
     def show_edit_user(self, username: str, user: User):
         window = ctk.CTkToplevel(self.parent)
@@ -117,16 +134,31 @@ class UserUI(BaseUI):
             role = role_var.get()
             
             if password:
-                updated_user = self.user_service.update_user(username, password, role)
-                if updated_user:
-                    window.destroy()
-                    self.show_success("User updated successfully!", self.setup_ui)
-                else:
-                    self.show_error("Failed to update user")
+                def saved(updated_user):
+                    if updated_user:
+                        window.destroy()
+                        self.show_success("User updated successfully!", self.setup_ui)
+                    else:
+                        save_button.configure(state="normal")
+                        self.show_error("Failed to update user")
+
+                def failed(error):
+                    save_button.configure(state="normal")
+                    self.show_error(str(error))
+
+                save_button.configure(state="disabled")
+                BackgroundTask(
+                    window,
+                    self.user_service.update_user_async(username, password, role),
+                    on_done=saved,
+                    on_error=failed,
+                    poll_ms=50
+                )
             else:
                 self.show_error("Please enter a new password")
         
-        ctk.CTkButton(window, text="Save Changes", command=save_changes).pack(pady=20)
+        save_button = ctk.CTkButton(window, text="Save Changes", command=save_changes)
+        save_button.pack(pady=20)
 
     def delete_user(self, username: str):
         if self.user_service.delete_user(username):
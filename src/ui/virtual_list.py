@@ -0,0 +1,220 @@
+import customtkinter as ctk
+from typing import Any, Callable, List, Optional
+
+class VirtualList(ctk.CTkFrame):
+    """Scrollable list that only builds widgets for the rows in view.
+
+    `create_row(parent)` builds one reusable row object exposing a `frame`
+    attribute, `bind_row(row, item)` fills it with an item. A pool of rows
+    (visible rows plus `overscan` on each side) is created once and rebound as
+    the list scrolls, so showing the list costs the same for 10 or 100k items.
+    Single items can be inserted, updated or removed by `item_key` without
+    touching the rows of any other item in view. `on_scroll_end`, if given,
+    is called (from the event loop) whenever the end of the list comes
+    within a screen of the view, so more items can be loaded.
+    """
+
+    def __init__(
+        self,
+        master: Any,
+        row_height: int,
+        create_row: Callable[[ctk.CTkFrame], Any],
+        bind_row: Callable[[Any, Any], None],
+        item_key: Callable[[Any], Any] = lambda item: item,
+        overscan: int = 2,
+        empty_text: str = "No items",
+        on_scroll_end: Optional[Callable[[], None]] = None,
+        **kwargs
+    ):
+        super().__init__(master, **kwargs)
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.item_key = item_key
+        self.overscan = overscan
+        self.on_scroll_end = on_scroll_end
+        self.items: List[Any] = []
+        # Parallel to items, so positions are found with a C-level list.index
+        self.keys: List[Any] = []
+        self.rows: List[Any] = []
+        # Item currently bound to each pooled row, to skip redundant rebinding
+        self.bound: List[Optional[Any]] = []
+        self.offset = 0
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.empty_label = ctk.CTkLabel(self.body, text=empty_text, font=("Arial", 14))
+
+        self.body.bind("<Configure>", lambda _: self.render())
+        self.body.bind("<Enter>", self.bind_mousewheel)
+        self.body.bind("<Leave>", self.unbind_mousewheel)
+        # A bind_all handler would otherwise outlive the list when the screen changes
+        self.body.bind("<Destroy>", lambda _: self.unbind_mousewheel())
+
+    def set_items(self, items: List[Any], empty_text: Optional[str] = None):
+        self.items = list(items)
+        self.keys = [self.item_key(item) for item in self.items]
+        if empty_text is not None:
+            self.empty_label.configure(text=empty_text)
+        self.offset = 0
+        self.bound = [None] * len(self.rows)
+        self.render()
+
+    def index_of(self, key: Any) -> int:
+        try:
+            return self.keys.index(key)
+        except ValueError:
+            return -1
+
+    def insert_item(self, item: Any, index: Optional[int] = None):
+        if index is None:
+            index = len(self.items)
+        self.items.insert(index, item)
+        self.keys.insert(index, self.item_key(item))
+        self.render()
+
+    def extend_items(self, items: List[Any]):
+        self.items.extend(items)
+        self.keys.extend(self.item_key(item) for item in items)
+        self.render()
+
+    def update_item(self, item: Any) -> bool:
+        index = self.index_of(self.item_key(item))
+        if index < 0:
+            return False
+        self.items[index] = item
+        # The item may have been edited in place, so force its row to rebind
+        for slot, bound_item in enumerate(self.bound):
+            if bound_item is item:
+                self.bound[slot] = None
+        self.render()
+        return True
+
+    def update_items(self, items: List[Any]):
+        positions = {key: index for index, key in enumerate(self.keys)}
+        for item in items:
+            index = positions.get(self.item_key(item))
+            if index is not None:
+                self.items[index] = item
+        self.refresh()
+
+    def refresh(self):
+        # Rebind every row in view, e.g. after a change to what bind_row shows
+        self.bound = [None] * len(self.rows)
+        self.render()
+
+    def remove_item(self, key: Any) -> bool:
+        index = self.index_of(key)
+        if index < 0:
+            return False
+        del self.items[index]
+        del self.keys[index]
+        self.render()
+        return True
+
+    def remove_items(self, keys: List[Any]):
+        # One pass over the list instead of a search per key
+        removed = set(keys)
+        kept = [index for index, key in enumerate(self.keys) if key not in removed]
+        self.items = [self.items[index] for index in kept]
+        self.keys = [self.keys[index] for index in kept]
+        self.render()
+
+    def scroll_to_item(self, key: Any):
+        index = self.index_of(key)
+        if index >= 0:
+            self.scroll_to(index * self.row_height)
+
+    def visible_height(self) -> int:
+        # winfo_height is in real pixels, row heights and place() use scaled units
+        return max(int(self.body.winfo_height() / self._get_widget_scaling()), 1)
+
+    def content_height(self) -> int:
+        return len(self.items) * self.row_height
+
+    def render(self):
+        if not self.items:
+            for row in self.rows:
+                row.frame.place_forget()
+            self.empty_label.place(relx=0.5, y=20, anchor="n")
+            self.scrollbar.set(0, 1)
+            return
+        self.empty_label.place_forget()
+
+        height = self.visible_height()
+        self.offset = min(max(self.offset, 0), max(self.content_height() - height, 0))
+
+        # Grow the pool up to what fits in the viewport, never beyond
+        pool_size = min(len(self.items), height // self.row_height + 2 + 2 * self.overscan)
+        while len(self.rows) < pool_size:
+            self.rows.append(self.create_row(self.body))
+            self.bound.append(None)
+
+        # Item i always lands in slot i % pool_size, so scrolling only rebinds
+        # the rows that wrapped around
+        start = max(self.offset // self.row_height - self.overscan, 0)
+        end = min(start + pool_size, len(self.items))
+        used_slots = set()
+        for index in range(start, end):
+            slot = index % pool_size
+            used_slots.add(slot)
+            item = self.items[index]
+            if self.bound[slot] is not item:
+                self.bind_row(self.rows[slot], item)
+                self.bound[slot] = item
+            self.rows[slot].frame.place(x=0, y=index * self.row_height - self.offset, relwidth=1)
+        for slot, row in enumerate(self.rows):
+            if slot not in used_slots:
+                row.frame.place_forget()
+                self.bound[slot] = None
+
+        total = self.content_height()
+        self.scrollbar.set(self.offset / total, min((self.offset + height) / total, 1))
+        if self.on_scroll_end is not None and self.near_end():
+            # Not from inside render(), the callback will add items
+            self.after_idle(self.on_scroll_end)
+
+    def near_end(self) -> bool:
+        height = self.visible_height()
+        return self.offset + height >= self.content_height() - height
+
+    def scroll_to(self, offset: int):
+        self.offset = int(offset)
+        self.render()
+
+    def yview(self, *args):
+        # Same protocol as a Tk scrollbar command: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * self.content_height())
+        elif args[0] == "scroll":
+            step = self.visible_height() if args[2] == "pages" else self.row_height
+            self.scroll_to(self.offset + int(args[1]) * step)
+
+    def on_mousewheel(self, event):
+        if getattr(event, "num", None) == 4:
+            units = -1
+        elif getattr(event, "num", None) == 5:
+            units = 1
+        else:
+            units = -1 if event.delta > 0 else 1
+        self.yview("scroll", units, "units")
+
+    def bind_mousewheel(self, _event=None):
+        self.body.bind_all("<MouseWheel>", self.on_mousewheel)
+        self.body.bind_all("<Button-4>", self.on_mousewheel)
+        self.body.bind_all("<Button-5>", self.on_mousewheel)
+
+    def unbind_mousewheel(self, event=None):
+        # Leave also fires when the pointer moves onto one of our own rows
+        if event is not None:
+            widget = self.winfo_containing(event.x_root, event.y_root)
+            body_path = str(self.body)
+            if widget is not None and (str(widget) == body_path or str(widget).startswith(body_path + ".")):
+                return
+        self.body.unbind_all("<MouseWheel>")
+        self.body.unbind_all("<Button-4>")
+        self.body.unbind_all("<Button-5>")
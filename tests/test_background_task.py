@@ -0,0 +1,91 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from src.ui.background import BackgroundTask
+
+class EventLoop:
+    """The part of a Tk widget BackgroundTask uses, run by hand on the test thread"""
+
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+        self.destroy_handlers = []
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.pending[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def bind(self, sequence, handler, add=None):
+        assert sequence == "<Destroy>"
+        self.destroy_handlers.append(handler)
+
+    def destroy(self):
+        for handler in self.destroy_handlers:
+            handler(None)
+
+    def run_until_idle(self):
+        # Run the scheduled callbacks in order, pausing between them like after() would
+        while self.pending:
+            time.sleep(0.01)
+            self.pending.pop(min(self.pending))()
+
+def test_results_and_progress_are_delivered_on_the_polling_thread():
+    loop = EventLoop()
+    progress = queue.Queue()
+    release = threading.Event()
+    calls = []
+
+    def work():
+        progress.put(1)
+        progress.put(2)
+        release.wait(5)
+        progress.put(3)
+        return "done"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        BackgroundTask(
+            loop,
+            executor.submit(work),
+            on_done=lambda result: calls.append(("done", result, threading.current_thread())),
+            progress=progress,
+            on_progress=lambda items: calls.append(("progress", items, threading.current_thread())),
+        )
+        release.set()
+        loop.run_until_idle()
+
+    delivered = [item for kind, items, _ in calls if kind == "progress" for item in items]
+    assert delivered == [1, 2, 3]
+    assert calls[-1][:2] == ("done", "done")
+    assert all(thread is threading.current_thread() for _, _, thread in calls)
+
+def test_errors_go_to_on_error():
+    loop = EventLoop()
+    future = Future()
+    future.set_exception(ValueError("bad row"))
+    errors = []
+
+    BackgroundTask(loop, future, on_done=lambda result: errors.append("done"), on_error=errors.append)
+    loop.run_until_idle()
+
+    assert [str(error) for error in errors] == ["bad row"]
+
+def test_destroying_the_widget_cancels_the_task():
+    loop = EventLoop()
+    queued, running = Future(), Future()
+    running.set_running_or_notify_cancel()
+    results = []
+
+    BackgroundTask(loop, queued, on_done=results.append)
+    BackgroundTask(loop, running, on_done=results.append)
+    loop.destroy()
+    running.set_result("late")
+    loop.run_until_idle()
+
+    # Work not started yet is cancelled, a running job's result is ignored
+    assert queued.cancelled()
+    assert results == []
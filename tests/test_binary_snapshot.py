@@ -0,0 +1,46 @@
+import pytest
+from src.repository.binary_snapshot import Snapshot, write_snapshot
+from src.repository.user_repository import UserRepository
+
+RECORDS = [
+    ("1", ("Hội chợ sách", "x" * 1000, "2025-10-12", "Huế"), ["bob", "eve"]),
+    ("2", ("b", "", "", ""), []),
+]
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_records_round_trip(tmp_path, compress):
+    path = str(tmp_path / "events.snap")
+    write_snapshot(path, iter(RECORDS), (10, 20), compress, {'fields': ['title']})
+
+    snapshot = Snapshot.open(path, (10, 20))
+    try:
+        assert snapshot.keys == ["1", "2"]
+        assert [tuple(snapshot.fields(index)) for index in range(snapshot.count)] == [fields for _, fields, _ in RECORDS]
+        assert snapshot.links() == {"1": ["bob", "eve"]}
+        assert snapshot.meta == {'fields': ['title']}
+    finally:
+        snapshot.close()
+
+def test_a_snapshot_of_another_source_or_a_damaged_one_is_ignored(tmp_path):
+    path = str(tmp_path / "events.snap")
+    write_snapshot(path, iter(RECORDS), (10, 20))
+
+    assert Snapshot.open(path, (10, 21)) is None
+    assert Snapshot.open(path, None) is None
+    with open(path, "r+b") as f:
+        f.write(b"NOTASNAP")
+    assert Snapshot.open(path, (10, 20)) is None
+
+def test_users_load_from_the_snapshot_until_users_json_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repository = UserRepository(flush_delay=0)
+    repository.create_user("bob", "hash", "admin")
+    repository.close()
+
+    repository = UserRepository(flush_delay=0)
+    assert not repository.snapshot_stale
+    assert repository.get_user("bob").role == "admin"
+
+    with open("users.json", "w", encoding="utf-8") as f:
+        f.write('{"eve": {"password": "x", "role": "user", "assigned_events": []}}')
+    assert list(UserRepository(flush_delay=0).users) == ["eve"]
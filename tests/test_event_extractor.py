@@ -0,0 +1,81 @@
+import os
+import pytest
+from src.service.event_extractor import extract_events, iter_extract_events
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "fixtures", "sansukien_home.html")
+
+def read_fixture() -> str:
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        return f.read()
+
+def legacy_extract(html: str):
+    """The BeautifulSoup scraping the extractor replaced, structured events only"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    event_sections = [
+        soup.find_all('div', class_='event-item'),
+        soup.find_all('div', class_='event-card'),
+        soup.find_all('article'),
+        soup.find_all('div', class_='event'),
+        soup.find_all('div', class_='event-list-item'),
+        soup.find_all('div', class_='event-section')
+    ]
+    events = []
+    for section in event_sections:
+        if not section:
+            continue
+        for event in section:
+            title_elem = None
+            for class_name in ['title', 'event-title', 'event-name', 'event-heading']:
+                title_elem = event.find(class_=class_name)
+                if title_elem:
+                    break
+            if not title_elem:
+                for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+                    title_elem = event.find(tag)
+                    if title_elem:
+                        break
+            if not title_elem:
+                for elem in event.find_all(['div', 'span', 'p']):
+                    text = elem.get_text(strip=True)
+                    if 5 < len(text) < 100 and not any(keyword in text.lower() for keyword in ['địa điểm', 'location', 'date', 'time']):
+                        title_elem = elem
+                        break
+            date_elem = (
+                event.find('time') or
+                event.find(['span', 'div'], class_=['date', 'event-date', 'time', 'event-time']) or
+                event.find('div', string=lambda text: text and any(keyword in text.lower() for keyword in ['ngày', 'date', 'thời gian', 'time']))
+            )
+            location_elem = (
+                event.find(['span', 'div'], class_=['location', 'event-location', 'venue', 'event-venue']) or
+                event.find('div', string=lambda text: text and any(keyword in text.lower() for keyword in ['địa điểm', 'location', 'venue']))
+            )
+            desc_elem = (
+                event.find(['div', 'p'], class_=['description', 'event-description', 'content', 'event-content']) or
+                event.find('p')
+            )
+            fields = {
+                'title': title_elem.get_text(strip=True) if title_elem else None,
+                'date': date_elem.get_text(strip=True) if date_elem else None,
+                'location': location_elem.get_text(strip=True) if location_elem else None,
+                'description': desc_elem.get_text(strip=True) if desc_elem else None,
+            }
+            if any(fields.values()):
+                events.append(fields)
+        break
+    return events
+
+def test_extractor_matches_the_beautifulsoup_scraper_on_the_saved_page():
+    pytest.importorskip("bs4")
+    html = read_fixture()
+
+    expected = legacy_extract(html)
+
+    assert expected
+    assert extract_events(html) == expected
+
+def test_streaming_extraction_matches_batch_extraction():
+    html = read_fixture()
+    chunks = (html[i:i + 256] for i in range(0, len(html), 256))
+
+    assert list(iter_extract_events(chunks)) == extract_events(html)
@@ -0,0 +1,62 @@
+from src.repository.event_repository import EventRepository
+from src.repository.user_repository import UserRepository
+from src.service.event_service import EventService
+
+def make_service(tmp_path, monkeypatch) -> EventService:
+    monkeypatch.chdir(tmp_path)
+    event_repository = EventRepository(flush_delay=0)
+    user_repository = UserRepository(flush_delay=0, event_repository=event_repository)
+    user_repository.create_user("bob", "x")
+    user_repository.create_user("eve", "x")
+    return EventService(event_repository, user_repository)
+
+def test_csv_rows_are_validated_and_the_valid_ones_imported(tmp_path, monkeypatch):
+    service = make_service(tmp_path, monkeypatch)
+    path = tmp_path / "su_kien.csv"
+    path.write_text(
+        # Byte order mark, as spreadsheet exports write it
+        "\ufefftitle,description,date,location,assigned_users\n"
+        "Hội chợ sách,,2025-10-12,Huế,bob; eve\n"
+        ",no title,,,\n"
+        "Triển lãm,,12/10/2025,,\n"
+        "Đêm nhạc,,,,mallory\n"
+        "Hội thảo,,,Hà Nội,\n",
+        encoding="utf-8"
+    )
+
+    report = service.import_events(str(path))
+
+    assert (report.rows, report.imported) == (5, 2)
+    assert [line for line, _ in report.errors] == [3, 4, 5]
+    assert "unknown users: mallory" in report.errors[2][1]
+    first = report.events[0]
+    assert (first.title, first.assigned_users, first.location) == ("Hội chợ sách", ["bob", "eve"], "Huế")
+    assert service.event_repository.get_user_event_ids("eve") == [first.id]
+    # Indexed for search right away
+    assert [event.id for event in service.search_events("hoi thao")[0]] == [report.events[1].id]
+
+def test_json_lines_are_persisted_once(tmp_path, monkeypatch):
+    service = make_service(tmp_path, monkeypatch)
+    path = tmp_path / "su_kien.jsonl"
+    path.write_text(
+        '{"title": "a", "assigned_users": ["bob"]}\n'
+        'not json\n'
+        '\n'
+        '{"title": "b", "date": "2025-10-12/2025-10-14"}\n'
+        '["not", "an", "object"]\n',
+        encoding="utf-8"
+    )
+    writer = service.event_repository.writer
+    persists = []
+    persist = writer.flush_fn
+    writer.flush_fn = lambda: (persists.append(1), persist())
+
+    report = service.import_events(str(path), index=False)
+
+    assert persists == [1]
+    assert report.imported == 2
+    assert report.errors == [(2, "not a JSON object"), (5, "not a JSON object")]
+    # index=False leaves the indexes to the caller
+    assert service.search_index is None
+    reopened = EventRepository(flush_delay=0)
+    assert sorted(event.title for event in reopened.get_all_events().values()) == ["a", "b"]
@@ -0,0 +1,46 @@
+import json
+from src.repository.event_journal import EventJournal
+from src.repository.event_repository import EventRepository
+
+def test_replay_cuts_a_torn_tail(tmp_path):
+    path = str(tmp_path / "events.journal")
+    journal = EventJournal(path)
+    journal.append('put', '1', {'title': 'a'})
+    journal.flush()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"op": "put", "id": "2", "da')
+
+    assert [entry['id'] for entry in journal.replay()] == ['1']
+    journal.append('put', '3', {'title': 'c'})
+    journal.flush()
+
+    assert [entry['id'] for entry in EventJournal(path).replay()] == ['1', '3']
+
+def test_replay_terminates_a_whole_last_entry(tmp_path):
+    path = str(tmp_path / "events.journal")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'op': 'delete', 'id': '1'}))
+    journal = EventJournal(path)
+
+    assert [entry['id'] for entry in journal.replay()] == ['1']
+    journal.append('delete', '2')
+    journal.flush()
+
+    assert [entry['id'] for entry in EventJournal(path).replay()] == ['1', '2']
+
+def test_mutations_after_a_crash_survive_the_next_restart(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Every repository is dropped without close(), as a crash would leave it
+    repository = EventRepository(flush_delay=0)
+    first = repository.create_event("first")
+    repository.flush()
+    with open("events.journal", 'a', encoding='utf-8') as f:
+        f.write('{"op": "put", "id": "99", "data": {"ti')
+
+    repository = EventRepository(flush_delay=0)
+    assert list(repository.get_all_events()) == [first.id]
+    created = [repository.create_event("second"), repository.create_event("third")]
+    repository.flush()
+
+    repository = EventRepository(flush_delay=0)
+    assert sorted(repository.get_all_events()) == sorted([first.id] + [event.id for event in created])
@@ -0,0 +1,69 @@
+from datetime import date
+import pytest
+from src.model.event import Event
+from src.service.event_normalizer import (
+    city_key, location_city, month_range, normalize_event_date, normalize_location, parse_event_date
+)
+from src.service.event_query import DateRangeIndex
+
+TODAY = date(2025, 10, 1)
+
+@pytest.mark.parametrize("text, expected", [
+    ("Địa điểm: GEM Center, TP.HCM", "GEM Center, Hồ Chí Minh"),
+    ("Location - Opera House, Hanoi", "Opera House, Hà Nội"),
+    ("Tại Nhà hát Lớn, Hà Nội", "Nhà hát Lớn, Hà Nội"),
+    ("at GEM Center", "GEM Center"),
+    ("Venue:Hall 2", "Hall 2"),
+    # Labels only match as whole words
+    ("Atlanta Convention Center", "Atlanta Convention Center"),
+    ("AT&T Hall, Hanoi", "AT&T Hall, Hà Nội"),
+    ("Atrium, Saigon", "Atrium, Hồ Chí Minh"),
+    ("Venues Hall", "Venues Hall"),
+    # Only a part that is nothing but the city is renamed
+    ("Hanoi Opera House", "Hanoi Opera House"),
+])
+def test_normalize_location(text, expected):
+    assert normalize_location(text) == expected
+
+def test_location_city_and_key():
+    assert location_city("Nhà hát Lớn Hà Nội") == "Hà Nội"
+    assert location_city("Atrium, Saigon") == "Hồ Chí Minh"
+    assert location_city("Atlanta Convention Center") == "Atlanta Convention Center"
+    assert city_key("TP.HCM") == city_key("ho chi minh") == city_key("Sài Gòn")
+
+@pytest.mark.parametrize("text, expected", [
+    ("12/10/2025", "2025-10-12"),
+    ("Thứ Bảy, ngày 12 tháng 10 năm 2025", "2025-10-12"),
+    ("Sat, October 12, 2025 7:00 PM", "2025-10-12"),
+    ("12 - 14/10/2025", "2025-10-12/2025-10-14"),
+    ("Oct 12-14, 2025", "2025-10-12/2025-10-14"),
+    ("28/12 - 02/01", "2025-12-28/2026-01-02"),
+    # No year and long past: next year's
+    ("05/03", "2026-03-05"),
+    ("2025-10-12", "2025-10-12"),
+    ("Giá vé 1.500.000đ", ""),
+    ("", ""),
+])
+def test_normalize_event_date(text, expected):
+    assert normalize_event_date(text, TODAY) == expected
+
+def test_clock_times_are_not_dates():
+    assert parse_event_date("19:30, 12/10/2025", TODAY) == (date(2025, 10, 12), date(2025, 10, 12))
+
+def test_date_range_index_finds_events_running_in_a_month():
+    events = [
+        Event("1", "a", "", [], "2025-10-05", "GEM Center, Hồ Chí Minh"),
+        Event("2", "b", "", [], "2025-09-28/2025-10-02", "Sài Gòn"),
+        Event("3", "c", "", [], "2025-11-01", "Hà Nội"),
+        Event("4", "d", "", [], "", "Hà Nội"),
+    ]
+    index = DateRangeIndex(events)
+    first, last = month_range(TODAY)
+
+    assert [event.id for event in index.between(first, last)] == ["2", "1"]
+    assert [event.id for event in index.between(first, last, "tp hcm")] == ["2", "1"]
+    assert [event.id for event in index.between(*month_range(TODAY, 1), "ha noi")] == ["3"]
+
+    index.remove("2")
+    assert [event.id for event in index.between(first, last)] == ["1"]
+    assert index.city_names() == ["Hà Nội", "Hồ Chí Minh"]
@@ -0,0 +1,72 @@
+from src.model.event import Event
+from src.repository.event_repository import EventRepository
+from src.repository.user_repository import UserRepository
+from src.service.event_query import EventQueryIndex, collation_key
+from src.service.event_service import EventService
+from src.service.user_service import UserService
+
+def test_collation_key_sorts_in_vietnamese_dictionary_order():
+    words = ["Đà", "bả", "Bình", "Bắc", "ba", "Bà", "10 năm", "Ăn", "an", "Ư", "u"]
+
+    assert sorted(words, key=collation_key) == ["10 năm", "an", "Ăn", "ba", "Bà", "bả", "Bắc", "Bình", "Đà", "u", "Ư"]
+
+def make_index() -> EventQueryIndex:
+    return EventQueryIndex([
+        Event("1", "Bình", "", ["bob"], "2025-10-12", "Huế"),
+        Event("2", "An", "", [], "", "Hà Nội"),
+        Event("3", "Đà", "", ["bob", "eve"], "2025-10-01", "hue"),
+        Event("10", "Bắc", "", [], "2025-11-01", "Huế"),
+    ])
+
+def test_sorts_and_filters():
+    index = make_index()
+
+    assert index.query('title')[0] == ["2", "10", "1", "3"]
+    # Undated events last in both directions
+    assert index.query('date')[0] == ["3", "1", "10", "2"]
+    assert index.query('date', descending=True)[0] == ["10", "1", "3", "2"]
+    assert index.query('assignees', descending=True)[0][:2] == ["3", "1"]
+    assert index.query('id', location="HUE")[0] == ["1", "3", "10"]
+    assert index.query('id', assigned=False)[0] == ["2", "10"]
+    assert index.query('title', within=["1", "2", "3"], assigned=True)[0] == ["1", "3"]
+    assert index.locations() == ["Hà Nội", "Huế"]
+
+def test_pages_follow_cursors_in_both_directions():
+    index = make_index()
+
+    first, next_cursor, prev_cursor = index.query('title', limit=3)
+    assert (first, prev_cursor) == (["2", "10", "1"], None)
+    second, next_cursor, prev_cursor = index.query('title', limit=3, cursor=next_cursor)
+    assert (second, next_cursor) == (["3"], None)
+    assert index.query('title', limit=3, cursor=prev_cursor)[0] == first
+
+def test_edits_move_events_between_partitions():
+    index = make_index()
+    index.query('id', assigned=True)
+    index.query('title', location="Huế")
+
+    index.add(Event("2", "Ánh", "", ["eve"], "", "Huế"))
+    index.remove("3")
+
+    assert index.query('id', assigned=True)[0] == ["1", "2"]
+    assert index.query('title', location="Huế")[0] == ["2", "10", "1"]
+    assert index.locations() == ["Huế"]
+
+def test_deleting_a_user_reindexes_only_its_events(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    event_repository = EventRepository(flush_delay=0)
+    user_repository = UserRepository(flush_delay=0, event_repository=event_repository)
+    event_service = EventService(event_repository, user_repository)
+    user_service = UserService(user_repository, on_user_deleted=event_service.user_deleted)
+    user_repository.create_user("bob", "x")
+    assigned = event_service.create_event("a")
+    event_service.create_event("b")
+    event_service.assign_users_to_event(assigned.id, ["bob"])
+    query_index = event_service.get_query_index()
+    assert [event.id for event in event_service.query_events(assigned=True).events] == [assigned.id]
+
+    user_service.delete_user("bob")
+
+    assert event_service.query_index is query_index
+    assert event_service.query_events(assigned=True).events == []
+    assert len(event_service.query_events(assigned=False).events) == 2
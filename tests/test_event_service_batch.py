@@ -0,0 +1,66 @@
+import threading
+from src.model.event import Event
+from src.repository.event_repository import EventRepository
+from src.repository.user_repository import UserRepository
+from src.service.event_service import EventService
+
+def make_service(tmp_path, monkeypatch) -> EventService:
+    monkeypatch.chdir(tmp_path)
+    event_repository = EventRepository(flush_delay=0)
+    user_repository = UserRepository(flush_delay=0, event_repository=event_repository)
+    return EventService(event_repository, user_repository)
+
+def test_create_events_keeps_the_valid_drafts(tmp_path, monkeypatch):
+    service = make_service(tmp_path, monkeypatch)
+
+    results = service.create_events([("a", ""), ("b", "", "2025-13-01", ""), ("c", "", "2025-10-12", "Huế")])
+
+    assert [result.title for result in (results[0], results[2])] == ["a", "c"]
+    assert isinstance(results[1], ValueError)
+    assert sorted(event.title for event in service.get_events()) == ["a", "c"]
+
+def test_assign_user_to_events_holds_the_lock_for_the_whole_batch(tmp_path, monkeypatch):
+    service = make_service(tmp_path, monkeypatch)
+    service.user_repository.create_user("bob", "x", "user")
+    event = service.create_event("a")
+    repository = service.event_repository
+    original_get_event = repository.get_event
+    concurrent_edit_done = threading.Event()
+
+    def edit_title():
+        repository.update_event(type(event)(event.id, "renamed", "", list(event.assigned_users)))
+        concurrent_edit_done.set()
+
+    def get_event(event_id):
+        # A writer that starts between the batch's read and its write must wait for it
+        found = original_get_event(event_id)
+        threading.Thread(target=edit_title).start()
+        assert not concurrent_edit_done.wait(0.1)
+        return found
+
+    repository.get_event = get_event
+    service.assign_user_to_events("bob", [event.id])
+    assert concurrent_edit_done.wait(1)
+
+    saved = original_get_event(event.id)
+    assert saved.title == "renamed"
+
+def test_bulk_update_saves_the_valid_edits_and_reports_the_rest(tmp_path, monkeypatch):
+    service = make_service(tmp_path, monkeypatch)
+    first, second = service.create_event("a"), service.create_event("b")
+    edits = [
+        Event(first.id, "a2", "", [], "2025-10-12"),
+        Event(second.id, "b2", "", [], "12/10/2025"),
+        Event("missing", "c", "", []),
+    ]
+
+    results = service.bulk_update(edits)
+
+    assert results[first.id].date == "2025-10-12"
+    assert isinstance(results[second.id], ValueError)
+    assert results["missing"] is None
+    # The rejected edit is neither saved nor normalized in place
+    assert service.event_repository.get_event(second.id).title == "b"
+    assert edits[1].date == "12/10/2025"
+    events, _ = service.search_events("a2")
+    assert [event.id for event in events] == [first.id]
@@ -0,0 +1,76 @@
+from src.model.event import Event
+from src.repository.event_repository import EventRepository
+from src.repository.event_store import EventStore, decode_event, encode_event
+
+def test_events_read_from_the_snapshot_do_not_share_assignees(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repository = EventRepository(flush_delay=0)
+    event = repository.create_event("a")
+    repository.assign_users_to_event(event.id, ["bob"])
+    # Folds the journal in, so the event is read back from the snapshot
+    repository.compact()
+    repository.close()
+
+    repository = EventRepository(flush_delay=0)
+    assert repository.store.has_current_snapshot()
+    repository.get_event(event.id).assigned_users.append("eve")
+
+    assert repository.get_event(event.id).assigned_users == ["bob"]
+    assert repository.get_user_event_ids("eve") == []
+    repository.close()
+
+def write_store(tmp_path, events):
+    store = EventStore(str(tmp_path / "events.jsonl"), str(tmp_path / "events.idx"), snapshot_file=None)
+    store.write((event.id, encode_event(event), event.assigned_users) for event in events)
+    store.close()
+    return store
+
+def read_all(store):
+    offsets, assignees = store.open()
+    events = {event_id: decode_event(store.read(*slot)) for event_id, slot in offsets.items()}
+    return events, assignees
+
+def test_store_opens_from_its_offset_index(tmp_path):
+    store = write_store(tmp_path, [Event("1", "Hội chợ", "", ["bob"]), Event("2", "b", "", [])])
+
+    events, assignees = read_all(store)
+
+    assert [event.title for event in events.values()] == ["Hội chợ", "b"]
+    assert assignees == {"1": ["bob"]}
+    store.close()
+
+def test_a_torn_last_line_is_dropped_and_the_index_rebuilt(tmp_path):
+    store = write_store(tmp_path, [Event("1", "a", "", []), Event("2", "b", "", [])])
+    with open(store.data_file, "ab") as f:
+        f.write(b'{"id": "3", "title": "ha')
+
+    events, _ = read_all(store)
+
+    assert list(events) == ["1", "2"]
+    store.close()
+
+def test_a_stale_index_is_rebuilt_from_the_data_file(tmp_path):
+    store = write_store(tmp_path, [Event("1", "a", "", [])])
+    with open(store.data_file, "ab") as f:
+        f.write(encode_event(Event("2", "added by hand", "", ["eve"])) + b"\n")
+
+    events, assignees = read_all(store)
+
+    assert events["2"].title == "added by hand"
+    assert assignees == {"2": ["eve"]}
+    store.close()
+    # The rebuilt index is written back and matches the file now
+    assert EventStore(store.data_file, store.index_file, snapshot_file=None).open()[0].keys() == {"1", "2"}
+
+def test_events_are_decoded_on_access(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repository = EventRepository(flush_delay=0)
+    for title in ("a", "b", "c"):
+        repository.create_event(title)
+    repository.compact()
+    repository.close()
+
+    repository = EventRepository(flush_delay=0)
+    assert not any(isinstance(slot, Event) for slot in repository.events.slots.values())
+    assert repository.get_event("2").title == "b"
+    repository.close()
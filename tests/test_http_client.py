@@ -0,0 +1,137 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+import pytest
+import requests
+from src.service import http_client
+from src.service.http_client import HttpClient
+from src.service.scrape_cache import ScrapeCache
+from src.service.web_crawler import WebCrawler
+from src.service.web_sources import WebSource
+
+PAGE = (
+    '<html><body><div class="event-item"><h2>Hội thảo công nghệ</h2>'
+    '<span class="date">12/10/2025</span><span class="location">TP.HCM</span></div></body></html>'
+).encode('utf-8')
+ETAG = '"page-v1"'
+
+class StandIn:
+    """Local HTTP server playing the event portal; `statuses` are served first, then 200s"""
+
+    def __init__(self, statuses=(), delay: float = 0):
+        self.statuses = list(statuses)
+        self.delay = delay
+        # (client port, request headers) of every request
+        self.requests = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so a pooled client can reuse the connection
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                stand_in.requests.append((self.client_address[1], dict(self.headers)))
+                if stand_in.delay:
+                    time.sleep(stand_in.delay)
+                status = stand_in.statuses.pop(0) if stand_in.statuses else 200
+                if status == 200 and self.headers.get('If-None-Match') == ETAG:
+                    status = 304
+                body = PAGE if status == 200 else b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                if status in (200, 304):
+                    self.send_header('ETag', ETAG)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(*args, **kwargs) -> StandIn:
+        servers.append(StandIn(*args, **kwargs))
+        return servers[-1]
+    yield start
+    for server in servers:
+        server.close()
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    # Backoff delays the client asked for, without waiting them out
+    delays = []
+    monkeypatch.setattr(http_client, 'time', SimpleNamespace(sleep=delays.append))
+    return delays
+
+def test_connections_are_reused(serve):
+    server = serve()
+    client = HttpClient()
+    try:
+        for _ in range(3):
+            assert client.get(server.url).content == PAGE
+    finally:
+        client.close()
+    assert len({port for port, _ in server.requests}) == 1
+
+def test_server_errors_are_retried_with_backoff(serve, sleeps):
+    server = serve(statuses=[503, 500])
+    client = HttpClient(max_retries=3, backoff_base=0.5, backoff_max=8)
+    try:
+        response = client.get(server.url)
+    finally:
+        client.close()
+    assert response.status_code == 200
+    assert len(server.requests) == 3
+    assert len(sleeps) == 2
+    # Full jitter under an exponential cap: base * 2^attempt
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+
+def test_the_last_error_response_is_returned_once_retries_run_out(serve, sleeps):
+    server = serve(statuses=[502, 502, 502])
+    client = HttpClient(max_retries=2)
+    try:
+        assert client.get(server.url).status_code == 502
+    finally:
+        client.close()
+    assert len(server.requests) == 3
+
+def test_a_slow_server_times_out(serve, sleeps):
+    server = serve(delay=1.0)
+    client = HttpClient(read_timeout=0.2, max_retries=1)
+    try:
+        with pytest.raises(requests.Timeout):
+            client.get(server.url)
+    finally:
+        client.close()
+    assert len(server.requests) == 2
+    assert len(sleeps) == 1
+
+def test_unchanged_pages_are_revalidated_with_etag(serve, tmp_path):
+    server = serve()
+    source = WebSource(name="stand-in", url_template=server.url)
+    client = HttpClient()
+    # ttl=0: every crawl revalidates instead of trusting the cache
+    crawler = WebCrawler(client, ScrapeCache(str(tmp_path / "cache.json"), ttl=0))
+    try:
+        first, = crawler.crawl([source])
+        second, = crawler.crawl([source])
+    finally:
+        client.close()
+
+    assert not first.from_cache and first.events[0]['title'] == "Hội thảo công nghệ"
+    assert 'If-None-Match' not in server.requests[0][1]
+    assert server.requests[1][1].get('If-None-Match') == ETAG
+    assert second.from_cache and second.events == first.events
@@ -0,0 +1,25 @@
+from src.repository.event_repository import EventRepository
+from src.repository.id_allocator import IdAllocator
+
+def test_ids_stay_consecutive_across_restarts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repository = EventRepository(flush_delay=0)
+    assert repository.create_event("a").id == "1"
+    repository.close()
+
+    repository = EventRepository(flush_delay=0)
+    assert repository.create_event("b").id == "2"
+    repository.close()
+
+def test_release_keeps_a_block_another_process_reserved_past(tmp_path):
+    counter_file = str(tmp_path / "events.seq")
+    first = IdAllocator(counter_file, block_size=20)
+    second = IdAllocator(counter_file, block_size=20)
+    assert first.allocate() == "1"
+    assert second.allocate() == "21"
+
+    first.release()
+    second.release()
+
+    # 2-20 stay a gap, the rest of the later block is given back
+    assert IdAllocator(counter_file).allocate() == "22"
@@ -0,0 +1,40 @@
+import pytest
+from src.model.event import Event
+from src.model.symbol_table import USERNAMES, SymbolTable
+from src.model.user import User
+
+def test_symbol_table_maps_names_both_ways():
+    table = SymbolTable()
+
+    first = table.id_of("bob")
+    assert table.id_of("".join(["b", "o", "b"])) == first
+    assert table.id_of("eve") != first
+    assert table.name_of(first) == "bob" and len(table) == 2
+
+def test_event_assignees_are_stored_as_symbols():
+    event = Event("1", "a", "", ["bob", "eve"])
+
+    assert event.assigned_users == ["bob", "eve"]
+    assert [USERNAMES.name_of(symbol) for symbol in event.assigned_ids] == ["bob", "eve"]
+    # Nobody assigned costs no array
+    assert Event("2", "b", "", []).assigned_ids == ()
+    # The returned list is a copy
+    event.assigned_users.append("mallory")
+    assert event.assigned_users == ["bob", "eve"]
+
+def test_models_are_slotted_and_compare_by_value():
+    event = Event("1", "a", "", ["bob"], "2025-10-12", "Huế")
+    user = User("bob", "hash", "user", ["1"])
+
+    with pytest.raises(AttributeError):
+        event.extra = 1
+    with pytest.raises(AttributeError):
+        user.extra = 1
+    assert event == Event.from_dict("1", event.to_dict())
+    assert user == User.from_dict("bob", user.to_dict())
+    assert event != Event("1", "a", "", ["eve"], "2025-10-12", "Huế")
+
+def test_usernames_are_interned():
+    name = "".join(["ali", "ce"])
+
+    assert User(name, "x", "user", []).username is User("alice", "y", "user", []).username
@@ -0,0 +1,64 @@
+import pytest
+from src.repository.event_repository import EventRepository
+from src.repository.pagination import OrderedIndex, decode_cursor, encode_cursor, paginate
+
+def entries(count: int):
+    return [((i,), f"e{i}") for i in range(count)]
+
+def test_cursors_walk_forward_and_back():
+    items = entries(7)
+
+    first, next_cursor, prev_cursor = paginate(items, 3)
+    assert (first, prev_cursor) == (["e0", "e1", "e2"], None)
+    second, next_cursor, prev_cursor = paginate(items, 3, next_cursor)
+    assert second == ["e3", "e4", "e5"]
+    third, last_next, third_prev = paginate(items, 3, next_cursor)
+    assert (third, last_next) == (["e6"], None)
+
+    assert paginate(items, 3, third_prev)[0] == second
+    assert paginate(items, 3, prev_cursor)[0] == first
+
+def test_descending_pages_walk_from_the_end():
+    items = entries(5)
+
+    first, next_cursor, prev_cursor = paginate(items, 2, descending=True)
+    assert (first, prev_cursor) == (["e4", "e3"], None)
+    second, next_cursor, prev_cursor = paginate(items, 2, next_cursor, descending=True)
+    assert second == ["e2", "e1"]
+    assert paginate(items, 2, next_cursor, descending=True)[:2] == (["e0"], None)
+    assert paginate(items, 2, prev_cursor, descending=True)[0] == first
+
+def test_pages_stay_put_when_the_boundary_entry_is_removed():
+    index = OrderedIndex((f"e{i}", (i,)) for i in range(6))
+    _, next_cursor, _ = paginate(index.entries, 3)
+
+    index.remove("e2")
+    index.add("e10", (-1,))
+
+    assert paginate(index.entries, 3, next_cursor)[0] == ["e3", "e4", "e5"]
+
+def test_foreign_cursors_are_rejected():
+    assert decode_cursor(encode_cursor('after', ((1, 'x'), "e1"))) == ('after', ((1, 'x'), "e1"))
+    for cursor in ("garbage", encode_cursor('sideways', ((1,), "e1"))):
+        with pytest.raises(ValueError):
+            paginate(entries(3), 2, cursor)
+    # A cursor from an ordering whose keys do not compare with these
+    with pytest.raises(ValueError):
+        paginate(entries(3), 2, encode_cursor('after', (("text",), "e1")))
+
+def test_repository_pages_in_numeric_id_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repository = EventRepository(flush_delay=0)
+    ids = [repository.create_event(str(i)).id for i in range(12)]
+    for event_id in ids[::3]:
+        repository.assign_users_to_event(event_id, ["bob"])
+
+    first = repository.get_events_page(limit=5)
+    second = repository.get_events_page(limit=5, cursor=first.next_cursor)
+    assert [event.id for event in first.events + second.events] == ids[:10]
+    assert [event.id for event in repository.get_events_page(limit=5, cursor=second.prev_cursor).events] == ids[:5]
+
+    mine = repository.get_events_page(limit=2, username="bob")
+    rest = repository.get_events_page(limit=2, cursor=mine.next_cursor, username="bob")
+    assert [event.id for event in mine.events + rest.events] == ids[::3]
+    assert rest.next_cursor is None
@@ -0,0 +1,97 @@
+import time
+import requests
+from src.service.scrape_cache import ScrapeCache
+from src.service.web_crawler import WebCrawler
+from src.service.web_sources import WebSource
+
+URL = "https://portal.example/events/"
+EVENTS = [{'title': "Hội thảo", 'date': None, 'location': None, 'description': None}]
+
+def test_validators_are_sent_back_and_survive_a_reload(tmp_path):
+    cache = ScrapeCache(str(tmp_path / "cache.json"), ttl=60)
+    assert cache.conditional_headers(URL) == {}
+
+    cache.store(URL, {'ETag': '"v1"', 'Last-Modified': "Sun, 12 Oct 2025 10:00:00 GMT"}, EVENTS)
+    cache.save()
+
+    reloaded = ScrapeCache(str(tmp_path / "cache.json"), ttl=60)
+    assert reloaded.conditional_headers(URL) == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': "Sun, 12 Oct 2025 10:00:00 GMT"
+    }
+    assert reloaded.get(URL)['events'] == EVENTS
+
+def test_a_304_renews_the_entry_and_keeps_its_events(tmp_path):
+    cache = ScrapeCache(str(tmp_path / "cache.json"), ttl=60)
+    cache.store(URL, {'ETag': '"v1"'}, EVENTS)
+    later = time.time() + 120
+    assert not cache.is_fresh(URL, now=later)
+
+    cache.entries[URL]['fetched_at'] -= 120
+    cache.touch(URL)
+
+    assert cache.is_fresh(URL)
+    assert cache.get(URL)['events'] == EVENTS
+    assert cache.conditional_headers(URL) == {'If-None-Match': '"v1"'}
+
+class Response:
+    def __init__(self, status_code: int, body: bytes = b'', headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = 'utf-8'
+        self.body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size=None, decode_unicode=False):
+        yield self.body.decode('utf-8') if decode_unicode else self.body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+class Portal:
+    """Plays HttpClient: answers with the queued responses and records the request headers"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, stream=False):
+        self.requests.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+PAGE = '<div class="event-item"><h2>Hội thảo</h2></div>'.encode('utf-8')
+
+def crawl_once(crawler):
+    result, = crawler.crawl([WebSource(name="portal", url_template=URL)])
+    return result
+
+def test_fresh_pages_are_not_requested_and_stale_ones_are_revalidated(tmp_path):
+    cache = ScrapeCache(str(tmp_path / "cache.json"), ttl=60)
+    portal = Portal(Response(200, PAGE, {'ETag': '"v1"'}), Response(304))
+    crawler = WebCrawler(portal, cache)
+
+    first = crawl_once(crawler)
+    second = crawl_once(crawler)
+    assert len(portal.requests) == 1
+    assert second.from_cache and second.events == first.events
+
+    cache.entries[URL]['fetched_at'] -= 120
+    third = crawl_once(crawler)
+    assert portal.requests[1] == {'If-None-Match': '"v1"'}
+    assert third.from_cache and third.events == first.events and third.error is None
+
+def test_an_unreachable_page_serves_the_last_good_copy(tmp_path):
+    cache = ScrapeCache(str(tmp_path / "cache.json"), ttl=0)
+    crawler = WebCrawler(Portal(Response(200, PAGE), Response(503)), cache)
+
+    first = crawl_once(crawler)
+    second = crawl_once(crawler)
+
+    assert second.from_cache and second.events == first.events
+    assert isinstance(second.error, requests.HTTPError)
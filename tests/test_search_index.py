@@ -0,0 +1,44 @@
+from src.service.search_index import TrigramIndex, normalize_text
+
+def make_index() -> TrigramIndex:
+    index = TrigramIndex()
+    for event_id, title in [
+        ("1", "Triển lãm tranh Đà Lạt"),
+        ("2", "Đêm nhạc Trịnh"),
+        ("3", "Hội chợ sách"),
+        ("4", "Chợ đêm Đà Nẵng"),
+    ]:
+        index.add(event_id, title)
+    return index
+
+def test_normalize_text_folds_case_and_diacritics():
+    assert normalize_text("  Triển   LÃM Đà ") == "trien lam da"
+
+def test_search_ignores_diacritics_and_ranks_prefix_matches_first():
+    index = make_index()
+
+    assert index.search("trien lam") == (["1"], 1)
+    assert index.search("ĐÀ") == (["4", "1"], 2)
+    # Prefix, then word start, then anywhere
+    assert index.search("dem") == (["2", "4"], 2)
+    assert index.search("cho") == (["4", "3"], 2)
+    assert index.search("xyz") == ([], 0)
+
+def test_search_pages_and_restricts():
+    index = make_index()
+
+    assert index.search("da", limit=1) == (["4"], 2)
+    assert index.search("da", limit=1, offset=1) == (["1"], 2)
+    assert index.search("da", allowed_ids={"4"}) == (["4"], 1)
+    assert index.search("") == (["1", "2", "3", "4"], 4)
+
+def test_edits_and_removals_update_the_index():
+    index = make_index()
+
+    index.add("3", "Hội thảo công nghệ")
+    index.remove("2")
+
+    assert index.search("sach") == ([], 0)
+    assert index.search("hoi thao") == (["3"], 1)
+    assert index.search("dem") == (["4"], 1)
+    assert len(index) == 3
@@ -0,0 +1,68 @@
+from src.model.event import Event
+from src.repository.event_repository import EventRepository
+from src.repository.sqlite_database import SQLiteDatabase, migrate_from_json
+from src.repository.sqlite_event_repository import SQLiteEventRepository
+from src.repository.sqlite_user_repository import SQLiteUserRepository
+from src.repository.user_repository import UserRepository
+
+def open_repositories(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "events.db"))
+    return database, SQLiteEventRepository(database), SQLiteUserRepository(database)
+
+def test_events_and_assignments_survive_a_reopen(tmp_path):
+    database, events, users = open_repositories(tmp_path)
+    users.create_user("bob", "x")
+    event = events.create_event("Hội chợ", "sách", "2025-10-12", "Huế")
+    events.assign_users_to_event(event.id, ["bob"])
+    events.close()
+    database.close()
+
+    database, events, users = open_repositories(tmp_path)
+    stored = events.get_event(event.id)
+    assert (stored.title, stored.date, stored.location, stored.assigned_users) == ("Hội chợ", "2025-10-12", "Huế", ["bob"])
+    assert users.get_user("bob").assigned_events == [event.id]
+    assert len(events.get_all_events()) == 1
+    database.close()
+
+def test_deleting_a_user_unassigns_it(tmp_path):
+    database, events, users = open_repositories(tmp_path)
+    users.create_user("bob", "x")
+    event = events.create_event("a")
+    events.assign_users_to_event(event.id, ["bob"])
+
+    assert users.delete_user("bob")
+
+    assert events.get_event(event.id).assigned_users == []
+    assert events.get_user_event_ids("bob") == []
+    database.close()
+
+def test_pages_follow_numeric_id_order(tmp_path):
+    database, events, _ = open_repositories(tmp_path)
+    events.update_events([Event(event_id, event_id, "", []) for event_id in ("10", "9", "2", "x", "1")])
+
+    first = events.get_events_page(limit=3)
+    second = events.get_events_page(limit=3, cursor=first.next_cursor)
+    back = events.get_events_page(limit=3, cursor=second.prev_cursor)
+
+    assert [event.id for event in first.events] == ["1", "2", "9"]
+    assert ([event.id for event in second.events], second.next_cursor) == (["10", "x"], None)
+    assert [event.id for event in back.events] == ["1", "2", "9"]
+    database.close()
+
+def test_json_data_is_migrated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    json_events = EventRepository(flush_delay=0)
+    json_users = UserRepository(flush_delay=0, event_repository=json_events)
+    json_users.create_user("bob", "x")
+    event = json_events.create_event("a", date="2025-10-12")
+    json_events.assign_users_to_event(event.id, ["bob"])
+    database, events, users = open_repositories(tmp_path)
+    assert database.is_empty()
+
+    migrate_from_json(database, json_events, json_users)
+
+    assert events.get_event(event.id).assigned_users == ["bob"]
+    assert users.user_exists("bob")
+    # Ids go on from the migrated ones
+    assert int(events.create_event("b").id) > int(event.id)
+    database.close()
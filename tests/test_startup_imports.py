@@ -0,0 +1,39 @@
+import json
+import os
+import subprocess
+import sys
+from benchmarks.bench_startup import DEFERRED_MODULES
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def loaded_modules(code: str):
+    """Modules imported by running `code` in a fresh interpreter"""
+    completed = subprocess.run(
+        [sys.executable, "-c", code + "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    return set(json.loads(completed.stdout.splitlines()[-1]))
+
+def test_startup_leaves_the_deferred_modules_alone():
+    modules = loaded_modules("import src.main")
+
+    assert [name for name in DEFERRED_MODULES if name in modules] == []
+
+def test_the_scraping_stack_is_imported_on_the_first_scrape(tmp_path):
+    code = (
+        "import os\n"
+        "from src.repository.event_repository import EventRepository\n"
+        "from src.repository.user_repository import UserRepository\n"
+        "from src.service.event_service import EventService\n"
+        # The repositories write to the working directory
+        f"os.chdir({str(tmp_path)!r})\n"
+        "events = EventRepository(flush_delay=0)\n"
+        "service = EventService(events, UserRepository(flush_delay=0, event_repository=events))\n"
+        "assert 'requests' not in __import__('sys').modules\n"
+        "service.get_web_crawler()\n"
+    )
+
+    assert "requests" in loaded_modules(code)
@@ -0,0 +1,35 @@
+from src.service.event_extractor import iter_extract_events
+from src.service.web_crawler import iter_text
+
+class Body:
+    def __init__(self, chunks, content_type='text/html'):
+        self.chunks = chunks
+        self.headers = {'Content-Type': content_type}
+        self.encoding = 'ISO-8859-1'
+
+    def iter_content(self, chunk_size=None):
+        return iter(self.chunks)
+
+def test_multibyte_characters_split_across_chunks_are_decoded():
+    data = "Hội thảo Đà Nẵng".encode('utf-8')
+    chunks = [data[i:i + 3] for i in range(0, len(data), 3)]
+
+    # No charset given: the page is read as UTF-8, not requests' ISO-8859-1 guess
+    assert ''.join(iter_text(Body(chunks))) == "Hội thảo Đà Nẵng"
+
+def test_events_are_yielded_before_the_page_has_arrived():
+    sent = []
+
+    def chunks():
+        for i in range(3):
+            chunk = f'<div class="event-item"><h2>Sự kiện số {i}</h2></div>'
+            sent.append(chunk)
+            yield chunk
+        sent.append('</body>')
+        yield '</body>'
+
+    events = iter_extract_events(chunks())
+
+    assert next(events)['title'] == "Sự kiện số 0"
+    assert len(sent) < 4
+    assert [event['title'] for event in events] == ["Sự kiện số 1", "Sự kiện số 2"]
@@ -0,0 +1,32 @@
+from src.repository.event_repository import EventRepository
+from src.repository.user_repository import UserRepository
+
+def test_user_index_follows_assignments(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repository = EventRepository(flush_delay=0)
+    ids = [repository.create_event(title).id for title in ("a", "b", "c")]
+    repository.assign_users_to_event(ids[2], ["bob", "eve"])
+    repository.assign_users_to_event(ids[0], ["bob"])
+
+    assert repository.get_user_event_ids("bob") == [ids[0], ids[2]]
+
+    repository.assign_users_to_event(ids[2], ["eve"])
+    repository.delete_event(ids[0])
+    assert repository.get_user_event_ids("bob") == []
+    assert list(repository.get_user_events("eve")) == [ids[2]]
+
+def test_user_index_is_rebuilt_on_load(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repository = EventRepository(flush_delay=0)
+    event = repository.create_event("a")
+    repository.assign_users_to_event(event.id, ["bob"])
+    repository.close()
+
+    repository = EventRepository(flush_delay=0)
+    users = UserRepository(flush_delay=0, event_repository=repository)
+    users.create_user("bob", "x")
+
+    assert repository.get_user_event_ids("bob") == [event.id]
+    assert users.get_user("bob").assigned_events == [event.id]
+    users.delete_user("bob")
+    assert repository.get_event(event.id).assigned_users == []
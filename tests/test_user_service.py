@@ -0,0 +1,25 @@
+import threading
+from src.repository.user_repository import UserRepository
+from src.service.user_service import UserService
+
+class SlowHasher:
+    """Holds every hash until all registrations have checked the name"""
+
+    def __init__(self, parties: int):
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def hash(self, password: str) -> str:
+        self.barrier.wait()
+        return "hashed:" + password
+
+def test_concurrent_registrations_of_one_name_create_it_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = UserService(UserRepository(flush_delay=0), password_hasher=SlowHasher(2))
+
+    first = service.register_user_async("alice", "first")
+    second = service.register_user_async("alice", "second")
+    results = [first.result(timeout=5), second.result(timeout=5)]
+
+    created = [user for user in results if user is not None]
+    assert len(created) == 1
+    assert service.get_user("alice").password == created[0].password
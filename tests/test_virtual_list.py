@@ -0,0 +1,78 @@
+import pytest
+
+ctk = pytest.importorskip("customtkinter")
+import tkinter
+from src.ui.virtual_list import VirtualList
+
+ROW_HEIGHT = 20
+
+@pytest.fixture
+def root():
+    try:
+        window = ctk.CTk()
+    except tkinter.TclError as e:
+        pytest.skip(f"needs a display: {e}")
+    window.geometry("300x200")
+    yield window
+    window.destroy()
+
+class Row:
+    def __init__(self, parent):
+        self.frame = ctk.CTkFrame(parent, height=ROW_HEIGHT)
+        self.item = None
+
+def make_list(root, binds):
+    def bind_row(row, item):
+        row.item = item
+        binds.append(item)
+
+    virtual_list = VirtualList(root, ROW_HEIGHT, Row, bind_row, item_key=lambda item: item["id"], overscan=2)
+    virtual_list.pack(fill="both", expand=True)
+    root.update()
+    return virtual_list
+
+def shown(virtual_list):
+    return sorted(row.item["id"] for row in virtual_list.rows if row.frame.winfo_ismapped())
+
+def test_only_the_rows_in_view_are_built(root):
+    binds = []
+    virtual_list = make_list(root, binds)
+
+    virtual_list.set_items([{"id": i} for i in range(10000)])
+    root.update()
+
+    pool = len(virtual_list.rows)
+    assert pool <= virtual_list.visible_height() // ROW_HEIGHT + 2 + 2 * virtual_list.overscan
+    assert len(binds) <= pool
+    assert shown(virtual_list)[0] == 0
+
+def test_scrolling_rebinds_only_the_rows_that_wrapped(root):
+    binds = []
+    virtual_list = make_list(root, binds)
+    virtual_list.set_items([{"id": i} for i in range(10000)])
+    root.update()
+    binds.clear()
+
+    # The overscan rows above the view are kept until one more row scrolls by
+    virtual_list.yview("scroll", virtual_list.overscan + 1, "units")
+
+    assert [item["id"] for item in binds] == [len(virtual_list.rows)]
+    virtual_list.scroll_to_item(5000)
+    root.update()
+    assert 5000 in shown(virtual_list)
+
+def test_single_items_change_without_rebinding_the_others(root):
+    binds = []
+    virtual_list = make_list(root, binds)
+    items = [{"id": i} for i in range(100)]
+    virtual_list.set_items(items)
+    root.update()
+    binds.clear()
+
+    virtual_list.update_item({"id": 1, "title": "edited"})
+    assert binds == [{"id": 1, "title": "edited"}]
+
+    assert virtual_list.remove_item(0)
+    virtual_list.insert_item({"id": "new"}, 0)
+    assert virtual_list.index_of("new") == 0 and virtual_list.index_of(0) == -1
+    assert len(virtual_list.items) == 100
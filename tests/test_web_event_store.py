@@ -0,0 +1,60 @@
+from src.service.web_event_store import TOMBSTONE_TTL, WebEventStore, web_event_id
+
+def web_event(title: str, description: str = "", source: str = "site") -> dict:
+    return {
+        'id': web_event_id(title, "2025-10-12", "Huế"),
+        'title': title,
+        'description': description,
+        'date': "2025-10-12",
+        'location': "Huế",
+        'source': source
+    }
+
+def test_ids_ignore_case_and_spacing():
+    assert web_event_id("Hội chợ  Sách", "2025-10-12", "Huế") == web_event_id("hội chợ sách", "2025-10-12", " huế")
+    assert web_event_id("Hội chợ sách", "2025-10-12", "Huế") != web_event_id("Hội chợ sách", "2025-10-13", "Huế")
+
+def test_merge_reports_a_revision_only_when_something_changed(tmp_path):
+    store = WebEventStore(str(tmp_path / "web_events.json"))
+    a, b = web_event("Concert A"), web_event("Concert B")
+
+    first = store.merge([a, b], {"site"}, now=0)
+    assert (first.revision, first.added) == (1, [a['id'], b['id']])
+
+    assert not store.merge([a, b], {"site"}, now=1)
+    assert store.revision == 1
+
+    changed = store.merge([web_event("Concert A", "moved indoors"), b], {"site"}, now=2)
+    assert (changed.revision, changed.changed, changed.added) == (2, [a['id']], [])
+    assert [entry['id'] for entry in store.changed_since(1)] == [a['id']]
+
+    reloaded = WebEventStore(str(tmp_path / "web_events.json"))
+    assert reloaded.revision == 2
+    assert reloaded.last_delta.changed == [a['id']]
+
+def test_missing_events_become_tombstones_that_expire(tmp_path):
+    store = WebEventStore(str(tmp_path / "web_events.json"))
+    a, b = web_event("Concert A"), web_event("Concert B")
+    store.merge([a, b], {"site"}, now=0)
+
+    delta = store.merge([a], {"site"}, now=10)
+    assert delta.removed == [b['id']]
+    assert [entry['id'] for entry in store.live_events()] == [a['id']]
+    assert store.events[b['id']]['removed_at'] == 10
+
+    # Listed again: added back in place of the tombstone
+    assert store.merge([a, b], {"site"}, now=20).added == [b['id']]
+
+    store.merge([a], {"site"}, now=30)
+    store.merge([a], {"site"}, now=30 + TOMBSTONE_TTL)
+    assert b['id'] not in WebEventStore(str(tmp_path / "web_events.json")).events
+
+def test_events_of_a_partly_read_source_are_kept(tmp_path):
+    store = WebEventStore(str(tmp_path / "web_events.json"))
+    a, other = web_event("Concert A"), web_event("Expo", source="other")
+    store.merge([a, other], {"site", "other"}, now=0)
+
+    delta = store.merge([a], {"site"}, now=10)
+
+    assert not delta
+    assert [entry['id'] for entry in store.live_events()] == [a['id'], other['id']]
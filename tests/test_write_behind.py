@@ -0,0 +1,58 @@
+import json
+import pytest
+from src.repository.user_repository import UserRepository
+from src.repository.write_behind import WriteBehind
+
+def test_changes_are_flushed_once_after_the_delay():
+    flushes = []
+    writer = WriteBehind(lambda: flushes.append(1), delay=60)
+
+    for _ in range(3):
+        writer.mark_dirty()
+    assert flushes == [] and writer.dirty
+
+    writer.flush()
+    writer.flush()
+    assert flushes == [1] and not writer.dirty
+
+def test_too_many_pending_changes_flush_right_away():
+    flushes = []
+    writer = WriteBehind(lambda: flushes.append(1), delay=60, max_pending=3)
+
+    for _ in range(7):
+        writer.mark_dirty()
+
+    assert flushes == [1, 1]
+    writer.flush()
+    assert flushes == [1, 1, 1]
+
+def test_a_batch_counts_once_even_when_it_fails():
+    flushes = []
+    writer = WriteBehind(lambda: flushes.append(1), delay=0)
+
+    with writer.batch():
+        writer.mark_dirty()
+        with writer.batch():
+            writer.mark_dirty()
+        assert flushes == []
+    assert flushes == [1]
+
+    with pytest.raises(RuntimeError):
+        with writer.batch():
+            writer.mark_dirty()
+            raise RuntimeError("half way")
+    assert flushes == [1, 1]
+
+def test_repository_writes_are_deferred_until_flushed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repository = UserRepository(flush_delay=60)
+    repository.flush()
+
+    repository.create_user("alice", "x")
+    repository.create_user("bob", "y")
+    with open("users.json", encoding="utf-8") as f:
+        assert json.load(f) == {}
+
+    repository.close()
+    with open("users.json", encoding="utf-8") as f:
+        assert sorted(json.load(f)) == ["alice", "bob"]